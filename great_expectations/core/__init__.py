@@ -875,12 +875,13 @@ class ExpectationConfiguration(DictDot):
         },
         "expect_column_unique_value_count_to_be_between": {
             "domain_kwargs": ["column", "row_condition", "condition_parser"],
-            "success_kwargs": ["min_value", "max_value"],
+            "success_kwargs": ["min_value", "max_value", "allow_relative_error"],
             "default_kwarg_values": {
                 "row_condition": None,
                 "condition_parser": "pandas",
                 "min_value": None,
                 "max_value": None,
+                "allow_relative_error": False,
                 "result_format": "BASIC",
                 "include_config": True,
                 "catch_exceptions": False,
@@ -888,7 +889,13 @@ class ExpectationConfiguration(DictDot):
         },
         "expect_column_proportion_of_unique_values_to_be_between": {
             "domain_kwargs": ["column", "row_condition", "condition_parser"],
-            "success_kwargs": ["min_value", "max_value", "strict_min", "strict_max"],
+            "success_kwargs": [
+                "min_value",
+                "max_value",
+                "strict_min",
+                "strict_max",
+                "allow_relative_error",
+            ],
             "default_kwarg_values": {
                 "row_condition": None,
                 "condition_parser": "pandas",
@@ -896,6 +903,7 @@ class ExpectationConfiguration(DictDot):
                 "max_value": None,
                 "strict_min": False,
                 "strict_max": False,
+                "allow_relative_error": False,
                 "result_format": "BASIC",
                 "include_config": True,
                 "catch_exceptions": False,
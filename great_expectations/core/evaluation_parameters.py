@@ -1,4 +1,3 @@
-import copy
 import logging
 import math
 import operator
@@ -171,7 +170,9 @@ def build_evaluation_parameters(
     AND mutate expectation_args by removing any parameter values passed in as temporary values during
     exploratory work.
     """
-    evaluation_args = copy.deepcopy(expectation_args)
+    # Only top-level values are replaced below, so a shallow copy is enough; deep-copying would copy every value,
+    # including large value sets, for each expectation that is evaluated
+    evaluation_args = dict(expectation_args)
     substituted_parameters = dict()
 
     # Iterate over arguments, and replace $PARAMETER-defined args with their
@@ -185,10 +186,12 @@ def build_evaluation_parameters(
             # First, check to see whether an argument was supplied at runtime
             # If it was, use that one, but remove it from the stored config
             if "$PARAMETER." + value["$PARAMETER"] in value:
-                evaluation_args[key] = evaluation_args[key][
-                    "$PARAMETER." + value["$PARAMETER"]
-                ]
-                del expectation_args[key]["$PARAMETER." + value["$PARAMETER"]]
+                runtime_key = "$PARAMETER." + value["$PARAMETER"]
+                evaluation_args[key] = value[runtime_key]
+                # Replace rather than modify the parameter dict, which may be shared with an expectation suite
+                expectation_args[key] = {
+                    k: v for k, v in value.items() if k != runtime_key
+                }
 
             # If not, try to parse the evaluation parameter and substitute, which will raise
             # an exception if we do not have a value
@@ -4,11 +4,14 @@ import decimal
 import inspect
 import json
 import logging
+import threading
 import traceback
 import uuid
 import warnings
 from collections import Counter, defaultdict, namedtuple
 from collections.abc import Hashable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import wraps
 from typing import List
 
@@ -35,6 +38,13 @@ from great_expectations.marshmallow__shade import ValidationError
 logger = logging.getLogger(__name__)
 logging.captureWarnings(True)
 
+# The state of a single DataAsset.validate call: the data context used to evaluate its expectations, and
+# metrics a backend precomputed for the suite (see DataAsset._prepare_validation)
+_ValidationRun = namedtuple("_ValidationRun", ["data_context", "metrics"])
+
+# Validation runs in progress on the current thread, keyed by the id() of the data asset being validated
+_validation_runs = threading.local()
+
 
 class DataAsset:
 
@@ -83,14 +93,43 @@ class DataAsset:
         self._batch_markers = batch_markers
         self._batch_parameters = batch_parameters
 
-        # This special state variable tracks whether a validation run is going on, which will disable
-        # saving expectation config objects
-        self._active_validation = False
         if profiler is not None:
             profiler.profile(self)
         if data_context and hasattr(data_context, "_expectation_explorer_manager"):
             self.set_default_expectation_argument("include_config", True)
 
+    @property
+    def _active_validation(self):
+        """True while an expectation is evaluated as part of a validate call, which disables saving expectation
+        config objects."""
+        return self._get_active_validation_run() is not None
+
+    def _get_active_validation_run(self):
+        """Return the _ValidationRun of the validate call running on this thread, or None."""
+        return getattr(_validation_runs, "runs", {}).get(id(self))
+
+    @contextmanager
+    def _validation_run_scope(self, validation_run):
+        """Make validation_run the active validation run of this data asset on the current thread."""
+        if not hasattr(_validation_runs, "runs"):
+            _validation_runs.runs = {}
+        previous_validation_run = _validation_runs.runs.get(id(self))
+        _validation_runs.runs[id(self)] = validation_run
+        try:
+            yield validation_run
+        finally:
+            if previous_validation_run is None:
+                del _validation_runs.runs[id(self)]
+            else:
+                _validation_runs.runs[id(self)] = previous_validation_run
+
+    def _get_validation_data_context(self):
+        """Return the data context of the active validation run, falling back to the data asset's own."""
+        validation_run = self._get_active_validation_run()
+        if validation_run is not None:
+            return validation_run.data_context
+        return self._data_context
+
     def list_available_expectation_types(self):
         keys = dir(self)
         return [
@@ -215,11 +254,19 @@ class DataAsset:
                     if "result_format" in all_args:
                         del all_args["result_format"]
 
-                all_args = recursively_convert_to_json_serializable(all_args)
+                active_validation = self._active_validation
+                data_context = self._get_validation_data_context()
+
+                if active_validation:
+                    # validate passes arguments taken from an already serializable suite, and replaces the config
+                    # built here with the one from the suite, so neither the conversion nor the copy is needed
+                    expectation_args = all_args
+                else:
+                    all_args = recursively_convert_to_json_serializable(all_args)
 
-                # Patch in PARAMETER args, and remove locally-supplied arguments
-                # This will become the stored config
-                expectation_args = copy.deepcopy(all_args)
+                    # Patch in PARAMETER args, and remove locally-supplied arguments
+                    # This will become the stored config
+                    expectation_args = copy.deepcopy(all_args)
 
                 if self._expectation_suite.evaluation_parameters:
                     (
@@ -229,7 +276,7 @@ class DataAsset:
                         expectation_args,
                         self._expectation_suite.evaluation_parameters,
                         self._config.get("interactive_evaluation", True),
-                        self._data_context,
+                        data_context,
                     )
                 else:
                     (
@@ -239,7 +286,7 @@ class DataAsset:
                         expectation_args,
                         None,
                         self._config.get("interactive_evaluation", True),
-                        self._data_context,
+                        data_context,
                     )
 
                 # Construct the expectation_config object
@@ -254,7 +301,7 @@ class DataAsset:
                 # Finally, execute the expectation method itself
                 if (
                     self._config.get("interactive_evaluation", True)
-                    or self._active_validation
+                    or active_validation
                 ):
                     try:
                         return_obj = func(self, **evaluation_args)
@@ -281,7 +328,7 @@ class DataAsset:
 
                 # If validate has set active_validation to true, then we do not save the config to avoid
                 # saving updating expectation configs to the same suite during validation runs
-                if self._active_validation is True:
+                if active_validation:
                     stored_config = expectation_config
                 else:
                     # Append the expectation to the config.
@@ -290,7 +337,10 @@ class DataAsset:
                     )
 
                 if include_config:
-                    return_obj.expectation_config = copy.deepcopy(stored_config)
+                    if active_validation:
+                        return_obj.expectation_config = stored_config
+                    else:
+                        return_obj.expectation_config = copy.deepcopy(stored_config)
 
                 # If there was no interactive evaluation, success will not have been computed.
                 if return_obj.success is not None:
@@ -315,8 +365,8 @@ class DataAsset:
 
                 return_obj = recursively_convert_to_json_serializable(return_obj)
 
-                if self._data_context is not None:
-                    return_obj = self._data_context.update_return_obj(self, return_obj)
+                if data_context is not None:
+                    return_obj = data_context.update_return_obj(self, return_obj)
 
                 return return_obj
 
@@ -795,15 +845,11 @@ class DataAsset:
             elif not isinstance(run_id, RunIdentifier):
                 run_id = RunIdentifier(run_name=run_name, run_time=run_time)
 
-            self._active_validation = True
-
-            # If a different validation data context was provided, override
-            validate__data_context = self._data_context
+            # If a different validation data context was provided, it is used inside the expectation decorator
+            # for the duration of this call (see _ValidationRun)
             if data_context is None and self._data_context is not None:
                 data_context = self._data_context
-            elif data_context is not None:
-                # temporarily set self._data_context so it is used inside the expectation decorator
-                self._data_context = data_context
+            validation_run = _ValidationRun(data_context=data_context, metrics={})
 
             results = []
 
@@ -904,67 +950,63 @@ class DataAsset:
                     columns[column] = []
                 columns[column].append(expectation)
 
+            # Copy only the top level of each config, which is all that validation modifies; the values of its kwargs
+            # (such as large value_set lists) are shared with the suite, and expectations never modify them
             expectations_to_evaluate = []
             for col in columns:
-                expectations_to_evaluate.extend(columns[col])
-
-            for expectation in expectations_to_evaluate:
-
-                try:
-                    # copy the config so we can modify it below if needed
-                    expectation = copy.deepcopy(expectation)
-
-                    expectation_method = getattr(self, expectation.expectation_type)
-
+                for expectation in columns[col]:
+                    kwargs = dict(expectation.kwargs)
                     if result_format is not None:
-                        expectation.kwargs.update({"result_format": result_format})
-
-                    # A missing parameter will raise an EvaluationParameterError
-                    (
-                        evaluation_args,
-                        substituted_parameters,
-                    ) = build_evaluation_parameters(
-                        expectation.kwargs,
-                        runtime_evaluation_parameters,
-                        self._config.get("interactive_evaluation", True),
-                        self._data_context,
+                        kwargs["result_format"] = result_format
+                    expectations_to_evaluate.append(
+                        ExpectationConfiguration(
+                            expectation_type=expectation.expectation_type,
+                            kwargs=kwargs,
+                            meta=expectation.meta,
+                            success_on_last_run=expectation.success_on_last_run,
+                        )
                     )
 
-                    result = expectation_method(
-                        catch_exceptions=catch_exceptions,
-                        include_config=True,
-                        **evaluation_args
+            with self._validation_run_scope(validation_run):
+                try:
+                    self._prepare_validation(
+                        expectations_to_evaluate, runtime_evaluation_parameters
                     )
-
-                except Exception as err:
-                    if catch_exceptions:
-                        raised_exception = True
-                        exception_traceback = traceback.format_exc()
-
-                        result = ExpectationValidationResult(
-                            success=False,
-                            exception_info={
-                                "raised_exception": raised_exception,
-                                "exception_traceback": exception_traceback,
-                                "exception_message": str(err),
-                            },
-                        )
-
+                    max_workers = min(
+                        self._get_max_concurrent_expectations(),
+                        len(expectations_to_evaluate),
+                    )
+                    validation_args = (
+                        validation_run,
+                        runtime_evaluation_parameters,
+                        catch_exceptions,
+                    )
+                    if max_workers > 1:
+                        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                            futures = [
+                                executor.submit(
+                                    self._validate_expectation,
+                                    expectation,
+                                    *validation_args
+                                )
+                                for expectation in expectations_to_evaluate
+                            ]
+                            try:
+                                # results are collected in suite order, regardless of completion order
+                                results = [future.result() for future in futures]
+                            finally:
+                                for future in futures:
+                                    future.cancel()
                     else:
-                        raise err
-
-                # if include_config:
-                result.expectation_config = expectation
-
-                # Add an empty exception_info object if no exception was caught
-                if catch_exceptions and result.exception_info is None:
-                    result.exception_info = {
-                        "raised_exception": False,
-                        "exception_traceback": None,
-                        "exception_message": None,
-                    }
-
-                results.append(result)
+                        for expectation in expectations_to_evaluate:
+                            results.append(
+                                self._validate_expectation(
+                                    expectation, *validation_args
+                                )
+                            )
+                finally:
+                    self._finish_validation()
+                validation_meta = self._get_validation_meta()
 
             statistics = _calc_validation_statistics(results)
 
@@ -995,10 +1037,9 @@ class DataAsset:
                     "batch_markers": self.batch_markers,
                     "batch_parameters": self.batch_parameters,
                     "validation_time": validation_time,
+                    **validation_meta,
                 },
             )
-
-            self._data_context = validate__data_context
         except Exception:
             if getattr(data_context, "_usage_statistics_handler", None):
                 handler = data_context._usage_statistics_handler
@@ -1008,8 +1049,6 @@ class DataAsset:
                     success=False,
                 )
             raise
-        finally:
-            self._active_validation = False
 
         if getattr(data_context, "_usage_statistics_handler", None):
             handler = data_context._usage_statistics_handler
@@ -1020,6 +1059,113 @@ class DataAsset:
             )
         return result
 
+    def _validate_expectation(
+        self, expectation, validation_run, evaluation_parameters, catch_exceptions,
+    ):
+        """Evaluate a single expectation of the suite being validated and return its result.
+
+        This runs on a worker thread when expectations are evaluated concurrently, so it registers
+        validation_run for the current thread rather than relying on state stored on the data asset.
+        """
+        with self._validation_run_scope(validation_run):
+            try:
+                expectation_method = getattr(self, expectation.expectation_type)
+
+                # A missing parameter will raise an EvaluationParameterError
+                (
+                    evaluation_args,
+                    substituted_parameters,
+                ) = build_evaluation_parameters(
+                    expectation.kwargs,
+                    evaluation_parameters,
+                    self._config.get("interactive_evaluation", True),
+                    validation_run.data_context,
+                )
+
+                result = expectation_method(
+                    catch_exceptions=catch_exceptions,
+                    include_config=True,
+                    **evaluation_args
+                )
+
+            except Exception as err:
+                if catch_exceptions:
+                    raised_exception = True
+                    exception_traceback = traceback.format_exc()
+
+                    result = ExpectationValidationResult(
+                        success=False,
+                        exception_info={
+                            "raised_exception": raised_exception,
+                            "exception_traceback": exception_traceback,
+                            "exception_message": str(err),
+                        },
+                    )
+
+                else:
+                    raise err
+
+            # if include_config:
+            result.expectation_config = expectation
+
+            # Add an empty exception_info object if no exception was caught
+            if catch_exceptions and result.exception_info is None:
+                result.exception_info = {
+                    "raised_exception": False,
+                    "exception_traceback": None,
+                    "exception_message": None,
+                }
+
+            return result
+
+    def _get_max_concurrent_expectations(self):
+        """Return how many expectations validate may evaluate at the same time.
+
+        Expectations are evaluated one after another by default. Backends whose metrics are computed outside the
+        Python process (a database or a Spark cluster) override this to let validate run independent expectations
+        on a thread pool.
+        """
+        return 1
+
+    def _prepare_validation(self, expectations, evaluation_parameters):
+        """Called by validate before any expectation is evaluated.
+
+        Subclasses may override this to precompute metrics shared by several expectations of the suite (for
+        example, by fusing them into a single query) and store them in the metrics of the active validation run
+        (see _get_active_validation_run). The default implementation does nothing.
+
+        Args:
+            expectations (list): the ExpectationConfigurations that are about to be evaluated, in order (with the
+                result_format passed to validate, if any, already applied)
+            evaluation_parameters (dict): the runtime evaluation parameters used to evaluate them
+        """
+        pass
+
+    def _finish_validation(self):
+        """Called by validate once all expectations have been evaluated, whether or not validation succeeded.
+
+        Subclasses may override this to release resources acquired in _prepare_validation. It is also called if
+        _prepare_validation raises, so it must only release what _prepare_validation actually acquired.
+        """
+        pass
+
+    def _get_validation_meta(self):
+        """Return the entries that validate adds to the meta of its result, once validation is finished.
+
+        Subclasses may override this to report how the backend evaluated the suite. The default implementation
+        adds nothing.
+        """
+        return {}
+
+    def release(self):
+        """Release the resources held by the data asset, e.g. once a validation operator has run the actions of a
+        batch it built. The data asset can still be used afterwards.
+
+        Subclasses that hold resources (for example, a persisted DataFrame) override this. The default
+        implementation does nothing.
+        """
+        pass
+
     def get_evaluation_parameter(self, parameter_name, default_value=None):
         """Get an evaluation parameter value that has been stored in meta.
 
@@ -1094,6 +1240,7 @@ class DataAsset:
         unexpected_count,
         unexpected_list,
         unexpected_index_list,
+        partial_unexpected_counts=None,
     ):
         """Helper function to construct expectation result objects for map_expectations (such as column_map_expectation
         and file_lines_map_expectation).
@@ -1103,6 +1250,9 @@ class DataAsset:
         See :ref:`result_format` for more information.
 
         This function handles the logic for mapping those fields for column_map_expectations.
+
+        If partial_unexpected_counts (a list of {"value": ..., "count": ...} dicts) is provided, it is used as is
+        instead of being computed from unexpected_list, which then only needs to hold the partial unexpected values.
         """
         # NB: unexpected_count parameter is explicit some implementing classes may limit the length of unexpected_list
 
@@ -1147,7 +1297,18 @@ class DataAsset:
             return return_obj
 
         # Try to return the most common values, if possible.
-        if 0 < result_format.get("partial_unexpected_count"):
+        if partial_unexpected_counts is not None:
+            return_obj["result"].update(
+                {
+                    "partial_unexpected_index_list": unexpected_index_list[
+                        : result_format["partial_unexpected_count"]
+                    ]
+                    if unexpected_index_list is not None
+                    else None,
+                    "partial_unexpected_counts": partial_unexpected_counts,
+                }
+            )
+        elif 0 < result_format.get("partial_unexpected_count"):
             try:
                 partial_unexpected_counts = [
                     {"value": key, "count": value}
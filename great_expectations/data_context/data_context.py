@@ -35,6 +35,7 @@ from great_expectations.core.usage_statistics.usage_statistics import (
 )
 from great_expectations.core.util import nested_update
 from great_expectations.data_asset import DataAsset
+from great_expectations.data_context.store import ValidationsStore
 from great_expectations.data_context.templates import (
     CONFIG_VARIABLES_TEMPLATE,
     PROJECT_TEMPLATE_USAGE_STATISTICS_DISABLED,
@@ -1380,6 +1381,7 @@ class BaseDataContext:
             "data_asset_name"
         )
 
+        metrics = []
         for expectation_suite_dependency, metrics_list in requested_metrics.items():
             if (expectation_suite_dependency != "*") and (
                 expectation_suite_dependency != expectation_suite_name
@@ -1401,19 +1403,21 @@ class BaseDataContext:
                         metric_value = validation_results.get_metric(
                             metric_name, **metric_kwargs
                         )
-                        self.stores[target_store_name].set(
-                            ValidationMetricIdentifier(
-                                run_id=run_id,
-                                data_asset_name=data_asset_name,
-                                expectation_suite_identifier=ExpectationSuiteIdentifier(
-                                    expectation_suite_name
+                        metrics.append(
+                            (
+                                ValidationMetricIdentifier(
+                                    run_id=run_id,
+                                    data_asset_name=data_asset_name,
+                                    expectation_suite_identifier=ExpectationSuiteIdentifier(
+                                        expectation_suite_name
+                                    ),
+                                    metric_name=metric_name,
+                                    metric_kwargs_id=get_metric_kwargs_id(
+                                        metric_name, metric_kwargs
+                                    ),
                                 ),
-                                metric_name=metric_name,
-                                metric_kwargs_id=get_metric_kwargs_id(
-                                    metric_name, metric_kwargs
-                                ),
-                            ),
-                            metric_value,
+                                metric_value,
+                            )
                         )
                     except ge_exceptions.UnavailableMetricError:
                         # This will happen frequently in larger pipelines
@@ -1422,6 +1426,10 @@ class BaseDataContext:
                             "this validation result.".format(metric_name)
                         )
 
+        if metrics:
+            # the metrics of a validation are written at once, which database backends do in a single transaction
+            self.stores[target_store_name].set_many(metrics)
+
     def store_validation_result_metrics(
         self, requested_metrics, validation_results, target_store_name
     ):
@@ -1484,7 +1492,7 @@ class BaseDataContext:
         Args:
             data_asset_name: name of data asset for which to get validation result
             expectation_suite_name: expectation_suite name for which to get validation result (default: "default")
-            run_id: run_id for which to get validation result (if None, fetch the latest result by alphanumeric sort)
+            run_id: run_id for which to get validation result (if None, fetch the latest result of the expectation suite)
             validations_store_name: the name of the store from which to get validation results
             failed_only: if True, filter the result to return only failed expectations
 
@@ -1496,7 +1504,26 @@ class BaseDataContext:
             validations_store_name = self.validations_store_name
         selected_store = self.stores[validations_store_name]
 
-        if run_id is None or batch_identifier is None:
+        if isinstance(selected_store, ValidationsStore) and (
+            run_id is None or batch_identifier is None
+        ):
+            # Get most recent run id from the catalog of the store, without listing its keys
+            if isinstance(run_id, dict):
+                run_id = RunIdentifier(**run_id)
+            latest_keys = selected_store.list_latest_keys(
+                expectation_suite_name=expectation_suite_name,
+                run_id=run_id,
+                batch_identifier=batch_identifier,
+                limit=1,
+            )
+            if len(latest_keys) == 0:
+                logger.warning("No valid run_id values found.")
+                return {}
+
+            run_id = latest_keys[0].run_id
+            batch_identifier = latest_keys[0].batch_identifier
+
+        elif run_id is None or batch_identifier is None:
             # Get most recent run id
             # NOTE : This method requires a (potentially very inefficient) list_keys call.
             # It should probably move to live in an appropriate Store class,
@@ -1,5 +1,6 @@
 from great_expectations.util import verify_dynamic_loading_support
 
+from .caching_store_backend import CachingStoreBackend
 from .database_store_backend import DatabaseStoreBackend
 from .expectations_store import ExpectationsStore
 from .html_site_store import HtmlSiteStore
@@ -24,5 +25,6 @@ for module_name, package_name in [
     (".store_backend", "great_expectations.data_context.store"),
     (".tuple_store_backend", "great_expectations.data_context.store"),
     (".database_store_backend", "great_expectations.data_context.store"),
+    (".caching_store_backend", "great_expectations.data_context.store"),
 ]:
     verify_dynamic_loading_support(module_name=module_name, package_name=package_name)
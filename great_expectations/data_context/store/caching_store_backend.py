@@ -0,0 +1,243 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from great_expectations.data_context.store.store_backend import StoreBackend
+
+
+class _CacheEntry:
+    __slots__ = ["value", "deserialized_value", "expires_at"]
+
+    _missing = object()
+
+    def __init__(self, value, expires_at):
+        self.value = value
+        self.deserialized_value = self._missing
+        self.expires_at = expires_at
+
+
+class CachingStoreBackend(StoreBackend):
+    """A read-through cache in front of another store backend.
+
+    Values read from the wrapped backend are kept in a least-recently-used cache of at most max_size entries, for at
+    most ttl seconds (or until they are evicted, if ttl is None). Entries are invalidated when their key is set,
+    moved or removed through this backend; changes made to the wrapped backend by other means are only seen once
+    the entries expire.
+
+    With cache_deserialized_objects, the Store using this backend also caches the objects it deserializes, so that
+    deserialization is skipped on cache hits. A deep copy of the cached object is returned on every get, so that
+    callers may modify it.
+
+    A Store builds a CachingStoreBackend around its backend when the configuration of the backend has a cache
+    section, for example:
+
+    .. code-block:: yaml
+
+        expectations_store:
+          class_name: ExpectationsStore
+          store_backend:
+            class_name: TupleFilesystemStoreBackend
+            base_directory: expectations/
+            cache:
+              max_size: 256
+              ttl: 300
+              cache_deserialized_objects: true
+
+    Hit and miss counts are available from get_cache_statistics.
+    """
+
+    def __init__(
+        self, store_backend, max_size=1000, ttl=None, cache_deserialized_objects=False
+    ):
+        if not isinstance(store_backend, StoreBackend):
+            raise TypeError("store_backend must be a StoreBackend")
+        if max_size is None or max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number of seconds")
+        super().__init__(fixed_length_key=store_backend.fixed_length_key)
+        self._store_backend = store_backend
+        self._max_size = max_size
+        self._ttl = ttl
+        self._cache_deserialized_objects = cache_deserialized_objects
+        self._cache = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def store_backend(self):
+        """The wrapped store backend."""
+        return self._store_backend
+
+    @property
+    def cache_deserialized_objects(self):
+        return self._cache_deserialized_objects
+
+    def __getattr__(self, item):
+        # expose the attributes of the wrapped backend (e.g. its base_directory or bucket)
+        if item == "_store_backend":
+            raise AttributeError(item)
+        return getattr(self._store_backend, item)
+
+    def get_cache_statistics(self):
+        """Return the hit and miss counts of the cache since it was created or last cleared."""
+        with self._lock:
+            requests = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / requests if requests else None,
+                "evictions": self._evictions,
+                "size": len(self._cache),
+                "max_size": self._max_size,
+            }
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def get_deserialized(self, key, deserialize):
+        """Get the value of a key, deserialized by calling deserialize on the serialized value.
+
+        When cache_deserialized_objects is set, the deserialized object is cached along with the serialized value
+        and a deep copy of it is returned. deserialize is not called for falsy values, for which None is returned.
+        """
+        value = self.get(key)
+        if not value:
+            return None
+        if not self._cache_deserialized_objects:
+            return deserialize(value)
+
+        with self._lock:
+            entry = self._cache.get(key)
+        if entry is None or entry.value is not value:
+            # the entry was invalidated or evicted meanwhile
+            return deserialize(value)
+        if entry.deserialized_value is _CacheEntry._missing:
+            entry.deserialized_value = deserialize(value)
+        return copy.deepcopy(entry.deserialized_value)
+
+    def _get(self, key, **kwargs):
+        entry = self._get_entry(key)
+        if entry is not None:
+            return entry.value
+        value = self._store_backend.get(key, **kwargs)
+        self._add_entry(key, value)
+        return value
+
+    def get_many(self, keys, **kwargs):
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        values = {}
+        missing_keys = []
+        for key in keys:
+            entry = self._get_entry(key)
+            if entry is None:
+                missing_keys.append(key)
+            else:
+                values[key] = entry.value
+        if missing_keys:
+            for key, value in zip(
+                missing_keys, self._store_backend.get_many(missing_keys, **kwargs)
+            ):
+                self._add_entry(key, value)
+                values[key] = value
+        return [values[key] for key in keys]
+
+    def _set(self, key, value, **kwargs):
+        try:
+            return self._store_backend.set(key, value, **kwargs)
+        finally:
+            self._invalidate(key)
+
+    def set_many(self, key_value_pairs, **kwargs):
+        key_value_pairs = list(key_value_pairs)
+        try:
+            return self._store_backend.set_many(key_value_pairs, **kwargs)
+        finally:
+            for key, _ in key_value_pairs:
+                self._invalidate(key)
+
+    def _move(self, source_key, dest_key, **kwargs):
+        try:
+            return self._store_backend.move(source_key, dest_key, **kwargs)
+        finally:
+            self._invalidate(source_key)
+            self._invalidate(dest_key)
+
+    def remove_key(self, key):
+        try:
+            return self._store_backend.remove_key(key)
+        finally:
+            if isinstance(key, tuple):
+                self._invalidate(key)
+            else:
+                # some backends accept keys that are not tuples
+                with self._lock:
+                    self._cache.clear()
+
+    def list_keys(self, prefix=()):
+        if prefix:
+            return self._store_backend.list_keys(prefix)
+        # not every backend supports listing keys by prefix
+        return self._store_backend.list_keys()
+
+    def list_items(self, prefix=()):
+        items = self._store_backend.list_items(prefix)
+        for key, value in items:
+            self._add_entry(key, value)
+        return items
+
+    def _has_key(self, key):
+        if self._get_entry(key, count=False) is not None:
+            return True
+        return self._store_backend.has_key(key)
+
+    def get_url_for_key(self, key, protocol=None):
+        return self._store_backend.get_url_for_key(key, protocol=protocol)
+
+    def get_public_url_for_key(self, key, protocol=None):
+        return self._store_backend.get_public_url_for_key(key, protocol=protocol)
+
+    def _validate_key(self, key):
+        self._store_backend._validate_key(key)
+
+    def _validate_value(self, value):
+        self._store_backend._validate_value(value)
+
+    def _get_entry(self, key, count=True):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and (
+                entry.expires_at is not None and entry.expires_at <= time.monotonic()
+            ):
+                del self._cache[key]
+                entry = None
+            if entry is not None:
+                self._cache.move_to_end(key)
+            if count:
+                if entry is None:
+                    self._misses += 1
+                else:
+                    self._hits += 1
+            return entry
+
+    def _add_entry(self, key, value):
+        expires_at = None if self._ttl is None else time.monotonic() + self._ttl
+        with self._lock:
+            self._cache[key] = _CacheEntry(value, expires_at)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+    def _invalidate(self, key):
+        with self._lock:
+            self._cache.pop(key, None)
@@ -13,6 +13,7 @@ try:
         and_,
         column,
         create_engine,
+        or_,
         select,
         text,
     )
@@ -28,6 +29,9 @@ logger = logging.getLogger(__name__)
 
 
 class DatabaseStoreBackend(StoreBackend):
+    # the number of rows written by each statement of set_many
+    upsert_batch_size = 500
+
     def __init__(self, credentials, table_name, key_columns, fixed_length_key=True):
         super().__init__(fixed_length_key=fixed_length_key)
         if not sqlalchemy:
@@ -94,23 +98,71 @@ class DatabaseStoreBackend(StoreBackend):
             raise ge_exceptions.StoreError("Unable to fetch value for key: " + str(key))
 
     def _set(self, key, value, allow_update=True):
-        cols = {k: v for (k, v) in zip(self.key_columns, key)}
-        cols["value"] = value
+        if allow_update:
+            self._upsert([(key, value)])
+        else:
+            self._insert(key, value)
+
+    def set_many(self, key_value_pairs, allow_update=True):
+        """Set the values of several keys in a single transaction.
+
+        With allow_update, the rows are written with the upsert statement of the dialect of the database (INSERT ...
+        ON CONFLICT for PostgreSQL, INSERT ... ON DUPLICATE KEY UPDATE for MySQL and INSERT OR REPLACE for SQLite),
+        executed for batches of upsert_batch_size rows. Other dialects delete the existing rows of each batch before
+        inserting it.
+        """
+        key_value_pairs = list(key_value_pairs)
+        for key, value in key_value_pairs:
+            self._validate_key(key)
+            self._validate_value(value)
 
         if allow_update:
-            if self.has_key(key):
-                ins = (
-                    self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
-                    .values(**cols)
+            self._upsert(key_value_pairs)
+            return
+
+        try:
+            with self.engine.begin() as connection:
+                self._execute_in_batches(
+                    connection, self._table.insert(), self._get_rows(key_value_pairs),
                 )
-            else:
-                ins = self._table.insert().values(**cols)
-        else:
-            ins = self._table.insert().values(**cols)
+        except IntegrityError:
+            # some of the keys exist: insert the keys one at a time to find out which values differ
+            for key, value in key_value_pairs:
+                self._insert(key, value)
 
+    def _upsert(self, key_value_pairs):
+        rows = self._get_rows(key_value_pairs)
+        upsert = self._get_upsert_statement()
         try:
-            self.engine.execute(ins)
+            with self.engine.begin() as connection:
+                if upsert is not None:
+                    self._execute_in_batches(connection, upsert, rows)
+                    return
+                for start in range(0, len(rows), self.upsert_batch_size):
+                    batch = rows[start : start + self.upsert_batch_size]
+                    connection.execute(
+                        self._table.delete().where(
+                            or_(
+                                *[
+                                    self._get_key_clause(
+                                        [row[key_col] for key_col in self.key_columns]
+                                    )
+                                    for row in batch
+                                ]
+                            )
+                        )
+                    )
+                    connection.execute(self._table.insert(), batch)
+        except SQLAlchemyError as e:
+            raise ge_exceptions.StoreBackendError(
+                f"Unable to store values: got sqlalchemy error {str(e)}"
+            )
+
+    def _insert(self, key, value):
+        cols = {k: v for (k, v) in zip(self.key_columns, key)}
+        cols["value"] = value
+        try:
+            self.engine.execute(self._table.insert().values(**cols))
         except IntegrityError as e:
             if self._get(key) == value:
                 logger.info(f"Key {str(key)} already exists with the same value.")
@@ -119,6 +171,45 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Integrity error {str(e)} while trying to store key"
                 )
 
+    def _get_upsert_statement(self):
+        dialect = self.engine.dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+
+            statement = insert(self._table)
+            return statement.on_conflict_do_update(
+                index_elements=self.key_columns,
+                set_={"value": statement.excluded.value},
+            )
+        if dialect == "mysql":
+            from sqlalchemy.dialects.mysql import insert
+
+            statement = insert(self._table)
+            return statement.on_duplicate_key_update(value=statement.inserted.value)
+        if dialect == "sqlite":
+            return self._table.insert().prefix_with("OR REPLACE")
+        return None
+
+    def _execute_in_batches(self, connection, statement, rows):
+        for start in range(0, len(rows), self.upsert_batch_size):
+            connection.execute(statement, rows[start : start + self.upsert_batch_size])
+
+    def _get_rows(self, key_value_pairs):
+        # when a key is given more than once, its last value is stored
+        values = {tuple(key): value for key, value in key_value_pairs}
+        return [
+            dict(zip(self.key_columns, key), value=value)
+            for key, value in values.items()
+        ]
+
+    def _get_key_clause(self, key):
+        return and_(
+            *[
+                getattr(self._table.columns, key_col) == val
+                for key_col, val in zip(self.key_columns, key)
+            ]
+        )
+
     def _move(self):
         raise NotImplementedError
 
@@ -174,6 +265,24 @@ class DatabaseStoreBackend(StoreBackend):
         )
         return [tuple(row) for row in self.engine.execute(sel).fetchall()]
 
+    def list_items(self, prefix=()):
+        # a single query reads the keys and their values
+        sel = (
+            select([column(col) for col in self.key_columns] + [column("value")])
+            .select_from(self._table)
+            .where(
+                and_(
+                    *[
+                        getattr(self._table.columns, key_col) == val
+                        for key_col, val in zip(self.key_columns[: len(prefix)], prefix)
+                    ]
+                )
+            )
+        )
+        return [
+            (tuple(row[:-1]), row[-1]) for row in self.engine.execute(sel).fetchall()
+        ]
+
     def remove_key(self, key):
         delete_statement = self._table.delete().where(
             and_(
@@ -171,6 +171,22 @@ A HtmlSiteStore facilitates publishing rendered documentation built from Expecta
                 class_name=store_backend["class_name"],
             )
 
+        filepath_template = ".ge_build_manifest.json"
+        build_manifest_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults={
+                "module_name": module_name,
+                "filepath_template": filepath_template,
+            },
+        )
+        if not build_manifest_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
         filepath_template = None
         static_assets_obj = instantiate_class_from_config(
             config=store_backend,
@@ -191,6 +207,7 @@ A HtmlSiteStore facilitates publishing rendered documentation built from Expecta
             ExpectationSuiteIdentifier: expectation_suite_identifier_obj,
             ValidationResultIdentifier: validation_result_idendifier_obj,
             "index_page": index_page_obj,
+            "build_manifest": build_manifest_obj,
             "static_assets": static_assets_obj,
         }
 
@@ -320,6 +337,19 @@ A HtmlSiteStore facilitates publishing rendered documentation built from Expecta
             content_type="text/html; " "charset=utf-8",
         )
 
+    def get_build_manifest(self):
+        """Return the serialized build manifest of the site (see SiteBuildManifest), or None if it has none."""
+        store_backend = self.store_backends["build_manifest"]
+        if not store_backend.has_key(()):
+            return None
+        return store_backend.get(())
+
+    def write_build_manifest(self, manifest):
+        """Like the index page, the build manifest is stored with a zero-length tuple as a key."""
+        return self.store_backends["build_manifest"].set(
+            (), manifest, content_encoding="utf-8", content_type="application/json",
+        )
+
     def clean_site(self):
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
@@ -87,7 +87,8 @@ class EvaluationParameterStore(MetricStore):
 
     def get_bind_params(self, run_id):
         params = {}
-        for k in self._store_backend.list_keys(run_id.to_tuple()):
+        # the metrics of the run are read at once: in a single query from a database, or concurrently from S3 or GCS
+        for k, value in self._store_backend.list_items(run_id.to_tuple()):
             key = self.tuple_to_key(k)
-            params[key.to_evaluation_parameter_urn()] = self.get(key)
+            params[key.to_evaluation_parameter_urn()] = self.deserialize(key, value)
         return params
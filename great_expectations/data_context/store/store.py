@@ -1,6 +1,9 @@
 import logging
 
 from great_expectations.core.data_context_key import DataContextKey
+from great_expectations.data_context.store.caching_store_backend import (
+    CachingStoreBackend,
+)
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.exceptions import ClassInstantiationError, DataContextError
@@ -27,6 +30,11 @@ class Store:
         """Runtime environment may be necessary to instantiate store backend elements."""
         if store_backend is None:
             store_backend = {"class_name": "InMemoryStoreBackend"}
+        cache_config = store_backend.get("cache")
+        if cache_config is not None:
+            store_backend = {
+                key: value for key, value in store_backend.items() if key != "cache"
+            }
         logger.debug("Building store_backend.")
         module_name = "great_expectations.data_context.store"
         self._store_backend = instantiate_class_from_config(
@@ -42,6 +50,10 @@ class Store:
             raise DataContextError(
                 "Invalid StoreBackend configuration: expected a StoreBackend instance."
             )
+        if cache_config is not None:
+            self._store_backend = CachingStoreBackend(
+                self._store_backend, **cache_config
+            )
         self._use_fixed_length_key = self._store_backend.fixed_length_key
 
     def _validate_key(self, key):
@@ -76,6 +88,10 @@ class Store:
 
     def get(self, key):
         self._validate_key(key)
+        if isinstance(self._store_backend, CachingStoreBackend):
+            return self._store_backend.get_deserialized(
+                self.key_to_tuple(key), lambda value: self.deserialize(key, value)
+            )
         value = self._store_backend.get(self.key_to_tuple(key))
         if value:
             return self.deserialize(key, value)
@@ -86,6 +102,28 @@ class Store:
             self.key_to_tuple(key), self.serialize(key, value)
         )
 
+    def get_many(self, keys):
+        """Get several objects at once, which store backends may fetch concurrently."""
+        for key in keys:
+            self._validate_key(key)
+        values = self._store_backend.get_many([self.key_to_tuple(key) for key in keys])
+        return [
+            self.deserialize(key, value) if value else None
+            for key, value in zip(keys, values)
+        ]
+
+    def set_many(self, key_value_pairs):
+        """Set several objects at once, given as (key, value) pairs."""
+        key_value_pairs = list(key_value_pairs)
+        for key, _ in key_value_pairs:
+            self._validate_key(key)
+        return self._store_backend.set_many(
+            [
+                (self.key_to_tuple(key), self.serialize(key, value))
+                for key, value in key_value_pairs
+            ]
+        )
+
     def list_keys(self):
         return [self.tuple_to_key(key) for key in self._store_backend.list_keys()]
 
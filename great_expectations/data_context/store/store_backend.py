@@ -41,6 +41,41 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def get_many(self, keys, **kwargs):
+        """Get the values of several keys, in the order of the keys."""
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        return self._map(lambda key: self._get(key, **kwargs), keys)
+
+    def list_items(self, prefix=()):
+        """List the (key, value) pairs of the keys starting with prefix.
+
+        By default, the keys are listed and their values fetched with get_many; backends that can read keys and
+        values at once override this.
+        """
+        keys = self.list_keys(prefix)
+        return list(zip(keys, self.get_many(keys)))
+
+    def set_many(self, key_value_pairs, **kwargs):
+        """Set the values of several keys, given as (key, value) pairs.
+
+        Returns:
+            the list of what the implementing setter returned for each pair
+        """
+        key_value_pairs = list(key_value_pairs)
+        for key, value in key_value_pairs:
+            self._validate_key(key)
+            self._validate_value(value)
+        try:
+            return self._map(
+                lambda key_value_pair: self._set(*key_value_pair, **kwargs),
+                key_value_pairs,
+            )
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError("ValueError while calling _set on store backend.")
+
     def move(self, source_key, dest_key, **kwargs):
         self._validate_key(source_key)
         self._validate_key(dest_key)
@@ -76,6 +111,12 @@ class StoreBackend(metaclass=ABCMeta):
     def _validate_value(self, value):
         pass
 
+    # noinspection PyMethodMayBeStatic
+    def _map(self, function, items):
+        """Call function on each item, for get_many and set_many. Backends may override this to run the calls
+        concurrently."""
+        return [function(item) for item in items]
+
     @abstractmethod
     def _get(self, key):
         raise NotImplementedError
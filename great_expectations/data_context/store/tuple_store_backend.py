@@ -4,7 +4,9 @@ import os
 import random
 import re
 import shutil
+import threading
 from abc import ABCMeta
+from concurrent.futures import ThreadPoolExecutor
 
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
@@ -82,6 +84,14 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
                 )
             )
 
+    @staticmethod
+    def _decode_value(contents, encoding="utf-8"):
+        # values stored as bytes that are not text (e.g. compressed values) are returned as bytes
+        try:
+            return contents.decode(encoding)
+        except UnicodeDecodeError:
+            return contents
+
     def _convert_key_to_filepath(self, key):
         # NOTE: This method uses a hard-coded forward slash as a separator,
         # and then replaces that with a platform-specific separator if requested (the default)
@@ -100,6 +110,18 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
 
         return converted_string
 
+    def _convert_key_prefix_to_filepath_prefix(self, prefix):
+        """Return the beginning of the filepaths of all the keys starting with prefix, or None if it is not known,
+        e.g. because the filepaths are built from a filepath_template."""
+        if not prefix or self.filepath_template:
+            return None
+        filepath_prefix = "/".join(prefix)
+        if self.filepath_prefix:
+            filepath_prefix = self.filepath_prefix + "/" + filepath_prefix
+        if self.platform_specific_separator:
+            filepath_prefix = os.path.normpath(filepath_prefix)
+        return filepath_prefix
+
     def _convert_filepath_to_key(self, filepath):
         if self.platform_specific_separator:
             filepath = os.path.normpath(filepath)
@@ -239,8 +261,8 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             self.full_base_directory, self._convert_key_to_filepath(key)
         )
         try:
-            with open(filepath) as infile:
-                contents = infile.read()
+            with open(filepath, "rb") as infile:
+                contents = self._decode_value(infile.read())
         except FileNotFoundError:
             raise InvalidKeyError(
                 f"Unable to retrieve object from TupleFilesystemStoreBackend with the following Key: {str(filepath)}"
@@ -370,6 +392,9 @@ class TupleS3StoreBackend(TupleStoreBackend):
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    A single S3 client, with a pool of max_workers connections, is shared by all the calls of the backend; get_many
+    and set_many make up to max_workers requests concurrently.
     """
 
     def __init__(
@@ -384,6 +409,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         fixed_length_key=False,
         base_public_path=None,
         endpoint_url=None,
+        max_workers=8,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -404,6 +430,27 @@ class TupleS3StoreBackend(TupleStoreBackend):
             prefix = prefix.strip("/")
         self.prefix = prefix
         self.endpoint_url = endpoint_url
+        self.max_workers = max_workers
+        self._s3_client = None
+        self._s3_client_lock = threading.Lock()
+
+    def _get_s3_client(self):
+        # boto3 clients are thread-safe, but creating one is not
+        with self._s3_client_lock:
+            if self._s3_client is None:
+                import boto3
+                from botocore.config import Config
+
+                self._s3_client = boto3.client(
+                    "s3",
+                    endpoint_url=self.endpoint_url,
+                    config=Config(max_pool_connections=max(self.max_workers, 10)),
+                )
+        return self._s3_client
+
+    def _map(self, function, items):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(function, items))
 
     def _build_s3_object_key(self, key):
         if self.platform_specific_separator:
@@ -423,9 +470,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return s3_object_key
 
     def _get(self, key):
-        import boto3
-
-        s3 = boto3.client("s3", endpoint_url=self.endpoint_url)
+        s3 = self._get_s3_client()
 
         s3_object_key = self._build_s3_object_key(key)
 
@@ -436,32 +481,35 @@ class TupleS3StoreBackend(TupleStoreBackend):
                 f"Unable to retrieve object from TupleS3StoreBackend with the following Key: {str(s3_object_key)}"
             )
 
-        return (
-            s3_response_object["Body"]
-            .read()
-            .decode(s3_response_object.get("ContentEncoding", "utf-8"))
+        return self._decode_value(
+            s3_response_object["Body"].read(),
+            s3_response_object.get("ContentEncoding", "utf-8"),
         )
 
     def _set(
         self, key, value, content_encoding="utf-8", content_type="application/json"
     ):
-        import boto3
-
-        s3 = boto3.resource("s3", endpoint_url=self.endpoint_url)
+        s3 = self._get_s3_client()
 
         s3_object_key = self._build_s3_object_key(key)
 
         try:
-            result_s3 = s3.Object(self.bucket, s3_object_key)
             if isinstance(value, str):
-                result_s3.put(
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
                     Body=value.encode(content_encoding),
                     ContentEncoding=content_encoding,
                     ContentType=content_type,
                 )
             else:
-                result_s3.put(Body=value, ContentType=content_type)
-        except s3.meta.client.exceptions.ClientError as e:
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
+                    Body=value,
+                    ContentType=content_type,
+                )
+        except s3.exceptions.ClientError as e:
             logger.debug(str(e))
             raise StoreBackendError("Unable to set object in s3.")
 
@@ -485,28 +533,37 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
         s3.Object(self.bucket, source_filepath).delete()
 
-    def list_keys(self):
+    def list_keys(self, prefix=()):
         key_list = []
 
-        import boto3
-
-        s3 = boto3.client("s3", endpoint_url=self.endpoint_url)
+        s3 = self._get_s3_client()
 
-        if self.prefix:
-            s3_objects = s3.list_objects_v2(Bucket=self.bucket, Prefix=self.prefix)
-        else:
-            s3_objects = s3.list_objects_v2(Bucket=self.bucket)
+        s3_prefix = self.prefix
+        filepath_prefix = self._convert_key_prefix_to_filepath_prefix(prefix)
+        if filepath_prefix is not None:
+            # only list the objects of the keys starting with prefix
+            if not self.prefix:
+                s3_prefix = filepath_prefix
+            elif self.platform_specific_separator:
+                s3_prefix = os.path.join(self.prefix, filepath_prefix)
+            else:
+                s3_prefix = "/".join((self.prefix, filepath_prefix))
 
-        if "Contents" in s3_objects:
-            objects = s3_objects["Contents"]
-        elif "CommonPrefixes" in s3_objects:
-            logger.warning(
-                "TupleS3StoreBackend returned CommonPrefixes, but delimiter should not have been set."
-            )
-            objects = []
+        # list_objects_v2 returns at most 1000 objects per call
+        paginator = s3.get_paginator("list_objects_v2")
+        if s3_prefix:
+            s3_pages = paginator.paginate(Bucket=self.bucket, Prefix=s3_prefix)
         else:
-            # No objects found in store
-            objects = []
+            s3_pages = paginator.paginate(Bucket=self.bucket)
+
+        objects = []
+        for s3_objects in s3_pages:
+            if "Contents" in s3_objects:
+                objects.extend(s3_objects["Contents"])
+            elif "CommonPrefixes" in s3_objects:
+                logger.warning(
+                    "TupleS3StoreBackend returned CommonPrefixes, but delimiter should not have been set."
+                )
 
         for s3_object_info in objects:
             s3_object_key = s3_object_info["Key"]
@@ -528,26 +585,17 @@ class TupleS3StoreBackend(TupleStoreBackend):
             ):
                 continue
             key = self._convert_filepath_to_key(s3_object_key)
-            if key:
+            if key and key[: len(prefix)] == prefix:
                 key_list.append(key)
 
         return key_list
 
     def get_url_for_key(self, key, protocol=None):
-        import boto3
-
-        location = boto3.client(
-            "s3", endpoint_url=self.endpoint_url
-        ).get_bucket_location(Bucket=self.bucket)["LocationConstraint"]
-        if location is None:
-            location = "s3"
-        else:
-            location = "s3-" + location
         s3_key = self._convert_key_to_filepath(key)
 
-        location = boto3.client(
-            "s3", endpoint_url=self.endpoint_url
-        ).get_bucket_location(Bucket=self.bucket)["LocationConstraint"]
+        location = self._get_s3_client().get_bucket_location(Bucket=self.bucket)[
+            "LocationConstraint"
+        ]
         if location is None:
             location = "s3"
         else:
@@ -619,6 +667,9 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
 
     The filepath_template is a string template used to convert the key to a filepath.
+
+    A single GCS client is shared by all the calls of the backend; get_many and set_many make up to max_workers
+    requests concurrently.
     """
 
     def __init__(
@@ -634,6 +685,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         fixed_length_key=False,
         public_urls=True,
         base_public_path=None,
+        max_workers=8,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -648,6 +700,29 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         self.prefix = prefix
         self.project = project
         self._public_urls = public_urls
+        self.max_workers = max_workers
+        self._gcs_client = None
+        self._gcs_bucket = None
+        self._gcs_lock = threading.Lock()
+
+    def _get_gcs_client(self):
+        with self._gcs_lock:
+            if self._gcs_client is None:
+                from google.cloud import storage
+
+                self._gcs_client = storage.Client(project=self.project)
+        return self._gcs_client
+
+    def _get_gcs_bucket(self):
+        gcs = self._get_gcs_client()
+        with self._gcs_lock:
+            if self._gcs_bucket is None:
+                self._gcs_bucket = gcs.get_bucket(self.bucket)
+        return self._gcs_bucket
+
+    def _map(self, function, items):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(function, items))
 
     def _build_gcs_object_key(self, key):
         if self.platform_specific_separator:
@@ -672,27 +747,21 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     def _get(self, key):
         gcs_object_key = self._build_gcs_object_key(key)
 
-        from google.cloud import storage
-
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
+        bucket = self._get_gcs_bucket()
         gcs_response_object = bucket.get_blob(gcs_object_key)
         if not gcs_response_object:
             raise InvalidKeyError(
                 f"Unable to retrieve object from TupleGCSStoreBackend with the following Key: {str(key)}"
             )
         else:
-            return gcs_response_object.download_as_string().decode("utf-8")
+            return self._decode_value(gcs_response_object.download_as_string())
 
     def _set(
         self, key, value, content_encoding="utf-8", content_type="application/json"
     ):
         gcs_object_key = self._build_gcs_object_key(key)
 
-        from google.cloud import storage
-
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
+        bucket = self._get_gcs_bucket()
         blob = bucket.blob(gcs_object_key)
 
         if isinstance(value, str):
@@ -705,10 +774,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return gcs_object_key
 
     def _move(self, source_key, dest_key, **kwargs):
-        from google.cloud import storage
-
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
+        bucket = self._get_gcs_bucket()
 
         source_filepath = self._convert_key_to_filepath(source_key)
         if not source_filepath.startswith(self.prefix):
@@ -720,14 +786,24 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         blob = bucket.blob(source_filepath)
         _ = bucket.rename_blob(blob, dest_filepath)
 
-    def list_keys(self):
+    def list_keys(self, prefix=()):
         key_list = []
 
-        from google.cloud import storage
+        gcs = self._get_gcs_client()
 
-        gcs = storage.Client(self.project)
+        gcs_prefix = self.prefix
+        filepath_prefix = self._convert_key_prefix_to_filepath_prefix(prefix)
+        if filepath_prefix is not None:
+            # only list the blobs of the keys starting with prefix
+            if not self.prefix:
+                gcs_prefix = filepath_prefix
+            elif self.platform_specific_separator:
+                gcs_prefix = os.path.join(self.prefix, filepath_prefix)
+            else:
+                gcs_prefix = "/".join((self.prefix, filepath_prefix))
 
-        for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
+        # list_blobs follows the page tokens of the listing
+        for blob in gcs.list_blobs(self.bucket, prefix=gcs_prefix):
             gcs_object_name = blob.name
             gcs_object_key = os.path.relpath(gcs_object_name, self.prefix,)
             if self.filepath_prefix and not gcs_object_key.startswith(
@@ -739,7 +815,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             ):
                 continue
             key = self._convert_filepath_to_key(gcs_object_key)
-            if key:
+            if key and key[: len(prefix)] == prefix:
                 key_list.append(key)
         return key_list
 
@@ -781,11 +857,9 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return path_url
 
     def remove_key(self, key):
-        from google.cloud import storage
         from google.cloud.exceptions import NotFound
 
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
+        bucket = self._get_gcs_bucket()
         try:
             bucket.delete_blobs(blobs=list(bucket.list_blobs(prefix=self.prefix)))
         except NotFound:
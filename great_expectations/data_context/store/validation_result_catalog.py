@@ -0,0 +1,177 @@
+import os
+import sqlite3
+import threading
+
+from great_expectations.data_context.types.resource_identifiers import (
+    ValidationResultIdentifier,
+)
+
+
+class ValidationResultCatalog:
+    """An index of the keys of a ValidationsStore, kept in a SQLite database.
+
+    Keys are indexed by expectation suite name, run name, run time and batch identifier, so that the latest results
+    for a suite, the last runs, or the results of a run are found without listing (and parsing) every key of the
+    store backend.
+
+    The catalog is filled from the keys of the store backend the first time it is used, and kept up to date by the
+    ValidationsStore when results are stored or removed, and when it is reconciled with its store backend. With a filepath, it is persisted across processes (the
+    database is only created once the catalog is used); otherwise it lives in memory for the lifetime of the store.
+
+    Args:
+        filepath (str or None): the path of the SQLite database, or None for an in-memory catalog
+    """
+
+    # the user_version of a database that has been filled from the store backend
+    populated_version = 1
+
+    def __init__(self, filepath=None):
+        self._filepath = filepath
+        self._lock = threading.Lock()
+        self._sqlite_connection = None
+
+    @property
+    def _connection(self):
+        # opened by the first caller, which holds the lock
+        if self._sqlite_connection is None:
+            self._sqlite_connection = self._connect()
+        return self._sqlite_connection
+
+    def _connect(self):
+        if self._filepath is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(self._filepath)), exist_ok=True)
+        connection = sqlite3.connect(
+            self._filepath or ":memory:", check_same_thread=False
+        )
+        with connection:
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS validation_results (
+                    expectation_suite_name TEXT NOT NULL,
+                    run_name TEXT NOT NULL,
+                    run_time TEXT NOT NULL,
+                    batch_identifier TEXT NOT NULL,
+                    PRIMARY KEY (expectation_suite_name, run_name, run_time, batch_identifier)
+                )"""
+            )
+            connection.execute(
+                """CREATE INDEX IF NOT EXISTS validation_results_by_suite
+                ON validation_results (expectation_suite_name, run_time)"""
+            )
+            connection.execute(
+                """CREATE INDEX IF NOT EXISTS validation_results_by_run_time
+                ON validation_results (run_time, run_name)"""
+            )
+            connection.execute(
+                """CREATE INDEX IF NOT EXISTS validation_results_by_run_name
+                ON validation_results (run_name, run_time)"""
+            )
+        return connection
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    @property
+    def is_populated(self):
+        with self._lock:
+            (user_version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        return user_version == self.populated_version
+
+    def populate(self, keys):
+        """Make the content of the catalog match the given ValidationResultIdentifiers.
+
+        Only the keys that are missing from the catalog are inserted, and only the keys that are not given are
+        deleted, so that reconciling an up-to-date catalog writes nothing.
+        """
+        rows = {self._key_to_row(key) for key in keys}
+        with self._lock, self._connection:
+            catalog_rows = set(
+                self._connection.execute("SELECT * FROM validation_results")
+            )
+            self._connection.executemany(
+                """DELETE FROM validation_results WHERE expectation_suite_name = ? AND run_name = ?
+                AND run_time = ? AND batch_identifier = ?""",
+                catalog_rows - rows,
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO validation_results VALUES (?, ?, ?, ?)",
+                rows - catalog_rows,
+            )
+            self._connection.execute(
+                "PRAGMA user_version = {}".format(self.populated_version)
+            )
+
+    def add_key(self, key):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO validation_results VALUES (?, ?, ?, ?)",
+                self._key_to_row(key),
+            )
+
+    def remove_key(self, key):
+        with self._lock, self._connection:
+            self._connection.execute(
+                """DELETE FROM validation_results WHERE expectation_suite_name = ? AND run_name = ?
+                AND run_time = ? AND batch_identifier = ?""",
+                self._key_to_row(key),
+            )
+
+    def list_keys(
+        self,
+        expectation_suite_name=None,
+        run_id=None,
+        run_name=None,
+        batch_identifier=None,
+        limit=None,
+    ):
+        """List the keys matching all of the given filters, latest run first (by run time, then run name).
+
+        Args:
+            expectation_suite_name (str): only list results of this expectation suite
+            run_id (RunIdentifier): only list results of this run
+            run_name (str): only list results of runs with this name
+            batch_identifier (str): only list results for this batch
+            limit (int): the maximum number of keys to list
+
+        Returns:
+            a list of ValidationResultIdentifiers
+        """
+        conditions = []
+        parameters = []
+        if expectation_suite_name is not None:
+            conditions.append("expectation_suite_name = ?")
+            parameters.append(expectation_suite_name)
+        if run_id is not None:
+            conditions.append("run_name = ? AND run_time = ?")
+            parameters.extend(run_id.to_tuple())
+        if run_name is not None:
+            conditions.append("run_name = ?")
+            parameters.append(run_name)
+        if batch_identifier is not None:
+            conditions.append("batch_identifier = ?")
+            parameters.append(batch_identifier)
+
+        query = "SELECT * FROM validation_results"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY run_time DESC, run_name DESC, batch_identifier DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(int(limit))
+
+        with self._lock:
+            rows = self._connection.execute(query, parameters).fetchall()
+        return [ValidationResultIdentifier.from_fixed_length_tuple(row) for row in rows]
+
+    def close(self):
+        if self._sqlite_connection is not None:
+            self._sqlite_connection.close()
+            self._sqlite_connection = None
+
+    @staticmethod
+    def _key_to_row(key):
+        return (
+            key.expectation_suite_identifier.expectation_suite_name,
+            *key.run_id.to_tuple(),
+            key.batch_identifier or "__none__",
+        )
@@ -1,9 +1,16 @@
+import gzip
+import os
+
+import great_expectations.exceptions as ge_exceptions
 from great_expectations.core import ExpectationSuiteValidationResultSchema
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
 from great_expectations.data_context.store.store import Store
 from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
+from great_expectations.data_context.store.validation_result_catalog import (
+    ValidationResultCatalog,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
@@ -78,11 +85,45 @@ A ValidationsStore manages Validation Results to ensure they are accessible via
         bug_risk: Moderate
 
 --ge-feature-maturity-info--
+
+The keys of the store are indexed in a ValidationResultCatalog, so that the latest results of a suite or the results
+of a run are found without listing every key of the store backend. The catalog lives in memory unless a
+catalog_filepath (relative to the root directory of the Data Context) is configured, in which case it is persisted
+in a SQLite database. Call refresh_catalog after results are added to or removed from the backend by other means;
+building Data Docs does so for the stores the site is built from.
+
+Validation results are stored as JSON. With compression set to "gzip", they are stored as gzip-compressed JSON,
+which is much smaller for results with a COMPLETE result_format or large partial_unexpected_counts. Keys keep their
+suffix, and results stored before compression was enabled are still read, so the setting can be changed at any time:
+
+.. code-block:: yaml
+
+    validations_store:
+      class_name: ValidationsStore
+      compression: gzip
+      store_backend:
+        class_name: TupleFilesystemStoreBackend
+        base_directory: uncommitted/validations/
     """
 
     _key_class = ValidationResultIdentifier
 
-    def __init__(self, store_backend=None, runtime_environment=None):
+    _compressions = [None, "gzip"]
+
+    def __init__(
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        catalog_filepath=None,
+        compression=None,
+    ):
+        if compression not in self._compressions:
+            raise ge_exceptions.InvalidConfigError(
+                "Unsupported compression {} for ValidationsStore; supported compressions are {}".format(
+                    compression, self._compressions
+                )
+            )
+        self._compression = compression
         self._expectationSuiteValidationResultSchema = (
             ExpectationSuiteValidationResultSchema()
         )
@@ -106,6 +147,10 @@ A ValidationsStore manages Validation Results to ensure they are accessible via
                     "filepath_suffix", ".json"
                 )
             elif issubclass(store_backend_class, DatabaseStoreBackend):
+                if compression is not None:
+                    raise ge_exceptions.InvalidConfigError(
+                        "DatabaseStoreBackend stores values as text and does not support compression"
+                    )
                 # Provide defaults for this common case
                 store_backend["table_name"] = store_backend.get(
                     "table_name", "ge_validations_store"
@@ -123,8 +168,83 @@ A ValidationsStore manages Validation Results to ensure they are accessible via
             store_backend=store_backend, runtime_environment=runtime_environment
         )
 
+        if catalog_filepath is not None and not os.path.isabs(catalog_filepath):
+            root_directory = (runtime_environment or {}).get("root_directory")
+            if root_directory is None:
+                raise ValueError(
+                    "catalog_filepath must be an absolute path if root_directory is not provided"
+                )
+            catalog_filepath = os.path.join(root_directory, catalog_filepath)
+        self._catalog = ValidationResultCatalog(filepath=catalog_filepath)
+
+    @property
+    def catalog(self):
+        if not self._catalog.is_populated:
+            self.refresh_catalog()
+        return self._catalog
+
+    def refresh_catalog(self, keys=None):
+        """Rebuild the catalog from the keys of the store backend.
+
+        Args:
+            keys (list): the keys of the store, if they have just been listed
+        """
+        if keys is None:
+            keys = self.list_keys()
+        self._catalog.populate(keys)
+
+    def list_latest_keys(
+        self,
+        expectation_suite_name=None,
+        run_id=None,
+        run_name=None,
+        batch_identifier=None,
+        limit=None,
+    ):
+        """List the keys matching all of the given filters from the catalog, latest run first.
+
+        See ValidationResultCatalog.list_keys for the filters.
+        """
+        return self.catalog.list_keys(
+            expectation_suite_name=expectation_suite_name,
+            run_id=run_id,
+            run_name=run_name,
+            batch_identifier=batch_identifier,
+            limit=limit,
+        )
+
+    def set(self, key, value):
+        result = super().set(key, value)
+        self._catalog.add_key(key)
+        return result
+
+    def set_many(self, key_value_pairs):
+        key_value_pairs = list(key_value_pairs)
+        result = super().set_many(key_value_pairs)
+        for key, _ in key_value_pairs:
+            self._catalog.add_key(key)
+        return result
+
+    def remove_key(self, key):
+        self._validate_key(key)
+        result = self.store_backend.remove_key(self.key_to_tuple(key))
+        self._catalog.remove_key(key)
+        return result
+
+    @property
+    def compression(self):
+        return self._compression
+
     def serialize(self, key, value):
-        return self._expectationSuiteValidationResultSchema.dumps(value)
+        serialized_value = self._expectationSuiteValidationResultSchema.dumps(value)
+        if self._compression == "gzip":
+            return gzip.compress(serialized_value.encode("utf-8"), compresslevel=6)
+        return serialized_value
 
     def deserialize(self, key, value):
+        if isinstance(value, bytes):
+            # the compression is told by the value rather than the configuration, which may have changed since
+            if value[:2] == b"\x1f\x8b":
+                value = gzip.decompress(value)
+            value = value.decode("utf-8")
         return self._expectationSuiteValidationResultSchema.loads(value)
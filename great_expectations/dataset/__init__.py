@@ -1,5 +1,6 @@
 import logging
 
+from .chunked_pandas_dataset import ChunkedPandasDataset, MetaChunkedPandasDataset
 from .dataset import Dataset
 from .pandas_dataset import MetaPandasDataset, PandasDataset
 
@@ -0,0 +1,147 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+
+class HyperLogLog:
+    """A mergeable sketch of the number of distinct values of a column (Flajolet et al., "HyperLogLog: the analysis
+    of a near-optimal cardinality estimation algorithm", 2007).
+
+    Every value is hashed to 64 bits. The first precision bits select one of 2 ** precision registers, which keeps
+    the largest number of leading zeros seen in the remaining bits. The number of distinct values is estimated from
+    the registers with the improved estimator of Ertl ("New cardinality estimation algorithms for HyperLogLog
+    sketches", 2017), which is accurate for small and large cardinalities alike without bias-correction tables.
+
+    The relative standard error of the estimate is about 1.04 / sqrt(2 ** precision). Sketches of separate chunks or
+    partitions of a column, built with the same precision, can be merged.
+
+    Args:
+        precision (int): the number of bits used to select a register, between 4 and 18
+    """
+
+    hash_bits = 64
+
+    def __init__(self, precision=14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self._precision = int(precision)
+        self._registers = np.zeros(1 << self._precision, dtype="uint8")
+
+    @classmethod
+    def from_relative_error(cls, relative_error):
+        """Build a sketch whose relative standard error is at most relative_error (within the allowed precisions)."""
+        if not 0 < relative_error < 1:
+            raise ValueError("relative_error must be a float between 0 and 1")
+        precision = int(math.ceil(2 * math.log2(1.04 / relative_error)))
+        return cls(precision=min(max(precision, 4), 18))
+
+    @property
+    def precision(self):
+        return self._precision
+
+    @property
+    def relative_error(self):
+        """The relative standard error of the estimated number of distinct values."""
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def update(self, values):
+        """Add an array of values to the sketch. Null values must have been removed.
+
+        Integers are hashed as floats, so that 1 and 1.0 count as the same value, as they do in pandas.
+
+        Returns:
+            the sketch itself
+        """
+        values = np.asarray(values).ravel()
+        if values.size == 0:
+            return self
+        if values.dtype.kind in "iub":
+            values = values.astype("float64")
+        hashes = pd.util.hash_array(values).astype("uint64")
+
+        register_indexes = (
+            hashes >> np.uint64(self.hash_bits - self._precision)
+        ).astype("int64")
+        remaining_bits = hashes << np.uint64(self._precision)
+        ranks = np.minimum(
+            self.hash_bits - self._get_bit_lengths(remaining_bits) + 1,
+            self.hash_bits - self._precision + 1,
+        ).astype("uint8")
+
+        register_ranks = pd.Series(ranks).groupby(register_indexes).max()
+        self._registers[register_ranks.index.values] = np.maximum(
+            self._registers[register_ranks.index.values], register_ranks.values
+        )
+        return self
+
+    def merge(self, other):
+        """Merge the values summarized by another sketch of the same precision into this one.
+
+        Returns:
+            the sketch itself
+        """
+        if other.precision != self._precision:
+            raise ValueError(
+                "Unable to merge HyperLogLog sketches of precision {} and {}".format(
+                    self._precision, other.precision
+                )
+            )
+        np.maximum(self._registers, other._registers, out=self._registers)
+        return self
+
+    def get_cardinality(self):
+        """Return the estimated number of distinct values, as a float."""
+        register_count = len(self._registers)
+        max_rank = self.hash_bits - self._precision
+        rank_counts = np.bincount(self._registers, minlength=max_rank + 2)
+
+        estimate_denominator = register_count * self._tau(
+            1 - rank_counts[max_rank + 1] / register_count
+        )
+        for rank in range(max_rank, 0, -1):
+            estimate_denominator = 0.5 * (estimate_denominator + rank_counts[rank])
+        estimate_denominator += register_count * self._sigma(
+            rank_counts[0] / register_count
+        )
+        if estimate_denominator == math.inf:
+            return 0.0
+        return register_count ** 2 / (2 * math.log(2) * estimate_denominator)
+
+    @staticmethod
+    def _get_bit_lengths(words):
+        """Return the number of significant bits of each of an array of uint64 words."""
+        high_words = (words >> np.uint64(32)).astype("float64")
+        low_words = (words & np.uint64(0xFFFFFFFF)).astype("float64")
+        # frexp returns the exponent e such that x = m * 2 ** e with 0.5 <= m < 1, i.e. the bit length of x
+        return np.where(
+            high_words > 0, 32 + np.frexp(high_words)[1], np.frexp(low_words)[1]
+        )
+
+    @staticmethod
+    def _sigma(x):
+        if x == 1:
+            return math.inf
+        y = 1.0
+        z = x
+        while True:
+            x = x * x
+            previous_z = z
+            z += x * y
+            y += y
+            if z == previous_z:
+                return z
+
+    @staticmethod
+    def _tau(x):
+        if x == 0 or x == 1:
+            return 0.0
+        y = 1.0
+        z = 1 - x
+        while True:
+            x = math.sqrt(x)
+            previous_z = z
+            y *= 0.5
+            z -= (1 - x) ** 2 * y
+            if z == previous_z:
+                return z / 3
@@ -0,0 +1,1103 @@
+import inspect
+import json
+import logging
+import math
+from collections import Counter
+from datetime import datetime
+from functools import reduce, wraps
+from typing import List
+
+import numpy as np
+import pandas as pd
+from dateutil.parser import parse
+
+from great_expectations.core.evaluation_parameters import build_evaluation_parameters
+from great_expectations.data_asset.util import DocInherit, parse_result_format
+from great_expectations.dataset.cardinality_sketch import HyperLogLog
+from great_expectations.dataset.quantile_sketch import (
+    DEFAULT_RELATIVE_ERROR,
+    KLLSketch,
+    get_relative_error,
+)
+
+from .dataset import Dataset
+from .pandas_dataset import PandasDataset
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkedPandasBatchReference:
+    """A reference to a file that is read in chunks of chunksize rows, rather than loaded into a single DataFrame.
+
+    Only readers that can stream a file are supported: read_csv and read_table (using their chunksize option) and
+    read_parquet (using pyarrow record batches). Every chunk keeps the index the row would have had in a DataFrame
+    read in one go, so that unexpected_index_list values are the same.
+    """
+
+    chunked_reader_methods = ["read_csv", "read_table", "read_parquet"]
+
+    def __init__(self, reader_fn, path, reader_options=None, chunksize=100000):
+        self._reader_fn = reader_fn
+        self._reader_method = getattr(reader_fn, "func", reader_fn).__name__
+        if self._reader_method not in self.chunked_reader_methods:
+            raise ValueError(
+                "Chunked reading is only supported for the reader methods {}, not {}".format(
+                    ", ".join(self.chunked_reader_methods), self._reader_method
+                )
+            )
+        if chunksize is None or chunksize < 1:
+            raise ValueError("chunksize must be a positive integer")
+        self._path = path
+        self._reader_options = reader_options or {}
+        self._chunksize = chunksize
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def chunksize(self):
+        return self._chunksize
+
+    def get_columns(self) -> List[str]:
+        """Return the column names of the file, without reading its rows."""
+        if self._reader_method == "read_parquet":
+            columns = self._reader_options.get("columns")
+            if columns is None:
+                columns = [
+                    name
+                    for name in self._get_parquet_file().schema_arrow.names
+                    if not name.startswith("__index_level_")
+                ]
+            return list(columns)
+
+        reader_options = dict(self._reader_options)
+        reader_options["nrows"] = 0
+        return list(self._reader_fn(self._path, **reader_options).columns)
+
+    def iter_chunks(self, columns=None):
+        """Yield the file as a sequence of DataFrames of at most chunksize rows.
+
+        Args:
+            columns (list or None): if given, only these columns are read
+        """
+        if self._reader_method == "read_parquet":
+            yield from self._iter_parquet_chunks(columns)
+            return
+
+        reader_options = dict(self._reader_options)
+        # usecols would also apply to an index_col, and would replace the columns the user selected
+        if (
+            columns is not None
+            and reader_options.get("index_col") is None
+            and reader_options.get("usecols") is None
+        ):
+            reader_options["usecols"] = columns
+        reader = self._reader_fn(
+            self._path, chunksize=self._chunksize, **reader_options
+        )
+        try:
+            yield from reader
+        finally:
+            reader.close()
+
+    def head(self, n=5):
+        """Return the first n rows of the file as a DataFrame."""
+        chunks = []
+        row_count = 0
+        for chunk in self.iter_chunks():
+            chunks.append(chunk)
+            row_count += len(chunk)
+            if row_count >= n:
+                break
+        if not chunks:
+            return pd.DataFrame(columns=self.get_columns())
+        return pd.concat(chunks).iloc[:n]
+
+    def _get_parquet_file(self):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError(
+                "Chunked reading of parquet files requires the optional pyarrow dependency."
+            )
+        return pq.ParquetFile(self._path)
+
+    def _iter_parquet_chunks(self, columns):
+        if columns is None:
+            columns = self.get_columns()
+        offset = 0
+        for record_batch in self._get_parquet_file().iter_batches(
+            batch_size=self._chunksize, columns=columns
+        ):
+            chunk = record_batch.to_pandas()
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+
+
+class _ColumnMapAccumulator:
+    """Accumulates the counts and unexpected values of a column map expectation over the chunks of a file.
+
+    The result is the same as applying the expectation to the whole column at once (see
+    MetaPandasDataset.column_map_expectation): counts are summed, unexpected values are collected in file order until
+    enough have been seen, and the unexpected values are counted in order of first appearance, which is the order
+    in which ties between equally common values are broken.
+    """
+
+    def __init__(
+        self, func, column, result_format, row_condition, condition_parser, kwargs
+    ):
+        self.func = func
+        self.column = column
+        self.row_condition = row_condition
+        self.condition_parser = condition_parser
+        self.kwargs = kwargs
+        self.result_format = dict(result_format)
+        self.ignore_nulls = func.__name__ not in [
+            "expect_column_values_to_not_be_null",
+            "expect_column_values_to_be_null",
+        ]
+        if not self.ignore_nulls:
+            # see MetaPandasDataset.column_map_expectation
+            self.result_format["partial_unexpected_count"] = 0
+
+        self.collect_all_unexpected_values = self.result_format[
+            "result_format"
+        ] == "COMPLETE" or (
+            self.result_format["result_format"] == "SUMMARY"
+            and "output_strftime_format" in kwargs
+        )
+        self.count_unexpected_values = (
+            not self.collect_all_unexpected_values
+            and self.result_format["result_format"] == "SUMMARY"
+            and self.result_format["partial_unexpected_count"] > 0
+        )
+
+        self.element_count = 0
+        self.nonnull_count = 0
+        self.success_count = 0
+        self.unexpected_count = 0
+        self.unexpected_list = []
+        self.unexpected_index_list = []
+        self.unexpected_value_counts = Counter()
+        self._filtered_row_count = 0
+
+    def update(self, chunk_dataset):
+        if self.row_condition:
+            data = chunk_dataset._apply_row_condition(
+                row_condition=self.row_condition,
+                condition_parser=self.condition_parser,
+            )
+            # _apply_row_condition renumbers the rows of the chunk; continue the numbering of the previous chunks
+            data.index = pd.RangeIndex(
+                self._filtered_row_count, self._filtered_row_count + len(data)
+            )
+            self._filtered_row_count += len(data)
+        else:
+            data = chunk_dataset
+
+        series = data[self.column]
+        if self.ignore_nulls:
+            boolean_mapped_null_values = series.isnull().values
+        else:
+            boolean_mapped_null_values = np.full(series.shape, False)
+
+        self.element_count += int(len(series))
+        nonnull_values = series[boolean_mapped_null_values == False]
+        self.nonnull_count += int((boolean_mapped_null_values == False).sum())
+
+        boolean_mapped_success_values = self.func(
+            chunk_dataset, nonnull_values, **self.kwargs
+        )
+        self.success_count += int(np.count_nonzero(boolean_mapped_success_values))
+        boolean_mapped_unexpected_values = np.asarray(
+            boolean_mapped_success_values == False
+        )
+        self.unexpected_count += int(np.count_nonzero(boolean_mapped_unexpected_values))
+
+        if self.collect_all_unexpected_values:
+            unexpected_values = nonnull_values[boolean_mapped_unexpected_values]
+            self.unexpected_list.extend(unexpected_values)
+            self.unexpected_index_list.extend(unexpected_values.index)
+            return
+
+        missing_partial_count = self.result_format["partial_unexpected_count"] - len(
+            self.unexpected_list
+        )
+        if missing_partial_count > 0:
+            partial_unexpected_values = nonnull_values.iloc[
+                np.flatnonzero(boolean_mapped_unexpected_values)[:missing_partial_count]
+            ]
+            self.unexpected_list.extend(partial_unexpected_values)
+            self.unexpected_index_list.extend(partial_unexpected_values.index)
+
+        if self.count_unexpected_values and self.unexpected_value_counts is not None:
+            try:
+                codes, uniques = pd.factorize(
+                    nonnull_values[boolean_mapped_unexpected_values]
+                )
+            except TypeError:
+                # unhashable values; _format_map_output reports that they cannot be counted
+                self.unexpected_value_counts = None
+                return
+            for value, count in zip(
+                uniques, np.bincount(codes, minlength=len(uniques))
+            ):
+                self.unexpected_value_counts[value] += int(count)
+
+    def get_partial_unexpected_counts(self):
+        if not self.count_unexpected_values or self.unexpected_value_counts is None:
+            return None
+        return [
+            {"value": value, "count": count}
+            for value, count in sorted(
+                self.unexpected_value_counts.most_common(
+                    self.result_format["partial_unexpected_count"]
+                ),
+                key=lambda x: (-x[1], str(x[0])),
+            )
+        ]
+
+
+class _ColumnSummaryAccumulator:
+    """Accumulates the column_summary metric bundle and the sum of a column over the chunks of a file.
+
+    Means and variances are merged with the pairwise update of Chan et al., so that a single pass is enough. Without
+    summarize, only the non-null values are counted; the sum of numeric columns is only computed with compute_sum.
+    """
+
+    def __init__(self, column, summarize=True, compute_sum=False):
+        self.column = column
+        self.summarize = summarize
+        self.compute_sum = compute_sum
+        self.nonnull_count = 0
+        self.min = None
+        self.max = None
+        self.sum = 0
+        self.comparable = True
+        self.numeric = True
+        self.mean = 0.0
+        self.sum_of_squared_deviations = 0.0
+
+    def update(self, chunk):
+        nonnull_values = chunk[self.column].dropna()
+        if len(nonnull_values) == 0:
+            return
+        if not pd.api.types.is_numeric_dtype(nonnull_values.dtype):
+            self.numeric = False
+
+        if self.summarize and self.comparable:
+            try:
+                chunk_min = nonnull_values.min()
+                chunk_max = nonnull_values.max()
+                self.min = chunk_min if self.min is None else min(self.min, chunk_min)
+                self.max = chunk_max if self.max is None else max(self.max, chunk_max)
+            except TypeError:
+                self.comparable = False
+
+        # summing the values of other types (e.g. concatenating strings) is costly, and the sum is not used
+        if self.compute_sum and self.numeric:
+            self.sum = self.sum + nonnull_values.sum()
+
+        if self.summarize and self.numeric:
+            values = nonnull_values.astype("float64")
+            count = len(values)
+            chunk_mean = values.mean()
+            chunk_sum_of_squared_deviations = ((values - chunk_mean) ** 2).sum()
+            total_count = self.nonnull_count + count
+            delta = chunk_mean - self.mean
+            self.mean += delta * count / total_count
+            self.sum_of_squared_deviations += (
+                chunk_sum_of_squared_deviations
+                + delta ** 2 * self.nonnull_count * count / total_count
+            )
+        self.nonnull_count += len(nonnull_values)
+
+    def get_column_sum(self):
+        """Return the sum of the column, or None if it was not computed or the column is not numeric."""
+        if not self.compute_sum or not self.numeric:
+            return None
+        return self.sum
+
+    def get_column_summary(self):
+        column_summary = {"column_nonnull_count": self.nonnull_count}
+        if self.comparable:
+            column_summary["column_min"] = np.nan if self.min is None else self.min
+            column_summary["column_max"] = np.nan if self.max is None else self.max
+        if self.numeric:
+            column_summary["column_mean"] = (
+                self.mean if self.nonnull_count > 0 else np.nan
+            )
+            column_summary["column_stdev"] = (
+                math.sqrt(self.sum_of_squared_deviations / (self.nonnull_count - 1))
+                if self.nonnull_count > 1
+                else np.nan
+            )
+        return column_summary
+
+
+class _ValueCountsAccumulator:
+    """Accumulates the frequency of each non-null value of a column over the chunks of a file.
+
+    Memory use is proportional to the number of distinct values, not to the number of rows.
+    """
+
+    def __init__(self, column):
+        self.column = column
+        self.value_counts = Counter()
+
+    def update(self, chunk):
+        for value, count in chunk[self.column].value_counts(sort=False).items():
+            self.value_counts[value] += int(count)
+
+    def get_value_counts(self):
+        return pd.Series(
+            list(self.value_counts.values()),
+            index=list(self.value_counts.keys()),
+            dtype="int64",
+        )
+
+
+class _QuantileSketchAccumulator:
+    """Accumulates a quantile sketch of a column over the chunks of a file, merging the sketch of each chunk.
+
+    Unlike value counts, memory use does not depend on the number of distinct values.
+    """
+
+    def __init__(self, column, relative_error):
+        self.column = column
+        self.relative_error = relative_error
+        self.sketch = KLLSketch.from_relative_error(relative_error)
+
+    def update(self, chunk):
+        self.sketch.merge(
+            KLLSketch.from_relative_error(self.relative_error).update(
+                chunk[self.column].dropna().values
+            )
+        )
+
+
+class _CardinalitySketchAccumulator:
+    """Accumulates a HyperLogLog sketch of a column over the chunks of a file."""
+
+    def __init__(self, column, relative_error):
+        self.column = column
+        self.relative_error = relative_error
+        self.sketch = HyperLogLog.from_relative_error(relative_error)
+
+    def update(self, chunk):
+        self.sketch.update(chunk[self.column].dropna().values)
+
+
+class MetaChunkedPandasDataset(Dataset):
+    """MetaChunkedPandasDataset is a thin layer between Dataset and ChunkedPandasDataset.
+
+    It applies the row-wise functions of PandasDataset's column map expectations to a file chunk by chunk.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def column_map_expectation(cls, func):
+        """Constructs an expectation using column-map semantics, evaluated over the chunks of a file.
+
+        func is the function implementing the expectation for PandasDataset (see
+        MetaPandasDataset.column_map_expectation): it receives a pandas Series holding the non-null values of one
+        chunk. Counts, unexpected values and their indexes are merged across chunks, so the result is the same as
+        validating the file loaded in a single PandasDataset. When validate has already computed them in its single
+        pass over the file (see ChunkedPandasDataset._prepare_validation), they are not computed again.
+        """
+        argspec = inspect.getfullargspec(func)[0][1:]
+
+        @cls.expectation(argspec)
+        @wraps(func)
+        def inner_wrapper(
+            self,
+            column,
+            mostly=None,
+            result_format=None,
+            row_condition=None,
+            condition_parser=None,
+            *args,
+            **kwargs,
+        ):
+            if args:
+                # name the remaining positional arguments, which follow column in the signature of func
+                kwargs.update(zip(argspec[1 : 1 + len(args)], args))
+
+            if result_format is None:
+                result_format = self.default_expectation_args["result_format"]
+            result_format = parse_result_format(result_format)
+
+            key = self._get_column_map_key(
+                func.__name__,
+                column,
+                result_format,
+                row_condition,
+                condition_parser,
+                kwargs,
+            )
+            validation_run = self._get_active_validation_run()
+            if validation_run is not None and key in validation_run.metrics:
+                accumulator = validation_run.metrics[key]
+            else:
+                accumulator = _ColumnMapAccumulator(
+                    func, column, result_format, row_condition, condition_parser, kwargs
+                )
+                for chunk in self._batch_reference.iter_chunks(
+                    columns=self._get_chunk_columns([column], row_condition)
+                ):
+                    accumulator.update(PandasDataset(chunk))
+
+            unexpected_list = accumulator.unexpected_list
+            if "output_strftime_format" in kwargs:
+                output_strftime_format = kwargs["output_strftime_format"]
+                parsed_unexpected_list = []
+                for val in unexpected_list:
+                    if val is None:
+                        parsed_unexpected_list.append(val)
+                    else:
+                        if isinstance(val, str):
+                            val = parse(val)
+                        parsed_unexpected_list.append(
+                            datetime.strftime(val, output_strftime_format)
+                        )
+                unexpected_list = parsed_unexpected_list
+
+            success, percent_success = self._calc_map_expectation_success(
+                accumulator.success_count, accumulator.nonnull_count, mostly
+            )
+
+            return_obj = self._format_map_output(
+                accumulator.result_format,
+                success,
+                accumulator.element_count,
+                accumulator.nonnull_count,
+                accumulator.unexpected_count,
+                unexpected_list,
+                accumulator.unexpected_index_list,
+                partial_unexpected_counts=accumulator.get_partial_unexpected_counts(),
+            )
+
+            # FIXME Temp fix for result format
+            if func.__name__ in [
+                "expect_column_values_to_not_be_null",
+                "expect_column_values_to_be_null",
+            ]:
+                del return_obj["result"]["unexpected_percent_nonmissing"]
+                del return_obj["result"]["missing_count"]
+                del return_obj["result"]["missing_percent"]
+                try:
+                    del return_obj["result"]["partial_unexpected_counts"]
+                    del return_obj["result"]["partial_unexpected_list"]
+                except KeyError:
+                    pass
+
+            return return_obj
+
+        inner_wrapper.__name__ = func.__name__
+        inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper._column_map_condition_func = func
+
+        return inner_wrapper
+
+
+class ChunkedPandasDataset(MetaChunkedPandasDataset):
+    """
+ChunkedPandasDataset validates a CSV or Parquet file that does not fit in memory by streaming it in chunks.
+
+The file is described by a ChunkedPandasBatchReference; PandasDatasource returns one from get_batch when the batch_kwargs
+include a chunksize. Row-wise column map expectations reuse the PandasDataset implementations one chunk at a time, and
+the metrics used by the other expectations (row counts, min, max, mean, standard deviation, sums and value counts) are
+merged across chunks. During validate, the metrics needed by the whole suite are computed in a single pass over the
+file.
+
+Notes:
+    1. Results are the same as validating the file loaded into a single PandasDataset, except for the last digits of
+       floating-point means and standard deviations, which are summed in a different order.
+    2. Value counts (and the expectations based on them, such as median, quantiles and distinct values) hold every
+       distinct value of the column in memory. With allow_relative_error, quantiles and distinct counts use
+       sketches instead.
+    3. pandas infers column types chunk by chunk; pass a dtype in the reader_options when that could differ between
+       chunks.
+    4. Expectations whose outcome for a row depends on other rows (e.g. expect_column_values_to_be_unique), and those
+       that need the whole column in memory, raise NotImplementedError.
+    """
+
+    # Row-wise column map expectations of PandasDataset that can be evaluated chunk by chunk
+    chunked_column_map_expectations = [
+        "expect_column_values_to_not_be_null",
+        "expect_column_values_to_be_null",
+        "expect_column_values_to_be_in_set",
+        "expect_column_values_to_not_be_in_set",
+        "expect_column_values_to_be_between",
+        "expect_column_value_lengths_to_be_between",
+        "expect_column_value_lengths_to_equal",
+        "expect_column_values_to_match_regex",
+        "expect_column_values_to_not_match_regex",
+        "expect_column_values_to_match_regex_list",
+        "expect_column_values_to_not_match_regex_list",
+        "expect_column_values_to_match_strftime_format",
+        "expect_column_values_to_be_dateutil_parseable",
+        "expect_column_values_to_be_json_parseable",
+        "expect_column_values_to_match_json_schema",
+    ]
+
+    # Expectations that use the value counts of their column
+    value_counts_expectations = [
+        "expect_column_distinct_values_to_be_in_set",
+        "expect_column_distinct_values_to_equal_set",
+        "expect_column_distinct_values_to_contain_set",
+        "expect_column_median_to_be_between",
+        "expect_column_quantile_values_to_be_between",
+        "expect_column_unique_value_count_to_be_between",
+        "expect_column_proportion_of_unique_values_to_be_between",
+        "expect_column_most_common_value_to_be_in_set",
+        "expect_column_chisquare_test_p_value_to_be_greater_than",
+    ]
+
+    # Expectations that use the column summary (see get_column_summary) of their column
+    column_summary_expectations = [
+        "expect_column_min_to_be_between",
+        "expect_column_max_to_be_between",
+        "expect_column_mean_to_be_between",
+        "expect_column_stdev_to_be_between",
+        "expect_column_sum_to_be_between",
+    ]
+
+    # Column aggregate expectations, which report the number of non-null values of their column
+    column_aggregate_expectations = (
+        column_summary_expectations
+        + value_counts_expectations
+        + ["expect_column_kl_divergence_to_be_less_than"]
+    )
+
+    # Expectations that count the distinct values of their column, from a HyperLogLog sketch with allow_relative_error
+    cardinality_expectations = [
+        "expect_column_unique_value_count_to_be_between",
+        "expect_column_proportion_of_unique_values_to_be_between",
+    ]
+
+    def __init__(self, batch_reference, *args, **kwargs):
+        if not isinstance(batch_reference, ChunkedPandasBatchReference):
+            raise ValueError(
+                "ChunkedPandasDataset requires a ChunkedPandasBatchReference"
+            )
+        self._batch_reference = batch_reference
+        super().__init__(*args, **kwargs)
+
+    @staticmethod
+    def _get_column_map_key(
+        expectation_name,
+        column,
+        result_format,
+        row_condition,
+        condition_parser,
+        kwargs,
+    ):
+        return (
+            "column_map",
+            expectation_name,
+            str(column),
+            json.dumps(
+                [result_format, row_condition, condition_parser, kwargs],
+                sort_keys=True,
+                default=str,
+            ),
+        )
+
+    def _get_chunk_columns(self, columns, row_condition=None):
+        """Return the columns to read for an expectation on columns, or None to read them all."""
+        if row_condition:
+            # the row condition may refer to any column
+            return None
+        table_columns = self.get_table_columns()
+        return [column for column in table_columns if column in columns] or None
+
+    def _prepare_validation(self, expectations, evaluation_parameters):
+        """Compute the metrics needed by the suite in a single pass over the file.
+
+        Column map expectations are accumulated chunk by chunk along with the row count, and the column summaries,
+        sums and value counts used by the other column expectations. Expectations that cannot be planned (for example,
+        because an evaluation parameter is missing) or whose accumulation fails are left to their own pass over the
+        file, which reports errors as before.
+        """
+        if not self._config.get("interactive_evaluation", True):
+            return
+        validation_run = self._get_active_validation_run()
+        table_columns = self.get_table_columns()
+
+        map_accumulators = {}
+        summary_accumulators = {}
+        value_counts_accumulators = {}
+        sketch_accumulators = {}
+        for expectation in expectations:
+            expectation_method = getattr(self, expectation.expectation_type, None)
+            if expectation_method is None:
+                continue
+            try:
+                evaluation_args, _ = build_evaluation_parameters(
+                    expectation.kwargs,
+                    evaluation_parameters,
+                    True,
+                    self._get_validation_data_context(),
+                )
+            except Exception:
+                continue
+            column = evaluation_args.pop("column", None)
+            if not isinstance(column, str) or column not in table_columns:
+                continue
+
+            condition_func = getattr(
+                expectation_method, "_column_map_condition_func", None
+            )
+            if condition_func is not None:
+                for arg in ["include_config", "catch_exceptions", "meta", "mostly"]:
+                    evaluation_args.pop(arg, None)
+                row_condition = evaluation_args.pop("row_condition", None)
+                if row_condition:
+                    continue
+                condition_parser = evaluation_args.pop("condition_parser", None)
+                result_format = parse_result_format(
+                    evaluation_args.pop("result_format", None)
+                    or self.default_expectation_args["result_format"]
+                )
+                key = self._get_column_map_key(
+                    condition_func.__name__,
+                    column,
+                    result_format,
+                    row_condition,
+                    condition_parser,
+                    evaluation_args,
+                )
+                map_accumulators[key] = _ColumnMapAccumulator(
+                    condition_func,
+                    column,
+                    result_format,
+                    row_condition,
+                    condition_parser,
+                    evaluation_args,
+                )
+            elif expectation.expectation_type in self.column_aggregate_expectations:
+                summary_accumulator = summary_accumulators.setdefault(
+                    column, _ColumnSummaryAccumulator(column, summarize=False)
+                )
+                if expectation.expectation_type in self.column_summary_expectations:
+                    summary_accumulator.summarize = True
+                if expectation.expectation_type == "expect_column_sum_to_be_between":
+                    summary_accumulator.compute_sum = True
+                try:
+                    relative_error = get_relative_error(
+                        evaluation_args.get("allow_relative_error")
+                    )
+                except ValueError:
+                    continue
+                if relative_error is not None:
+                    if expectation.expectation_type in self.cardinality_expectations:
+                        sketch_accumulators[
+                            ("column_cardinality_sketch", column, relative_error)
+                        ] = _CardinalitySketchAccumulator(column, relative_error)
+                    else:
+                        sketch_accumulators[
+                            ("column_quantile_sketch", column, relative_error)
+                        ] = _QuantileSketchAccumulator(column, relative_error)
+                elif expectation.expectation_type in self.value_counts_expectations:
+                    value_counts_accumulators[column] = _ValueCountsAccumulator(column)
+
+        if not (map_accumulators or summary_accumulators):
+            return
+
+        accumulators = (
+            list(map_accumulators.values())
+            + list(summary_accumulators.values())
+            + list(value_counts_accumulators.values())
+            + list(sketch_accumulators.values())
+        )
+        columns = {accumulator.column for accumulator in accumulators}
+        failed_accumulators = set()
+        row_count = 0
+        try:
+            for chunk in self._batch_reference.iter_chunks(
+                columns=[column for column in table_columns if column in columns]
+            ):
+                row_count += len(chunk)
+                chunk_dataset = PandasDataset(chunk) if map_accumulators else chunk
+                for accumulator in accumulators:
+                    if id(accumulator) in failed_accumulators:
+                        continue
+                    try:
+                        if isinstance(accumulator, _ColumnMapAccumulator):
+                            accumulator.update(chunk_dataset)
+                        else:
+                            accumulator.update(chunk)
+                    except Exception as e:
+                        logger.debug(
+                            "Unable to accumulate a metric for column {}; it will be computed on its own: {}".format(
+                                accumulator.column, e
+                            )
+                        )
+                        failed_accumulators.add(id(accumulator))
+        except Exception as e:
+            logger.debug(
+                "Unable to read {} in chunks for validation; metrics will be computed one at a time: {}".format(
+                    self._batch_reference.path, e
+                )
+            )
+            return
+
+        metrics = validation_run.metrics
+        metrics[("row_count",)] = row_count
+        for key, accumulator in map_accumulators.items():
+            if id(accumulator) not in failed_accumulators:
+                metrics[key] = accumulator
+        for column, accumulator in summary_accumulators.items():
+            if id(accumulator) not in failed_accumulators:
+                metrics[("column_nonnull_count", column)] = accumulator.nonnull_count
+                if self.caching:
+                    # the cached getter of the nonnull count would compute the whole column summary on a miss
+                    self._metric_cache.set(
+                        ("column_nonnull_count", column), accumulator.nonnull_count
+                    )
+                if accumulator.summarize:
+                    metrics[
+                        ("column_summary", column)
+                    ] = accumulator.get_column_summary()
+                if accumulator.get_column_sum() is not None:
+                    metrics[("column_sum", column)] = accumulator.get_column_sum()
+        for column, accumulator in value_counts_accumulators.items():
+            if id(accumulator) not in failed_accumulators:
+                metrics[
+                    ("column_value_counts", column)
+                ] = accumulator.get_value_counts()
+        for key, accumulator in sketch_accumulators.items():
+            if id(accumulator) not in failed_accumulators:
+                metrics[key] = accumulator.sketch
+
+    def _get_validation_metric(self, key):
+        """Return a metric computed by _prepare_validation, raising KeyError if it was not computed."""
+        validation_run = self._get_active_validation_run()
+        if validation_run is None:
+            raise KeyError(key)
+        return validation_run.metrics[key]
+
+    def _accumulate(self, accumulator):
+        for chunk in self._batch_reference.iter_chunks(columns=[accumulator.column]):
+            accumulator.update(chunk)
+        return accumulator
+
+    def _iter_column_chunks(self, column):
+        for chunk in self._batch_reference.iter_chunks(columns=[column]):
+            yield chunk[column]
+
+    def head(self, n=5):
+        """Returns a *PandasDataset* with the first *n* rows of the given Dataset"""
+        return PandasDataset(
+            self._batch_reference.head(n),
+            expectation_suite=self.get_expectation_suite(
+                discard_failed_expectations=False,
+                discard_result_format_kwargs=False,
+                discard_catch_exceptions_kwargs=False,
+                discard_include_config_kwargs=False,
+            ),
+        )
+
+    def get_row_count(self):
+        try:
+            return self._get_validation_metric(("row_count",))
+        except KeyError:
+            pass
+        table_columns = self.get_table_columns()
+        return sum(
+            len(chunk)
+            for chunk in self._batch_reference.iter_chunks(
+                columns=table_columns[:1] or None
+            )
+        )
+
+    def get_column_count(self):
+        return len(self.get_table_columns())
+
+    def get_table_columns(self) -> List[str]:
+        return self._batch_reference.get_columns()
+
+    def get_column_summary(self, column):
+        try:
+            return self._get_validation_metric(("column_summary", column))
+        except KeyError:
+            return self._accumulate(
+                _ColumnSummaryAccumulator(column)
+            ).get_column_summary()
+
+    def get_column_profile_metrics(self, columns):
+        """Compute the column summary and the number of distinct values of every column in a single pass over the
+        file. Columns whose accumulation fails are left to their own getters."""
+        table_columns = self.get_table_columns()
+        columns = [column for column in table_columns if column in columns]
+        accumulators = [
+            accumulator
+            for column in columns
+            for accumulator in [
+                _ColumnSummaryAccumulator(column),
+                _ValueCountsAccumulator(column),
+            ]
+        ]
+        failed_columns = set()
+        for chunk in self._batch_reference.iter_chunks(columns=columns or None):
+            for accumulator in accumulators:
+                if accumulator.column in failed_columns:
+                    continue
+                try:
+                    accumulator.update(chunk)
+                except Exception as e:
+                    logger.debug(
+                        "Unable to accumulate profile metrics for column {}; they will be computed on their own: {}".format(
+                            accumulator.column, e
+                        )
+                    )
+                    failed_columns.add(accumulator.column)
+
+        column_profile_metrics = {}
+        for summary_accumulator, value_counts_accumulator in zip(
+            accumulators[::2], accumulators[1::2]
+        ):
+            column = summary_accumulator.column
+            if column in failed_columns:
+                continue
+            column_metrics = summary_accumulator.get_column_summary()
+            column_metrics[
+                "column_unique_count"
+            ] = value_counts_accumulator.get_value_counts().shape[0]
+            column_profile_metrics[column] = column_metrics
+        return column_profile_metrics
+
+    def _get_column_summary_metric(self, column, metric_name):
+        column_summary = self.get_column_summary(column)
+        if metric_name not in column_summary:
+            raise TypeError(
+                "Unable to compute {} for column {}".format(metric_name, column)
+            )
+        return column_summary[metric_name]
+
+    def get_column_nonnull_count(self, column):
+        try:
+            return self._get_validation_metric(("column_nonnull_count", column))
+        except KeyError:
+            pass
+        return self._get_column_summary_metric(column, "column_nonnull_count")
+
+    def get_column_mean(self, column):
+        return self._get_column_summary_metric(column, "column_mean")
+
+    def get_column_stdev(self, column):
+        return self._get_column_summary_metric(column, "column_stdev")
+
+    def get_column_max(self, column, parse_strings_as_datetimes=False):
+        if not parse_strings_as_datetimes:
+            return self._get_column_summary_metric(column, "column_max")
+        chunk_maxes = [
+            series.dropna().map(parse).max()
+            for series in self._iter_column_chunks(column)
+            if series.notnull().any()
+        ]
+        return max(chunk_maxes) if chunk_maxes else np.nan
+
+    def get_column_min(self, column, parse_strings_as_datetimes=False):
+        if not parse_strings_as_datetimes:
+            return self._get_column_summary_metric(column, "column_min")
+        chunk_mins = [
+            series.dropna().map(parse).min()
+            for series in self._iter_column_chunks(column)
+            if series.notnull().any()
+        ]
+        return min(chunk_mins) if chunk_mins else np.nan
+
+    def get_column_sum(self, column):
+        try:
+            return self._get_validation_metric(("column_sum", column))
+        except KeyError:
+            pass
+        return reduce(
+            lambda total, chunk_sum: total + chunk_sum,
+            (series.sum() for series in self._iter_column_chunks(column)),
+            0,
+        )
+
+    def _get_value_counts(self, column):
+        try:
+            return self._get_validation_metric(("column_value_counts", column))
+        except KeyError:
+            return self._accumulate(_ValueCountsAccumulator(column)).get_value_counts()
+
+    def get_column_value_counts(self, column, sort="value", collate=None):
+        if sort not in ["value", "count", "none"]:
+            raise ValueError("sort must be either 'value', 'count', or 'none'")
+        if collate is not None:
+            raise ValueError(
+                "collate parameter is not supported in ChunkedPandasDataset"
+            )
+        counts = self._get_value_counts(column).sort_values(
+            ascending=False, kind="mergesort"
+        )
+        if sort == "value":
+            try:
+                counts.sort_index(inplace=True)
+            except TypeError:
+                # Having values of multiple types (e.g., strings and floats) raises a TypeError when the sorting
+                # method performs comparisons.
+                counts.index = counts.index.astype(str)
+                counts.sort_index(inplace=True)
+        counts.name = "count"
+        counts.index.name = "value"
+        return counts
+
+    def get_column_unique_count(self, column, allow_relative_error=False):
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is not None:
+            return min(
+                int(
+                    round(
+                        self.get_column_cardinality_sketch(
+                            column, relative_error
+                        ).get_cardinality()
+                    )
+                ),
+                self.get_column_nonnull_count(column),
+            )
+        return self._get_value_counts(column).shape[0]
+
+    def get_column_unique_count_relative_error(
+        self, column, allow_relative_error=False
+    ):
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is None:
+            return None
+        return HyperLogLog.from_relative_error(relative_error).relative_error
+
+    def get_column_cardinality_sketch(
+        self, column, relative_error=DEFAULT_RELATIVE_ERROR
+    ):
+        try:
+            return self._get_validation_metric(
+                ("column_cardinality_sketch", column, relative_error)
+            )
+        except KeyError:
+            return self._accumulate(
+                _CardinalitySketchAccumulator(column, relative_error)
+            ).sketch
+
+    def get_column_modes(self, column):
+        counts = self._get_value_counts(column)
+        if counts.empty:
+            return []
+        return sorted(counts[counts == counts.max()].index)
+
+    def _get_sorted_value_counts(self, column):
+        counts = self._get_value_counts(column)
+        if not pd.api.types.is_numeric_dtype(counts.index.dtype):
+            raise TypeError(
+                "Unable to compute the median or quantiles of non-numeric column {}".format(
+                    column
+                )
+            )
+        return counts.sort_index()
+
+    @staticmethod
+    def _get_value_at_positions(sorted_counts, positions):
+        """Return the values at the given positions of the column, sorted, without materializing the column."""
+        cumulative_counts = np.cumsum(sorted_counts.values)
+        return [
+            sorted_counts.index[np.searchsorted(cumulative_counts, position, "right")]
+            for position in positions
+        ]
+
+    def get_column_median(self, column, allow_relative_error=False):
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is not None:
+            return self.get_column_quantile_sketch(column, relative_error).get_median()
+        sorted_counts = self._get_sorted_value_counts(column)
+        nonnull_count = int(sorted_counts.sum())
+        if nonnull_count == 0:
+            return np.nan
+        if nonnull_count % 2 == 1:
+            return self._get_value_at_positions(sorted_counts, [nonnull_count // 2])[0]
+        lower, upper = self._get_value_at_positions(
+            sorted_counts, [nonnull_count // 2 - 1, nonnull_count // 2]
+        )
+        return (lower + upper) / 2
+
+    def get_column_quantiles(self, column, quantiles, allow_relative_error=False):
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is not None:
+            return self.get_column_quantile_sketch(
+                column, relative_error
+            ).get_quantiles(quantiles)
+        sorted_counts = self._get_sorted_value_counts(column)
+        nonnull_count = int(sorted_counts.sum())
+        if nonnull_count == 0:
+            return [np.nan for _ in quantiles]
+        # the same positions as pandas' quantile(interpolation="nearest")
+        positions = np.around(np.asarray(quantiles) * (nonnull_count - 1)).astype(int)
+        values = self._get_value_at_positions(sorted_counts, positions)
+        return [value.item() if hasattr(value, "item") else value for value in values]
+
+    def get_column_quantile_sketch(self, column, relative_error=DEFAULT_RELATIVE_ERROR):
+        try:
+            return self._get_validation_metric(
+                ("column_quantile_sketch", column, relative_error)
+            )
+        except KeyError:
+            return self._accumulate(
+                _QuantileSketchAccumulator(column, relative_error)
+            ).sketch
+
+    def get_column_hist(self, column, bins):
+        if np.ndim(bins) == 0:
+            # np.histogram derives these edges from the min and max of the data, which are only known after a pass
+            first_edge = float(self.get_column_min(column))
+            last_edge = float(self.get_column_max(column))
+            if first_edge == last_edge:
+                first_edge -= 0.5
+                last_edge += 0.5
+            bins = np.linspace(first_edge, last_edge, bins + 1)
+        hist = np.zeros(len(bins) - 1, dtype="int64")
+        for series in self._iter_column_chunks(column):
+            hist += np.histogram(series, bins, density=False)[0]
+        return list(hist)
+
+    def get_column_count_in_range(
+        self, column, min_val=None, max_val=None, strict_min=False, strict_max=True
+    ):
+        if min_val is None and max_val is None:
+            raise ValueError("Must specify either min or max value")
+        if min_val is not None and max_val is not None and min_val > max_val:
+            raise ValueError("Min value must be <= to max value")
+
+        count = 0
+        for result in self._iter_column_chunks(column):
+            if min_val is not None:
+                if strict_min:
+                    result = result[result > min_val]
+                else:
+                    result = result[result >= min_val]
+            if max_val is not None:
+                if strict_max:
+                    result = result[result < max_val]
+                else:
+                    result = result[result <= max_val]
+            count += len(result)
+        return count
+
+
+# Add the row-wise column map expectations of PandasDataset, evaluated chunk by chunk
+for _expectation_name in ChunkedPandasDataset.chunked_column_map_expectations:
+    setattr(
+        ChunkedPandasDataset,
+        _expectation_name,
+        DocInherit(
+            MetaChunkedPandasDataset.column_map_expectation(
+                getattr(PandasDataset, _expectation_name)._column_map_condition_func
+            )
+        ),
+    )
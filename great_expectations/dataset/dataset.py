@@ -13,6 +13,17 @@ from scipy import stats
 
 from great_expectations.data_asset.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
+from great_expectations.dataset.cardinality_sketch import HyperLogLog
+from great_expectations.dataset.metrics import (
+    BUNDLED_GETTER_METRICS,
+    MetricCache,
+    get_metric_bundle_name,
+)
+from great_expectations.dataset.quantile_sketch import (
+    DEFAULT_RELATIVE_ERROR,
+    KLLSketch,
+    get_relative_error,
+)
 from great_expectations.dataset.util import (
     build_categorical_partition_object,
     build_continuous_partition_object,
@@ -235,14 +246,77 @@ class Dataset(MetaDataset):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self.caching = kwargs.pop("caching", True)
+        metric_cache_size = kwargs.pop("metric_cache_size", None)
+        # the profiler validates the dataset, which reads the metric cache, so it is run here once the cache is
+        # created rather than by DataAsset.__init__
+        profiler = kwargs.pop("profiler", None)
 
         super().__init__(*args, **kwargs)
 
+        self._metric_cache = MetricCache(max_size=metric_cache_size)
         if self.caching:
             for func in self.hashable_getters:
-                caching_func = lru_cache(maxsize=None)(getattr(self, func))
+                if func in BUNDLED_GETTER_METRICS:
+                    caching_func = self._get_bundled_getter(func)
+                else:
+                    caching_func = lru_cache(maxsize=None)(getattr(self, func))
                 setattr(self, func, caching_func)
 
+        if profiler is not None:
+            profiler.profile(self)
+
+    def _get_bundled_getter(self, getter_name):
+        """Wrap a getter whose metric belongs to a bundle so that it is served from the metric cache.
+
+        On a miss, the whole bundle is computed at once (e.g. get_column_summary for the column_summary bundle) and
+        every metric of the bundle is cached, so that subsequent getters for the same column do not touch the data.
+        Metrics the bundle could not compute, and calls with non-default arguments (e.g.
+        parse_strings_as_datetimes=True), fall back to the getter itself.
+        """
+        getter = getattr(self, getter_name)
+        metric_name = BUNDLED_GETTER_METRICS[getter_name]
+        bundle_name = get_metric_bundle_name(metric_name)
+
+        @wraps(getter)
+        def bundled_getter(column, *args, **kwargs):
+            uses_default_args = not any(args) and not any(kwargs.values())
+            if uses_default_args:
+                key = (metric_name, column)
+            else:
+                key = (metric_name, column) + args + tuple(sorted(kwargs.items()))
+
+            try:
+                return self._metric_cache.get(key)
+            except KeyError:
+                pass
+
+            if uses_default_args and bundle_name == "column_summary":
+                try:
+                    column_summary = self.get_column_summary(column)
+                except NotImplementedError:
+                    column_summary = {}
+                except Exception as e:
+                    logger.debug(
+                        "Unable to compute the {} bundle for column {}; computing {} on its own: {}".format(
+                            bundle_name, column, metric_name, e
+                        )
+                    )
+                    column_summary = {}
+                for bundle_metric_name, value in column_summary.items():
+                    self._metric_cache.set((bundle_metric_name, column), value)
+                if metric_name in column_summary:
+                    return column_summary[metric_name]
+
+            value = getter(column, *args, **kwargs)
+            self._metric_cache.set(key, value)
+            return value
+
+        return bundled_getter
+
+    def get_metric_cache_statistics(self):
+        """Returns: dict with the hits, misses, evictions, size and max_size of the metric cache"""
+        return self._metric_cache.statistics
+
     @classmethod
     def from_dataset(cls, dataset=None):
         """This base implementation naively passes arguments on to the real constructor, which
@@ -298,16 +372,66 @@ class Dataset(MetaDataset):
         """Returns: any"""
         raise NotImplementedError
 
-    def get_column_unique_count(self, column):
-        """Returns: int"""
+    def get_column_unique_count(self, column, allow_relative_error=False):
+        """Get the number of distinct non-null values of a column
+
+        Args:
+            column (string): name of column
+            allow_relative_error (boolean or float): False for the exact count; True or a fraction between 0 and 1 \
+            to allow the count to be estimated, with that relative standard error, from a HyperLogLog sketch (or the \
+            backend's own approximate distinct count)
+
+        Returns:
+            int
+        """
+        raise NotImplementedError
+
+    def get_column_unique_count_relative_error(
+        self, column, allow_relative_error=False
+    ):
+        """Get the relative standard error achieved by get_column_unique_count with the same arguments
+
+        Args:
+            column (string): name of column
+            allow_relative_error (boolean or float): as passed to get_column_unique_count
+
+        Returns:
+            float or None: the relative standard error of the estimated count, or None if the count is exact
+        """
+        raise NotImplementedError
+
+    def get_column_cardinality_sketch(
+        self, column, relative_error=DEFAULT_RELATIVE_ERROR
+    ) -> HyperLogLog:
+        """Summarize the distinct non-null values of a column in a mergeable HyperLogLog sketch.
+
+        Sketches of different batches, chunks or partitions of a column can be merged (see HyperLogLog.merge).
+
+        Args:
+            column (string): name of column
+            relative_error (float): the relative standard error allowed in the number of distinct values
+
+        Returns:
+            HyperLogLog
+        """
         raise NotImplementedError
 
     def get_column_modes(self, column):
         """Returns: List[any], list of modes (ties OK)"""
         raise NotImplementedError
 
-    def get_column_median(self, column):
-        """Returns: any"""
+    def get_column_median(self, column, allow_relative_error=False):
+        """Get the median of a column
+
+        Args:
+            column (string): name of column
+            allow_relative_error (boolean or float): False for the exact median; True or a fraction between 0 and 1 \
+            to allow the median to be estimated, e.g. by the backend's approximate percentile function or from a \
+            quantile sketch (see get_column_quantile_sketch)
+
+        Returns:
+            any
+        """
         raise NotImplementedError
 
     def get_column_quantiles(
@@ -318,16 +442,90 @@ class Dataset(MetaDataset):
             column (string): name of column
             quantiles (tuple of float): the quantiles to return. quantiles \
             *must* be a tuple to ensure caching is possible
+            allow_relative_error (boolean or float): False for exact quantiles; True or a fraction between 0 and 1 \
+            to allow approximate quantiles, within that fraction of the row count of the exact ranks
 
         Returns:
             List[any]: the nearest values in the dataset to those quantiles
         """
         raise NotImplementedError
 
+    def get_column_quantile_sketch(
+        self, column, relative_error=DEFAULT_RELATIVE_ERROR
+    ) -> KLLSketch:
+        """Summarize the non-null values of a column in a mergeable quantile sketch, without sorting the column.
+
+        Sketches of different batches, chunks or partitions of a column can be merged (see KLLSketch.merge).
+
+        Args:
+            column (string): name of column
+            relative_error (float): the rank error allowed in the quantiles of the sketch, as a fraction of the \
+            number of values
+
+        Returns:
+            KLLSketch
+        """
+        raise NotImplementedError
+
     def get_column_stdev(self, column):
         """Returns: float"""
         raise NotImplementedError
 
+    def get_column_summary(self, column):
+        """Compute the column_summary metric bundle for a column in a single pass over the data.
+
+        Returns:
+            dict mapping the names in great_expectations.dataset.metrics.COLUMN_SUMMARY_METRICS to their values. \
+            Metrics that cannot be computed together for this column (e.g. the mean of a string column) are omitted, \
+            and will be computed by their own getter.
+        """
+        raise NotImplementedError
+
+    def get_column_profile_metrics(self, columns):
+        """Compute the metrics profilers need for each of several columns (column_profile in
+        great_expectations.dataset.metrics) in as few passes over the data as the backend allows.
+
+        Args:
+            columns (list): the names of the columns to profile
+
+        Returns:
+            dict mapping each column to a dict of metric names and values. Columns or metrics that cannot be computed \
+            together are omitted, and will be computed by their own getter.
+        """
+        raise NotImplementedError
+
+    def cache_column_profile_metrics(self, columns):
+        """Compute the metrics profilers need for several columns at once (see get_column_profile_metrics) and store
+        them in the metric cache, so that the getters, and the expectations that use them, do not touch the data
+        again. Does nothing when caching is disabled or the backend cannot compute the metrics together.
+
+        Args:
+            columns (list): the names of the columns to profile
+        """
+        if not self.caching:
+            return
+        columns = [
+            column
+            for column in columns
+            if ("column_unique_count", column) not in self._metric_cache
+        ]
+        if not columns:
+            return
+        try:
+            column_profile_metrics = self.get_column_profile_metrics(columns)
+        except NotImplementedError:
+            return
+        except Exception as e:
+            logger.debug(
+                "Unable to compute profile metrics for columns {}; they will be computed one at a time: {}".format(
+                    columns, e
+                )
+            )
+            return
+        for column, column_metrics in column_profile_metrics.items():
+            for metric_name, value in column_metrics.items():
+                self._metric_cache.set((metric_name, column), value)
+
     def get_column_partition(
         self, column, bins="uniform", n_bins=10, allow_relative_error=False
     ):
@@ -3053,6 +3251,7 @@ class Dataset(MetaDataset):
         column,
         min_value=None,
         max_value=None,
+        allow_relative_error=False,
         result_format=None,
         include_config=True,
         catch_exceptions=None,
@@ -3070,6 +3269,10 @@ class Dataset(MetaDataset):
                 The minimum number of unique values allowed.
             max_value (int or None): \
                 The maximum number of unique values allowed.
+            allow_relative_error (boolean or float): \
+                Whether to allow the number of unique values to be estimated (for example, with a HyperLogLog \
+                sketch) rather than counted exactly. True allows a relative standard error of 1%; a float between 0 \
+                and 1 sets the relative standard error.
 
         Other Parameters:
             result_format (str or None): \
@@ -3097,6 +3300,10 @@ class Dataset(MetaDataset):
 
                 {
                     "observed_value": (int) The number of unique values in the column
+                    "details": {
+                        "relative_error": (float or None) The relative standard error achieved by observed_value,
+                        or None if it was counted exactly
+                    }
                 }
 
             * min_value and max_value are both inclusive.
@@ -3108,7 +3315,13 @@ class Dataset(MetaDataset):
             <great_expectations.dataset.dataset.Dataset.expect_column_proportion_of_unique_values_to_be_between>`
 
         """
-        unique_value_count = self.get_column_unique_count(column)
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is None:
+            unique_value_count = self.get_column_unique_count(column)
+        else:
+            unique_value_count = self.get_column_unique_count(
+                column, allow_relative_error=relative_error
+            )
 
         if unique_value_count is None:
             return {"success": False, "result": {"observed_value": unique_value_count}}
@@ -3125,7 +3338,14 @@ class Dataset(MetaDataset):
 
         success = above_min and below_max
 
-        return {"success": success, "result": {"observed_value": unique_value_count}}
+        result = {"observed_value": unique_value_count}
+        if relative_error is not None:
+            result["details"] = {
+                "relative_error": self.get_column_unique_count_relative_error(
+                    column, allow_relative_error=relative_error
+                )
+            }
+        return {"success": success, "result": result}
 
     # noinspection PyUnusedLocal
     @DocInherit
@@ -3137,6 +3357,7 @@ class Dataset(MetaDataset):
         max_value=1,
         strict_min=False,
         strict_max=False,  # tolerance=1e-9,
+        allow_relative_error=False,
         result_format=None,
         include_config=True,
         catch_exceptions=None,
@@ -3162,6 +3383,10 @@ class Dataset(MetaDataset):
                 If True, the minimum proportion of unique values must be strictly larger than min_value, default=False
             strict_max (boolean):
                 If True, the maximum proportion of unique values must be strictly smaller than max_value, default=False
+            allow_relative_error (boolean or float): \
+                Whether to allow the number of unique values to be estimated (for example, with a HyperLogLog \
+                sketch) rather than counted exactly. True allows a relative standard error of 1%; a float between 0 \
+                and 1 sets the relative standard error.
 
         Other Parameters:
             result_format (str or None): \
@@ -3189,6 +3414,10 @@ class Dataset(MetaDataset):
 
                 {
                     "observed_value": (float) The proportion of unique values in the column
+                    "details": {
+                        "relative_error": (float or None) The relative standard error achieved by observed_value,
+                        or None if it was counted exactly
+                    }
                 }
 
             * min_value and max_value are both inclusive unless strict_min or strict_max are set to True.
@@ -3204,11 +3433,18 @@ class Dataset(MetaDataset):
         # Tolerance docstring for later use:
         # tolerance (float):
         #     tolerance for strict_min, strict_max, default=1e-9
-        unique_value_count = self.get_column_unique_count(column)
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is None:
+            unique_value_count = self.get_column_unique_count(column)
+        else:
+            unique_value_count = self.get_column_unique_count(
+                column, allow_relative_error=relative_error
+            )
         total_value_count = self.get_column_nonnull_count(column)
 
         if total_value_count > 0:
-            proportion_unique = float(unique_value_count) / total_value_count
+            # an estimated count may exceed the number of values
+            proportion_unique = min(float(unique_value_count) / total_value_count, 1.0)
         else:
             proportion_unique = None
 
@@ -3238,7 +3474,14 @@ class Dataset(MetaDataset):
 
         success = above_min and below_max
 
-        return {"success": success, "result": {"observed_value": proportion_unique}}
+        result = {"observed_value": proportion_unique}
+        if relative_error is not None:
+            result["details"] = {
+                "relative_error": self.get_column_unique_count_relative_error(
+                    column, allow_relative_error=relative_error
+                )
+            }
+        return {"success": success, "result": result}
 
     # noinspection PyUnusedLocal
     @DocInherit
@@ -0,0 +1,106 @@
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# Metrics that every backend can compute together, in a single pass over a column (see Dataset.get_column_summary)
+COLUMN_SUMMARY_METRICS = (
+    "column_nonnull_count",
+    "column_min",
+    "column_max",
+    "column_mean",
+    "column_stdev",
+)
+
+# Metrics that profilers need for every column of a table, and that backends can compute for many columns at once
+# (see Dataset.get_column_profile_metrics)
+COLUMN_PROFILE_METRICS = COLUMN_SUMMARY_METRICS + ("column_unique_count",)
+
+METRIC_BUNDLES = {
+    "column_summary": COLUMN_SUMMARY_METRICS,
+    "column_profile": COLUMN_PROFILE_METRICS,
+}
+
+# Dataset getters whose metric belongs to a bundle, and the name of that metric
+BUNDLED_GETTER_METRICS = {
+    "get_column_nonnull_count": "column_nonnull_count",
+    "get_column_min": "column_min",
+    "get_column_max": "column_max",
+    "get_column_mean": "column_mean",
+    "get_column_stdev": "column_stdev",
+    "get_column_unique_count": "column_unique_count",
+}
+
+
+def get_metric_bundle_name(metric_name):
+    """Return the name of the bundle that computes metric_name, or None if it is computed on its own."""
+    for bundle_name, bundle_metrics in METRIC_BUNDLES.items():
+        if metric_name in bundle_metrics:
+            return bundle_name
+    return None
+
+
+class MetricCache:
+    """A keyed cache for computed metrics, with least-recently-used eviction and hit/miss statistics.
+
+    Keys are tuples such as ("column_min", "age"). None is a valid cached value (e.g. the min of an all-null
+    column), so lookups raise KeyError on a miss rather than returning a default. The cache may be shared by the
+    threads evaluating expectations concurrently during validate.
+
+    Args:
+        max_size (int or None): the maximum number of metrics to keep; None means unbounded
+    """
+
+    def __init__(self, max_size=None):
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be a positive integer or None")
+        self._max_size = max_size
+        self._values = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key):
+        with self._lock:
+            try:
+                value = self._values[key]
+            except KeyError:
+                self._misses += 1
+                raise
+            self._values.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while self._max_size is not None and len(self._values) > self._max_size:
+                evicted_key, _ = self._values.popitem(last=False)
+                self._evictions += 1
+                logger.debug(
+                    "Evicted metric {} from the metric cache".format(evicted_key)
+                )
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    @property
+    def statistics(self):
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._values),
+                "max_size": self._max_size,
+            }
@@ -1,9 +1,11 @@
 import inspect
 import json
 import logging
+import numbers
+import re
 import warnings
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import List
 
 import jsonschema
@@ -15,6 +17,12 @@ from scipy import stats
 from great_expectations.core import ExpectationConfiguration
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
+from great_expectations.dataset.cardinality_sketch import HyperLogLog
+from great_expectations.dataset.quantile_sketch import (
+    DEFAULT_RELATIVE_ERROR,
+    KLLSketch,
+    get_relative_error,
+)
 from great_expectations.dataset.util import (
     _scipy_distribution_positional_args_from_dict,
     is_valid_continuous_partition_object,
@@ -102,12 +110,38 @@ class MetaPandasDataset(Dataset):
             boolean_mapped_success_values = func(self, nonnull_values, *args, **kwargs)
             success_count = np.count_nonzero(boolean_mapped_success_values)
 
-            unexpected_list = list(
-                nonnull_values[boolean_mapped_success_values == False]
-            )
-            unexpected_index_list = list(
-                nonnull_values[boolean_mapped_success_values == False].index
+            boolean_mapped_unexpected_values = np.asarray(
+                boolean_mapped_success_values == False
             )
+            unexpected_count = int(np.count_nonzero(boolean_mapped_unexpected_values))
+            partial_unexpected_counts = None
+
+            if result_format["result_format"] == "COMPLETE" or (
+                result_format["result_format"] == "SUMMARY"
+                and "output_strftime_format" in kwargs
+            ):
+                unexpected_values = nonnull_values[boolean_mapped_unexpected_values]
+                unexpected_list = list(unexpected_values)
+                unexpected_index_list = list(unexpected_values.index)
+            else:
+                # Only the first partial_unexpected_count unexpected values are reported, so avoid boxing every
+                # unexpected value into a python list; the most common values are counted on the numpy side.
+                partial_unexpected_positions = np.flatnonzero(
+                    boolean_mapped_unexpected_values
+                )[: result_format["partial_unexpected_count"]]
+                partial_unexpected_values = nonnull_values.iloc[
+                    partial_unexpected_positions
+                ]
+                unexpected_list = list(partial_unexpected_values)
+                unexpected_index_list = list(partial_unexpected_values.index)
+                if (
+                    result_format["result_format"] == "SUMMARY"
+                    and result_format["partial_unexpected_count"] > 0
+                ):
+                    partial_unexpected_counts = self._get_partial_unexpected_counts(
+                        nonnull_values[boolean_mapped_unexpected_values],
+                        result_format["partial_unexpected_count"],
+                    )
 
             if "output_strftime_format" in kwargs:
                 output_strftime_format = kwargs["output_strftime_format"]
@@ -132,9 +166,10 @@ class MetaPandasDataset(Dataset):
                 success,
                 element_count,
                 nonnull_count,
-                len(unexpected_list),
+                unexpected_count,
                 unexpected_list,
                 unexpected_index_list,
+                partial_unexpected_counts=partial_unexpected_counts,
             )
 
             # FIXME Temp fix for result format
@@ -155,9 +190,40 @@ class MetaPandasDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        # Expose the row-wise function so that it can also be applied chunk by chunk (see ChunkedPandasDataset)
+        inner_wrapper._column_map_condition_func = func
 
         return inner_wrapper
 
+    @staticmethod
+    def _get_partial_unexpected_counts(unexpected_values, partial_unexpected_count):
+        """Count the most common unexpected values without materializing them as a python list.
+
+        Matches the output of Counter(unexpected_list).most_common(partial_unexpected_count) as formatted by
+        _format_map_output: ties are first broken by order of appearance, then the result is sorted by descending
+        count and value. Returns None if the values are not hashable, so that _format_map_output reports the error.
+        """
+        try:
+            codes, uniques = pd.factorize(unexpected_values)
+        except TypeError:
+            return None
+        counts = np.bincount(codes, minlength=len(uniques))
+        # a stable sort keeps values with equal counts in order of first appearance, like Counter.most_common
+        most_common_positions = np.argsort(-counts, kind="stable")[
+            :partial_unexpected_count
+        ]
+        unique_values = list(uniques)
+        return [
+            {"value": value, "count": count}
+            for value, count in sorted(
+                [
+                    (unique_values[position], int(counts[position]))
+                    for position in most_common_positions
+                ],
+                key=lambda x: (-x[1], str(x[0])),
+            )
+        ]
+
     @classmethod
     def column_pair_map_expectation(cls, func):
         """
@@ -418,6 +484,31 @@ Notes:
             "discard_subset_failing_expectations", False
         )
 
+    def __reduce__(self):
+        # pandas only pickles _metadata attributes, so rebuild the dataset from its data and expectation state
+        # (e.g. to validate it in another process). The data context is deliberately not pickled.
+        return (
+            _rebuild_pandas_dataset,
+            (
+                self.__class__,
+                pd.DataFrame(self),
+                {
+                    "expectation_suite": self._expectation_suite,
+                    "batch_kwargs": self._batch_kwargs,
+                    "batch_markers": self._batch_markers,
+                    "batch_parameters": self._batch_parameters,
+                    "caching": self.caching,
+                    "interactive_evaluation": self._config.get(
+                        "interactive_evaluation", True
+                    ),
+                },
+                {
+                    "default_expectation_args": self.default_expectation_args,
+                    "discard_subset_failing_expectations": self.discard_subset_failing_expectations,
+                },
+            ),
+        )
+
     def _apply_row_condition(self, row_condition, condition_parser):
         if condition_parser not in ["python", "pandas"]:
             raise ValueError(
@@ -483,25 +574,81 @@ Notes:
         counts.index.name = "value"
         return counts
 
-    def get_column_unique_count(self, column):
+    def get_column_unique_count(self, column, allow_relative_error=False):
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is not None:
+            return min(
+                int(
+                    round(
+                        self.get_column_cardinality_sketch(
+                            column, relative_error
+                        ).get_cardinality()
+                    )
+                ),
+                self.get_column_nonnull_count(column),
+            )
         return self.get_column_value_counts(column).shape[0]
 
+    def get_column_unique_count_relative_error(
+        self, column, allow_relative_error=False
+    ):
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is None:
+            return None
+        return HyperLogLog.from_relative_error(relative_error).relative_error
+
+    def get_column_cardinality_sketch(
+        self, column, relative_error=DEFAULT_RELATIVE_ERROR
+    ):
+        return HyperLogLog.from_relative_error(relative_error).update(
+            self[column].dropna().values
+        )
+
     def get_column_modes(self, column):
         return list(self[column].mode().values)
 
-    def get_column_median(self, column):
+    def get_column_median(self, column, allow_relative_error=False):
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is not None:
+            return self.get_column_quantile_sketch(column, relative_error).get_median()
         return self[column].median()
 
     def get_column_quantiles(self, column, quantiles, allow_relative_error=False):
-        if allow_relative_error is not False:
-            raise ValueError(
-                "PandasDataset does not support relative error in column quantiles."
-            )
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is not None:
+            return self.get_column_quantile_sketch(
+                column, relative_error
+            ).get_quantiles(quantiles)
         return self[column].quantile(quantiles, interpolation="nearest").tolist()
 
+    def get_column_quantile_sketch(self, column, relative_error=DEFAULT_RELATIVE_ERROR):
+        return KLLSketch.from_relative_error(relative_error).update(
+            self[column].dropna().values
+        )
+
     def get_column_stdev(self, column):
         return self[column].std()
 
+    def get_column_summary(self, column):
+        nonnull_values = self[column].dropna()
+        column_summary = {"column_nonnull_count": len(nonnull_values)}
+        for metric_name, compute in [
+            ("column_min", nonnull_values.min),
+            ("column_max", nonnull_values.max),
+            ("column_mean", nonnull_values.mean),
+            ("column_stdev", nonnull_values.std),
+        ]:
+            if metric_name in ["column_mean", "column_stdev"] and not (
+                pd.api.types.is_numeric_dtype(nonnull_values.dtype)
+            ):
+                continue
+            try:
+                column_summary[metric_name] = compute()
+            except TypeError:
+                # e.g. values that cannot be compared with each other; left to the individual getter
+                continue
+        return column_summary
+
     def get_column_hist(self, column, bins):
         hist, bin_edges = np.histogram(self[column], bins, density=False)
         return list(hist)
@@ -1136,6 +1283,49 @@ Notes:
 
         return ~column.isin(parsed_value_set)
 
+    @staticmethod
+    def _compare_column_to_bounds(column, min_value, max_value, strict_min, strict_max):
+        """Compare a whole column to min_value and max_value at once.
+
+        The column is only compared at once when its values and the bounds are all real numbers, all datetimes (that
+        are all timezone-aware or all naive) or all strings, since the comparisons cannot raise then; otherwise None
+        is returned and the values are compared one at a time.
+        """
+        bounds = [bound for bound in (min_value, max_value) if bound is not None]
+        if pd.api.types.is_numeric_dtype(column.dtype):
+            comparable = not pd.api.types.is_complex_dtype(column.dtype) and all(
+                isinstance(bound, numbers.Real) for bound in bounds
+            )
+        elif pd.api.types.is_datetime64_any_dtype(column.dtype):
+            column_is_naive = getattr(column.dtype, "tz", None) is None
+            comparable = all(
+                isinstance(bound, datetime)
+                and (bound.tzinfo is None) == column_is_naive
+                for bound in bounds
+            )
+        elif pd.api.types.is_object_dtype(column.dtype) or pd.api.types.is_string_dtype(
+            column.dtype
+        ):
+            comparable = (
+                all(isinstance(bound, str) for bound in bounds)
+                and pd.api.types.infer_dtype(column, skipna=False) == "string"
+            )
+        else:
+            comparable = False
+        if not comparable:
+            return None
+
+        boolean_mapped_values = pd.Series(True, index=column.index)
+        if min_value is not None:
+            boolean_mapped_values &= (
+                column > min_value if strict_min else column >= min_value
+            )
+        if max_value is not None:
+            boolean_mapped_values &= (
+                column < max_value if strict_max else column <= max_value
+            )
+        return boolean_mapped_values.astype(bool)
+
     @DocInherit
     @MetaPandasDataset.column_map_expectation
     def expect_column_values_to_be_between(
@@ -1184,6 +1374,12 @@ Notes:
         if min_value is not None and max_value is not None and min_value > max_value:
             raise ValueError("min_value cannot be greater than max_value")
 
+        boolean_mapped_values = self._compare_column_to_bounds(
+            temp_column, min_value, max_value, strict_min, strict_max
+        )
+        if boolean_mapped_values is not None:
+            return boolean_mapped_values
+
         def is_between(val):
             # TODO Might be worth explicitly defining comparisons between types (for example, between strings and ints).
             # Ensure types can be compared since some types in Python 3 cannot be logically compared.
@@ -1455,19 +1651,11 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
-
-        if match_on == "any":
-            return regex_match_df.any(axis="columns")
-        elif match_on == "all":
-            return regex_match_df.all(axis="columns")
-        else:
+        if match_on not in ["any", "all"]:
             raise ValueError("match_on must be either 'any' or 'all'")
 
+        return _search_regex_list(column, regex_list, match_on)
+
     @DocInherit
     @MetaPandasDataset.column_map_expectation
     def expect_column_values_to_not_match_regex_list(
@@ -1482,12 +1670,7 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
-
-        return ~regex_match_df.any(axis="columns")
+        return ~_search_regex_list(column, regex_list, "any")
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1936,3 +2119,63 @@ Notes:
         # Do not dropna here, since we have separately dealt with na in decorator
         # Invert boolean so that duplicates are False and non-duplicates are True
         return ~column_list.duplicated(keep=False)
+
+
+# regexes that may not be searched as part of an alternation, since they use backreferences or conditional groups
+# (whose group numbers would change) or inline flags (which would apply to the whole alternation)
+_unalternable_regex = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+
+
+@lru_cache(maxsize=256)
+def _compile_regex_list(regex_list, match_on):
+    """Compile a tuple of regexes, any (or all, if match_on is "all") of which must be found in a value.
+
+    With match_on="any", the regexes that allow it are compiled into a single alternation, so that each value is
+    searched once for all of them; the others are compiled on their own.
+    """
+    if len(regex_list) == 0:
+        raise ValueError("regex_list must contain at least one regex")
+    patterns = [re.compile(regex) for regex in regex_list]
+    if match_on != "any":
+        return patterns
+    alternable_regexes = [
+        regex for regex in regex_list if not _unalternable_regex.search(regex)
+    ]
+    if len(alternable_regexes) < 2:
+        return patterns
+    try:
+        alternation = re.compile(
+            "|".join("(?:{})".format(regex) for regex in alternable_regexes)
+        )
+    except re.error:
+        # e.g. the same group name is used by several regexes
+        return patterns
+    return [alternation] + [
+        pattern
+        for regex, pattern in zip(regex_list, patterns)
+        if _unalternable_regex.search(regex)
+    ]
+
+
+def _search_regex_list(column, regex_list, match_on):
+    """Return whether any (or all, if match_on is "all") of the regexes are found in each value of a column, which is
+    converted to strings once.
+
+    Each compiled pattern is searched in a single vectorized pass over the column.
+    """
+    patterns = _compile_regex_list(tuple(regex_list), match_on)
+    values = column.astype(str)
+    found = values.str.contains(patterns[0])
+    for pattern in patterns[1:]:
+        if match_on == "any":
+            found |= values.str.contains(pattern)
+        else:
+            found &= values.str.contains(pattern)
+    return found
+
+
+def _rebuild_pandas_dataset(cls, df, init_kwargs, attributes):
+    dataset = cls(df, **init_kwargs)
+    for name, value in attributes.items():
+        setattr(dataset, name, value)
+    return dataset
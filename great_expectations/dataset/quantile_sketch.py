@@ -0,0 +1,209 @@
+import math
+
+import numpy as np
+
+# The relative error used when allow_relative_error is True rather than a fraction
+DEFAULT_RELATIVE_ERROR = 0.01
+
+
+def get_relative_error(allow_relative_error):
+    """Interpret the allow_relative_error argument of the quantile getters.
+
+    Returns:
+        None if exact quantiles are required (False, None or 0), DEFAULT_RELATIVE_ERROR for True, and the fraction
+        itself for a float between 0 and 1.
+    """
+    if allow_relative_error is None or allow_relative_error is False:
+        return None
+    if allow_relative_error is True:
+        return DEFAULT_RELATIVE_ERROR
+    if (
+        not isinstance(allow_relative_error, (float, int))
+        or allow_relative_error < 0
+        or allow_relative_error >= 1
+    ):
+        raise ValueError(
+            "allow_relative_error must be a boolean or a float between 0 and 1."
+        )
+    if allow_relative_error == 0:
+        return None
+    return float(allow_relative_error)
+
+
+class KLLSketch:
+    """A mergeable quantile sketch (Karnin, Lang and Liberty, "Optimal Quantile Approximation in Streams", 2016).
+
+    The sketch keeps a hierarchy of compactors. Values are added to the lowest one; when a compactor grows beyond
+    its capacity, it is sorted and every other value (starting at a random offset) is promoted to the next
+    compactor, where it stands for twice as many values. The sketch therefore holds O(k) values whatever the number
+    of values added, and the rank of any value is known to within about count / k.
+
+    Sketches built from separate chunks or partitions of a column can be merged, and give the same guarantees as a
+    sketch of the whole column. Values must be comparable with each other (numbers, dates or strings).
+
+    Args:
+        k (int): the capacity of the largest compactor, which controls the accuracy of the sketch
+        seed (int or None): the seed for the random offsets of compactions, for reproducible results
+    """
+
+    # the ratio between the capacities of successive compactors
+    capacity_ratio = 2.0 / 3.0
+
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self._k = int(k)
+        self._levels = [np.empty(0)]
+        self._count = 0
+        self._min = None
+        self._max = None
+        self._random = np.random.RandomState(seed)
+
+    @classmethod
+    def from_relative_error(cls, relative_error, seed=None):
+        """Build a sketch whose quantiles are within relative_error * count ranks of the exact quantiles."""
+        if not 0 < relative_error < 1:
+            raise ValueError("relative_error must be a float between 0 and 1")
+        return cls(k=max(8, int(math.ceil(2.0 / relative_error))), seed=seed)
+
+    @property
+    def k(self):
+        return self._k
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def min(self):
+        return self._min
+
+    @property
+    def max(self):
+        return self._max
+
+    def __len__(self):
+        """The number of values held by the sketch (not the number of values added to it)."""
+        return sum(len(level) for level in self._levels)
+
+    def update(self, values):
+        """Add an array of values to the sketch. Null values must have been removed.
+
+        Returns:
+            the sketch itself
+        """
+        values = np.asarray(values)
+        if values.size == 0:
+            return self
+        values = values.ravel()
+        self._update_extremes(values.min(), values.max(), values.size)
+        self._levels[0] = self._concatenate(self._levels[0], values)
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Merge the values summarized by another sketch into this one.
+
+        Returns:
+            the sketch itself
+        """
+        if other.count == 0:
+            return self
+        self._update_extremes(other.min, other.max, other.count)
+        for level_index, level in enumerate(other._levels):
+            if level_index == len(self._levels):
+                self._levels.append(level[:0])
+            self._levels[level_index] = self._concatenate(
+                self._levels[level_index], level
+            )
+        self._compress()
+        return self
+
+    def get_quantiles(self, quantiles):
+        """Return the values nearest to the given quantiles, as pandas' quantile(interpolation="nearest") would.
+
+        Quantiles 0 and 1 are exactly the minimum and maximum. Returns None for each quantile of an empty sketch.
+        """
+        if self._count == 0:
+            return [None for _ in quantiles]
+        return [
+            self._to_python(value)
+            for value in self._get_values_at_ranks(
+                [int(round(quantile * (self._count - 1))) for quantile in quantiles]
+            )
+        ]
+
+    def get_median(self):
+        """Return the median, averaging the two central values when the count is even. None for an empty sketch."""
+        if self._count == 0:
+            return None
+        if self._count % 2 == 1:
+            return self._to_python(self._get_values_at_ranks([self._count // 2])[0])
+        lower, upper = self._get_values_at_ranks(
+            [self._count // 2 - 1, self._count // 2]
+        )
+        return self._to_python((lower + upper) / 2)
+
+    def _get_values_at_ranks(self, ranks):
+        items = np.concatenate([level for level in self._levels if len(level)])
+        weights = np.concatenate(
+            [
+                np.full(len(level), 2 ** level_index, dtype="int64")
+                for level_index, level in enumerate(self._levels)
+                if len(level)
+            ]
+        )
+        order = np.argsort(items, kind="mergesort")
+        items = items[order]
+        # compactions preserve the total weight, so the cumulative weights are ranks among the count values
+        cumulative_weights = np.cumsum(weights[order])
+        values = []
+        for rank in ranks:
+            if rank <= 0:
+                values.append(self._min)
+            elif rank >= self._count - 1:
+                values.append(self._max)
+            else:
+                position = np.searchsorted(cumulative_weights, rank, side="right")
+                values.append(items[min(position, len(items) - 1)])
+        return values
+
+    def _capacity(self, level_index):
+        depth = len(self._levels) - level_index - 1
+        return max(2, int(math.ceil(self._k * self.capacity_ratio ** depth)))
+
+    def _compress(self):
+        while True:
+            for level_index, level in enumerate(self._levels):
+                if len(level) > self._capacity(level_index):
+                    self._compact(level_index)
+                    break
+            else:
+                return
+
+    def _compact(self, level_index):
+        if level_index + 1 == len(self._levels):
+            self._levels.append(self._levels[level_index][:0])
+        level = np.sort(self._levels[level_index], kind="mergesort")
+        # with an odd number of values, one stays behind at its current weight
+        even_length = len(level) - len(level) % 2
+        offset = self._random.randint(2)
+        self._levels[level_index + 1] = self._concatenate(
+            self._levels[level_index + 1], level[offset:even_length:2]
+        )
+        self._levels[level_index] = level[even_length:]
+
+    def _update_extremes(self, minimum, maximum, count):
+        self._min = minimum if self._min is None else min(self._min, minimum)
+        self._max = maximum if self._max is None else max(self._max, maximum)
+        self._count += int(count)
+
+    @staticmethod
+    def _concatenate(level, values):
+        if len(level) == 0:
+            return np.array(values, copy=True)
+        return np.concatenate([level, values])
+
+    @staticmethod
+    def _to_python(value):
+        return value.item() if isinstance(value, np.generic) else value
@@ -2,6 +2,7 @@ import copy
 import inspect
 import json
 import logging
+import threading
 import warnings
 from collections import OrderedDict
 from datetime import datetime
@@ -15,17 +16,26 @@ from dateutil.parser import parse
 
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
+from great_expectations.dataset.cardinality_sketch import HyperLogLog
+from great_expectations.dataset.quantile_sketch import (
+    DEFAULT_RELATIVE_ERROR,
+    KLLSketch,
+    get_relative_error,
+)
 
 from .dataset import Dataset
 from .pandas_dataset import PandasDataset
+from .util import get_expectation_columns
 
 logger = logging.getLogger(__name__)
 
 try:
     import pyspark.sql.types as sparktypes
+    from pyspark import StorageLevel
     from pyspark.ml.feature import Bucketizer
     from pyspark.sql import SQLContext, Window
     from pyspark.sql.functions import (
+        approx_count_distinct,
         array,
         col,
         count,
@@ -37,11 +47,14 @@ try:
         lag,
     )
     from pyspark.sql.functions import length as length_
+    from pyspark.sql.functions import max as max_
+    from pyspark.sql.functions import mean as mean_
+    from pyspark.sql.functions import min as min_
+    from pyspark.sql.functions import sum as sum_
     from pyspark.sql.functions import (
         lit,
         monotonically_increasing_id,
         stddev_samp,
-        struct,
         udf,
         when,
         year,
@@ -84,15 +97,13 @@ class MetaSparkDFDataset(Dataset):
             self, column, mostly=None, result_format=None, *args, **kwargs,
         ):
             """
-            This whole decorator is pending a re-write. Currently there is are huge performance issues
-            when the # of unexpected elements gets large (10s of millions). Additionally, there is likely
-            easy optimization opportunities by coupling result_format with how many different transformations
-            are done on the dataset, as is done in sqlalchemy_dataset.
+            The counts of the expectation are computed by a single aggregation over the column. Unexpected values are
+            only collected when the result_format includes them, in a second job that stops after the requested
+            number of values. self.spark_df is not modified.
             """
 
             # Rename column so we only have to handle dot notation here
             eval_col = "__eval_col_" + column.replace(".", "__").replace("`", "_")
-            self.spark_df = self.spark_df.withColumn(eval_col, col(column))
 
             if result_format is None:
                 result_format = self.default_expectation_args["result_format"]
@@ -107,41 +118,45 @@ class MetaSparkDFDataset(Dataset):
             else:
                 unexpected_count_limit = result_format["partial_unexpected_count"]
 
-            col_df = self.spark_df.select(col(eval_col))  # pyspark.sql.DataFrame
-
-            # a couple of tests indicate that caching here helps performance
-            col_df.persist()
-            element_count = self.get_row_count()
+            col_df = self.spark_df.select(col(column).alias(eval_col))
 
             # FIXME temporary fix for missing/ignored value
-            if func.__name__ not in [
+            ignore_null_values = func.__name__ not in [
                 "expect_column_values_to_not_be_null",
                 "expect_column_values_to_be_null",
-            ]:
-                col_df = col_df.filter(col_df[0].isNotNull())
-                # these nonnull_counts are cached by SparkDFDataset
-                nonnull_count = self.get_column_nonnull_count(eval_col)
-            else:
-                nonnull_count = element_count
+            ]
+            if ignore_null_values:
+                col_df = col_df.filter(col(eval_col).isNotNull())
 
             # success_df will have columns [column, '__success']
             # this feels a little hacky, so might want to change
             success_df = func(self, col_df, *args, **kwargs)
-            success_count = success_df.filter("__success = True").count()
-
-            unexpected_count = nonnull_count - success_count
-
-            if unexpected_count == 0:
-                # save some computation time if no unexpected items
+            nonnull_count, unexpected_count = self._count_unexpected_rows(success_df)
+            success_count = nonnull_count - unexpected_count
+
+            if ignore_null_values:
+                # the row count is computed once for all the expectations of the dataset
+                element_count = self.get_row_count()
+                if self.caching:
+                    self._metric_cache.set(
+                        ("column_nonnull_count", column), nonnull_count
+                    )
+            else:
+                element_count = nonnull_count
+
+            if (
+                unexpected_count == 0
+                or result_format["result_format"] == "BOOLEAN_ONLY"
+                or unexpected_count_limit == 0
+            ):
+                # the unexpected values are not part of the result
                 maybe_limited_unexpected_list = []
             else:
-                # here's an example of a place where we could do optimizations if we knew result format: see
-                # comment block below
-                unexpected_df = success_df.filter("__success = False")
-                if unexpected_count_limit:
-                    unexpected_df = unexpected_df.limit(unexpected_count_limit)
                 maybe_limited_unexpected_list = [
-                    row[eval_col] for row in unexpected_df.collect()
+                    row[eval_col]
+                    for row in self._collect_unexpected_rows(
+                        success_df, unexpected_count_limit
+                    )
                 ]
 
                 if "output_strftime_format" in kwargs:
@@ -196,8 +211,6 @@ class MetaSparkDFDataset(Dataset):
                 except KeyError:
                     pass
 
-            col_df.unpersist()
-
             return return_obj
 
         inner_wrapper.__name__ = func.__name__
@@ -229,9 +242,9 @@ class MetaSparkDFDataset(Dataset):
             eval_col_A = "__eval_col_A_" + column_A.replace(".", "__").replace("`", "_")
             eval_col_B = "__eval_col_B_" + column_B.replace(".", "__").replace("`", "_")
 
-            self.spark_df = self.spark_df.withColumn(
-                eval_col_A, col(column_A)
-            ).withColumn(eval_col_B, col(column_B))
+            spark_df = self.spark_df.withColumn(eval_col_A, col(column_A)).withColumn(
+                eval_col_B, col(column_B)
+            )
 
             if result_format is None:
                 result_format = self.default_expectation_args["result_format"]
@@ -246,123 +259,138 @@ class MetaSparkDFDataset(Dataset):
             else:
                 unexpected_count_limit = result_format["partial_unexpected_count"]
 
-            cols_df = self.spark_df.select(eval_col_A, eval_col_B).withColumn(
+            cols_df = spark_df.select(eval_col_A, eval_col_B).withColumn(
                 "__row", monotonically_increasing_id()
             )  # pyspark.sql.DataFrame
 
-            # a couple of tests indicate that caching here helps performance
-            cols_df.cache()
-            element_count = self.get_row_count()
-
-            if ignore_row_if == "both_values_are_missing":
-                boolean_mapped_null_values = cols_df.selectExpr(
-                    "`__row`",
-                    "`{0}` AS `A_{0}`".format(eval_col_A),
-                    "`{0}` AS `B_{0}`".format(eval_col_B),
-                    "ISNULL(`{}`) AND ISNULL(`{}`) AS `__null_val`".format(
-                        eval_col_A, eval_col_B
-                    ),
-                )
-            elif ignore_row_if == "either_value_is_missing":
-                boolean_mapped_null_values = cols_df.selectExpr(
-                    "`__row`",
-                    "`{0}` AS `A_{0}`".format(eval_col_A),
-                    "`{0}` AS `B_{0}`".format(eval_col_B),
-                    "ISNULL(`{}`) OR ISNULL(`{}`) AS `__null_val`".format(
-                        eval_col_A, eval_col_B
-                    ),
-                )
-            elif ignore_row_if == "never":
-                boolean_mapped_null_values = cols_df.selectExpr(
-                    "`__row`",
-                    "`{0}` AS `A_{0}`".format(eval_col_A),
-                    "`{0}` AS `B_{0}`".format(eval_col_B),
-                    lit(False).alias("__null_val"),
-                )
-            else:
-                raise ValueError("Unknown value of ignore_row_if: %s", (ignore_row_if,))
-
-            # since pyspark guaranteed each columns selected has the same number of rows, no need to do assert as in pandas
-            # assert series_A.count() == (
-            #     series_B.count()), "Series A and B must be the same length"
-
-            nonnull_df = boolean_mapped_null_values.filter("__null_val = False")
-            nonnull_count = nonnull_df.count()
-
-            col_A_df = nonnull_df.select("__row", "`A_{}`".format(eval_col_A))
-            col_B_df = nonnull_df.select("__row", "`B_{}`".format(eval_col_B))
-
-            success_df = func(self, col_A_df, col_B_df, *args, **kwargs)
-            success_count = success_df.filter("__success = True").count()
+            # a couple of tests indicate that caching here helps performance, unless the whole DataFrame is
+            # already persisted
+            if not self.is_persisted:
+                self._persist_dataframe(cols_df)
+            try:
+                element_count = self.get_row_count()
+
+                if ignore_row_if == "both_values_are_missing":
+                    boolean_mapped_null_values = cols_df.selectExpr(
+                        "`__row`",
+                        "`{0}` AS `A_{0}`".format(eval_col_A),
+                        "`{0}` AS `B_{0}`".format(eval_col_B),
+                        "ISNULL(`{}`) AND ISNULL(`{}`) AS `__null_val`".format(
+                            eval_col_A, eval_col_B
+                        ),
+                    )
+                elif ignore_row_if == "either_value_is_missing":
+                    boolean_mapped_null_values = cols_df.selectExpr(
+                        "`__row`",
+                        "`{0}` AS `A_{0}`".format(eval_col_A),
+                        "`{0}` AS `B_{0}`".format(eval_col_B),
+                        "ISNULL(`{}`) OR ISNULL(`{}`) AS `__null_val`".format(
+                            eval_col_A, eval_col_B
+                        ),
+                    )
+                elif ignore_row_if == "never":
+                    boolean_mapped_null_values = cols_df.selectExpr(
+                        "`__row`",
+                        "`{0}` AS `A_{0}`".format(eval_col_A),
+                        "`{0}` AS `B_{0}`".format(eval_col_B),
+                        lit(False).alias("__null_val"),
+                    )
+                else:
+                    raise ValueError(
+                        "Unknown value of ignore_row_if: %s", (ignore_row_if,)
+                    )
 
-            unexpected_count = nonnull_count - success_count
-            if unexpected_count == 0:
-                # save some computation time if no unexpected items
-                maybe_limited_unexpected_list = []
-            else:
-                # here's an example of a place where we could do optimizations if we knew result format: see
-                # comment block below
-                unexpected_df = success_df.filter("__success = False")
-                if unexpected_count_limit:
-                    unexpected_df = unexpected_df.limit(unexpected_count_limit)
-                maybe_limited_unexpected_list = [
-                    (row["A_{}".format(eval_col_A)], row["B_{}".format(eval_col_B)],)
-                    for row in unexpected_df.collect()
-                ]
+                # since pyspark guaranteed each columns selected has the same number of rows, no need to do assert as in pandas
+                # assert series_A.count() == (
+                #     series_B.count()), "Series A and B must be the same length"
+
+                nonnull_df = boolean_mapped_null_values.filter("__null_val = False")
+                nonnull_count = nonnull_df.count()
+
+                col_A_df = nonnull_df.select("__row", "`A_{}`".format(eval_col_A))
+                col_B_df = nonnull_df.select("__row", "`B_{}`".format(eval_col_B))
+
+                success_df = func(self, col_A_df, col_B_df, *args, **kwargs)
+                success_count = success_df.filter("__success = True").count()
+
+                unexpected_count = nonnull_count - success_count
+                if unexpected_count == 0:
+                    # save some computation time if no unexpected items
+                    maybe_limited_unexpected_list = []
+                else:
+                    # here's an example of a place where we could do optimizations if we knew result format: see
+                    # comment block below
+                    unexpected_df = success_df.filter("__success = False")
+                    if unexpected_count_limit:
+                        unexpected_df = unexpected_df.limit(unexpected_count_limit)
+                    maybe_limited_unexpected_list = [
+                        (
+                            row["A_{}".format(eval_col_A)],
+                            row["B_{}".format(eval_col_B)],
+                        )
+                        for row in unexpected_df.collect()
+                    ]
 
-                if "output_strftime_format" in kwargs:
-                    output_strftime_format = kwargs["output_strftime_format"]
-                    parsed_maybe_limited_unexpected_list = []
-                    for val in maybe_limited_unexpected_list:
-                        if val is None or (val[0] is None or val[1] is None):
-                            parsed_maybe_limited_unexpected_list.append(val)
-                        else:
-                            if isinstance(val[0], str) and isinstance(val[1], str):
-                                val = (parse(val[0]), parse(val[1]))
-                            parsed_maybe_limited_unexpected_list.append(
-                                (
-                                    datetime.strftime(val[0], output_strftime_format),
-                                    datetime.strftime(val[1], output_strftime_format),
+                    if "output_strftime_format" in kwargs:
+                        output_strftime_format = kwargs["output_strftime_format"]
+                        parsed_maybe_limited_unexpected_list = []
+                        for val in maybe_limited_unexpected_list:
+                            if val is None or (val[0] is None or val[1] is None):
+                                parsed_maybe_limited_unexpected_list.append(val)
+                            else:
+                                if isinstance(val[0], str) and isinstance(val[1], str):
+                                    val = (parse(val[0]), parse(val[1]))
+                                parsed_maybe_limited_unexpected_list.append(
+                                    (
+                                        datetime.strftime(
+                                            val[0], output_strftime_format
+                                        ),
+                                        datetime.strftime(
+                                            val[1], output_strftime_format
+                                        ),
+                                    )
                                 )
-                            )
-                    maybe_limited_unexpected_list = parsed_maybe_limited_unexpected_list
+                        maybe_limited_unexpected_list = (
+                            parsed_maybe_limited_unexpected_list
+                        )
 
-            success, percent_success = self._calc_map_expectation_success(
-                success_count, nonnull_count, mostly
-            )
-
-            # Currently the abstraction of "result_format" that _format_column_map_output provides
-            # limits some possible optimizations within the column-map decorator. It seems that either
-            # this logic should be completely rolled into the processing done in the column_map decorator, or that the decorator
-            # should do a minimal amount of computation agnostic of result_format, and then delegate the rest to this method.
-            # In the first approach, it could make sense to put all of this decorator logic in Dataset, and then implement
-            # properties that require dataset-type-dependent implementations (as is done with SparkDFDataset.row_count currently).
-            # Then a new dataset type could just implement these properties/hooks and Dataset could deal with caching these and
-            # with the optimizations based on result_format. A side benefit would be implementing an interface for the user
-            # to get basic info about a dataset in a standardized way, e.g. my_dataset.row_count, my_dataset.columns (only for
-            # tablular datasets maybe). However, unclear if this is worth it or if it would conflict with optimizations being done
-            # in other dataset implementations.
-            return_obj = self._format_map_output(
-                result_format,
-                success,
-                element_count,
-                nonnull_count,
-                unexpected_count,
-                maybe_limited_unexpected_list,
-                unexpected_index_list=None,
-            )
+                success, percent_success = self._calc_map_expectation_success(
+                    success_count, nonnull_count, mostly
+                )
 
-            # # FIXME Temp fix for result format
-            # if func.__name__ in ['expect_column_values_to_not_be_null', 'expect_column_values_to_be_null']:
-            #     del return_obj['result']['unexpected_percent_nonmissing']
-            #     del return_obj['result']['missing_count']
-            #     del return_obj['result']['missing_percent']
-            #     try:
-            #         del return_obj['result']['partial_unexpected_counts']
-            #     except KeyError:
-            #         pass
+                # Currently the abstraction of "result_format" that _format_column_map_output provides
+                # limits some possible optimizations within the column-map decorator. It seems that either
+                # this logic should be completely rolled into the processing done in the column_map decorator, or that the decorator
+                # should do a minimal amount of computation agnostic of result_format, and then delegate the rest to this method.
+                # In the first approach, it could make sense to put all of this decorator logic in Dataset, and then implement
+                # properties that require dataset-type-dependent implementations (as is done with SparkDFDataset.row_count currently).
+                # Then a new dataset type could just implement these properties/hooks and Dataset could deal with caching these and
+                # with the optimizations based on result_format. A side benefit would be implementing an interface for the user
+                # to get basic info about a dataset in a standardized way, e.g. my_dataset.row_count, my_dataset.columns (only for
+                # tablular datasets maybe). However, unclear if this is worth it or if it would conflict with optimizations being done
+                # in other dataset implementations.
+                return_obj = self._format_map_output(
+                    result_format,
+                    success,
+                    element_count,
+                    nonnull_count,
+                    unexpected_count,
+                    maybe_limited_unexpected_list,
+                    unexpected_index_list=None,
+                )
 
-            cols_df.unpersist()
+                # # FIXME Temp fix for result format
+                # if func.__name__ in ['expect_column_values_to_not_be_null', 'expect_column_values_to_be_null']:
+                #     del return_obj['result']['unexpected_percent_nonmissing']
+                #     del return_obj['result']['missing_count']
+                #     del return_obj['result']['missing_percent']
+                #     try:
+                #         del return_obj['result']['partial_unexpected_counts']
+                #     except KeyError:
+                #         pass
+            finally:
+                if cols_df.is_cached:
+                    cols_df.unpersist()
 
             return return_obj
 
@@ -392,10 +420,11 @@ class MetaSparkDFDataset(Dataset):
         ):
             # Rename column so we only have to handle dot notation here
             eval_cols = []
+            spark_df = self.spark_df
             for col_name in column_list:
                 eval_col = "__eval_col_" + col_name.replace(".", "__").replace("`", "_")
                 eval_cols.append(eval_col)
-                self.spark_df = self.spark_df.withColumn(eval_col, col(col_name))
+                spark_df = spark_df.withColumn(eval_col, col(col_name))
             if result_format is None:
                 result_format = self.default_expectation_args["result_format"]
 
@@ -409,118 +438,194 @@ class MetaSparkDFDataset(Dataset):
             else:
                 unexpected_count_limit = result_format["partial_unexpected_count"]
 
-            temp_df = self.spark_df.select(*eval_cols)  # pyspark.sql.DataFrame
+            temp_df = spark_df.select(*eval_cols)  # pyspark.sql.DataFrame
 
-            # a couple of tests indicate that caching here helps performance
-            temp_df.cache()
-            element_count = self.get_row_count()
+            # a couple of tests indicate that caching here helps performance, unless the whole DataFrame is
+            # already persisted
+            if not self.is_persisted:
+                self._persist_dataframe(temp_df)
+            try:
+                element_count = self.get_row_count()
+
+                if ignore_row_if == "all_values_are_missing":
+                    boolean_mapped_skip_values = temp_df.select(
+                        [
+                            *eval_cols,
+                            reduce(
+                                lambda a, b: a & b, [col(c).isNull() for c in eval_cols]
+                            ).alias("__null_val"),
+                        ]
+                    )
+                elif ignore_row_if == "any_value_is_missing":
+                    boolean_mapped_skip_values = temp_df.select(
+                        [
+                            *eval_cols,
+                            reduce(
+                                lambda a, b: a | b, [col(c).isNull() for c in eval_cols]
+                            ).alias("__null_val"),
+                        ]
+                    )
+                elif ignore_row_if == "never":
+                    boolean_mapped_skip_values = temp_df.select(
+                        [*eval_cols, lit(False).alias("__null_val")]
+                    )
+                else:
+                    raise ValueError(
+                        "Unknown value of ignore_row_if: %s", (ignore_row_if,)
+                    )
 
-            if ignore_row_if == "all_values_are_missing":
-                boolean_mapped_skip_values = temp_df.select(
-                    [
-                        *eval_cols,
-                        reduce(
-                            lambda a, b: a & b, [col(c).isNull() for c in eval_cols]
-                        ).alias("__null_val"),
-                    ]
+                nonnull_df = boolean_mapped_skip_values.filter("__null_val = False")
+
+                cols_df = nonnull_df.select(*eval_cols)
+
+                success_df = func(self, cols_df, *args, **kwargs)
+                nonnull_count, unexpected_count = self._count_unexpected_rows(
+                    success_df
                 )
-            elif ignore_row_if == "any_value_is_missing":
-                boolean_mapped_skip_values = temp_df.select(
-                    [
-                        *eval_cols,
-                        reduce(
-                            lambda a, b: a | b, [col(c).isNull() for c in eval_cols]
-                        ).alias("__null_val"),
+                success_count = nonnull_count - unexpected_count
+
+                if (
+                    unexpected_count == 0
+                    or result_format["result_format"] == "BOOLEAN_ONLY"
+                    or unexpected_count_limit == 0
+                ):
+                    # the unexpected values are not part of the result
+                    maybe_limited_unexpected_list = []
+                else:
+                    maybe_limited_unexpected_list = [
+                        OrderedDict(
+                            (col_name, row[eval_col_name])
+                            for (col_name, eval_col_name) in zip(column_list, eval_cols)
+                        )
+                        for row in self._collect_unexpected_rows(
+                            success_df, unexpected_count_limit
+                        )
                     ]
+
+                    if "output_strftime_format" in kwargs:
+                        output_strftime_format = kwargs["output_strftime_format"]
+                        parsed_maybe_limited_unexpected_list = []
+                        for val in maybe_limited_unexpected_list:
+                            if val is None or not all(v for k, v in val):
+                                parsed_maybe_limited_unexpected_list.append(val)
+                            else:
+                                if all(isinstance(v, str) for k, v in val):
+                                    val = OrderedDict((k, parse(v)) for k, v in val)
+                                parsed_maybe_limited_unexpected_list.append(
+                                    OrderedDict(
+                                        (
+                                            k,
+                                            datetime.strftime(
+                                                v, output_strftime_format
+                                            ),
+                                        )
+                                        for k, v in val
+                                    )
+                                )
+                        maybe_limited_unexpected_list = (
+                            parsed_maybe_limited_unexpected_list
+                        )
+
+                success, percent_success = self._calc_map_expectation_success(
+                    success_count, nonnull_count, mostly
                 )
-            elif ignore_row_if == "never":
-                boolean_mapped_skip_values = temp_df.select(
-                    [*eval_cols, lit(False).alias("__null_val")]
+
+                # Currently the abstraction of "result_format" that _format_column_map_output provides
+                # limits some possible optimizations within the column-map decorator. It seems that either
+                # this logic should be completely rolled into the processing done in the column_map decorator, or that the decorator
+                # should do a minimal amount of computation agnostic of result_format, and then delegate the rest to this method.
+                # In the first approach, it could make sense to put all of this decorator logic in Dataset, and then implement
+                # properties that require dataset-type-dependent implementations (as is done with SparkDFDataset.row_count currently).
+                # Then a new dataset type could just implement these properties/hooks and Dataset could deal with caching these and
+                # with the optimizations based on result_format. A side benefit would be implementing an interface for the user
+                # to get basic info about a dataset in a standardized way, e.g. my_dataset.row_count, my_dataset.columns (only for
+                # tablular datasets maybe). However, unclear if this is worth it or if it would conflict with optimizations being done
+                # in other dataset implementations.
+                return_obj = self._format_map_output(
+                    result_format,
+                    success,
+                    element_count,
+                    nonnull_count,
+                    unexpected_count,
+                    maybe_limited_unexpected_list,
+                    unexpected_index_list=None,
                 )
-            else:
-                raise ValueError("Unknown value of ignore_row_if: %s", (ignore_row_if,))
+            finally:
+                if temp_df.is_cached:
+                    temp_df.unpersist()
 
-            nonnull_df = boolean_mapped_skip_values.filter("__null_val = False")
-            nonnull_count = nonnull_df.count()
+            return return_obj
 
-            cols_df = nonnull_df.select(*eval_cols)
+        inner_wrapper.__name__ = func.__name__
+        inner_wrapper.__doc__ = func.__doc__
 
-            success_df = func(self, cols_df, *args, **kwargs)
-            success_count = success_df.filter("__success = True").count()
+        return inner_wrapper
 
-            unexpected_count = nonnull_count - success_count
-            if unexpected_count == 0:
-                maybe_limited_unexpected_list = []
-            else:
-                # here's an example of a place where we could do optimizations if we knew result format: see
-                # comment block below
-                unexpected_df = success_df.filter("__success = False")
-                if unexpected_count_limit:
-                    unexpected_df = unexpected_df.limit(unexpected_count_limit)
-                maybe_limited_unexpected_list = [
-                    OrderedDict(
-                        (col_name, row[eval_col_name])
-                        for (col_name, eval_col_name) in zip(column_list, eval_cols)
-                    )
-                    for row in unexpected_df.collect()
-                ]
+    @staticmethod
+    def _count_unexpected_rows(success_df):
+        """Return the (nonnull_count, unexpected_count) of what an expectation function returned, with one job."""
+        if isinstance(success_df, _ValueCounts):
+            nonnull_count, unexpected_count = success_df.counts_df.agg(
+                sum_("__count"),
+                sum_(when(col("__count") > 1, col("__count")).otherwise(0)),
+            ).collect()[0]
+            return nonnull_count or 0, unexpected_count or 0
+        # __success is not always boolean (a udf may return strings), so it is compared rather than used as a condition
+        nonnull_count, success_count = success_df.agg(
+            count(lit(1)), count(when(expr("__success = True"), True))
+        ).collect()[0]
+        return nonnull_count, nonnull_count - success_count
 
-                if "output_strftime_format" in kwargs:
-                    output_strftime_format = kwargs["output_strftime_format"]
-                    parsed_maybe_limited_unexpected_list = []
-                    for val in maybe_limited_unexpected_list:
-                        if val is None or not all(v for k, v in val):
-                            parsed_maybe_limited_unexpected_list.append(val)
-                        else:
-                            if all(isinstance(v, str) for k, v in val):
-                                val = OrderedDict((k, parse(v)) for k, v in val)
-                            parsed_maybe_limited_unexpected_list.append(
-                                OrderedDict(
-                                    (k, datetime.strftime(v, output_strftime_format))
-                                    for k, v in val
-                                )
-                            )
-                    maybe_limited_unexpected_list = parsed_maybe_limited_unexpected_list
+    @staticmethod
+    def _collect_unexpected_rows(success_df, limit):
+        """Collect the unexpected rows (at most limit of them, unless limit is None) of what an expectation function
+        returned."""
+        if isinstance(success_df, _ValueCounts):
+            # each duplicated value stands for as many unexpected rows as it has occurrences
+            duplicates_df = success_df.counts_df.filter(col("__count") > 1)
+            if limit:
+                duplicates_df = duplicates_df.limit(limit)
+            rows = [
+                row for row in duplicates_df.collect() for _ in range(row["__count"])
+            ]
+            return rows[:limit] if limit else rows
+        unexpected_df = success_df.filter("__success = False")
+        if limit:
+            unexpected_df = unexpected_df.limit(limit)
+        return unexpected_df.collect()
 
-            success, percent_success = self._calc_map_expectation_success(
-                success_count, nonnull_count, mostly
-            )
 
-            # Currently the abstraction of "result_format" that _format_column_map_output provides
-            # limits some possible optimizations within the column-map decorator. It seems that either
-            # this logic should be completely rolled into the processing done in the column_map decorator, or that the decorator
-            # should do a minimal amount of computation agnostic of result_format, and then delegate the rest to this method.
-            # In the first approach, it could make sense to put all of this decorator logic in Dataset, and then implement
-            # properties that require dataset-type-dependent implementations (as is done with SparkDFDataset.row_count currently).
-            # Then a new dataset type could just implement these properties/hooks and Dataset could deal with caching these and
-            # with the optimizations based on result_format. A side benefit would be implementing an interface for the user
-            # to get basic info about a dataset in a standardized way, e.g. my_dataset.row_count, my_dataset.columns (only for
-            # tablular datasets maybe). However, unclear if this is worth it or if it would conflict with optimizations being done
-            # in other dataset implementations.
-            return_obj = self._format_map_output(
-                result_format,
-                success,
-                element_count,
-                nonnull_count,
-                unexpected_count,
-                maybe_limited_unexpected_list,
-                unexpected_index_list=None,
-            )
+class _ValueCounts:
+    """What uniqueness expectations return instead of a DataFrame with a __success column.
 
-            temp_df.unpersist()
+    counts_df has the evaluated columns and the number of rows (__count) of each of their distinct values; the rows of
+    the values counted more than once are unexpected. Counting values with groupBy only shuffles partial counts,
+    whereas a count over a window partitioned by the columns shuffles every row, and the unexpected values are read
+    from the counts without joining them back to the rows.
+    """
 
-            return return_obj
+    def __init__(self, counts_df):
+        self.counts_df = counts_df
 
-        inner_wrapper.__name__ = func.__name__
-        inner_wrapper.__doc__ = func.__doc__
-
-        return inner_wrapper
+    @classmethod
+    def from_columns(cls, df):
+        return cls(df.groupBy(*df.columns).agg(count(lit(1)).alias("__count")))
 
 
 class SparkDFDataset(MetaSparkDFDataset):
     """
 This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
 
+Unless it is created with persist=False, the dataset persists `spark_df` (with the given storage_level, e.g.
+"MEMORY_AND_DISK" or "DISK_ONLY") until it is released with unpersist, or on leaving a with block:
+
+    with SparkDFDataset(spark_df, storage_level="DISK_ONLY") as batch:
+        batch.validate(expectation_suite)
+
+A dataset created with suite_columns_only=True (see the project_suite_columns batch kwarg of SparkDFDatasource) only
+has the columns of the expectation suite it was created with; validating expectations that need other columns raises
+a ValueError rather than reporting them as failed.
+
 --ge-feature-maturity-info--
 
     id: validation_engine_pyspark_self_managed
@@ -590,6 +695,24 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
 --ge-feature-maturity-info--
     """
 
+    # the column aggregate expectations whose metrics are computed by the aggregation of _prepare_validation, and
+    # the metrics each of them reads besides the nonnull count and the row count, which every column expectation reads
+    _planned_column_aggregates = {
+        "expect_column_min_to_be_between": ["column_min"],
+        "expect_column_max_to_be_between": ["column_max"],
+        "expect_column_mean_to_be_between": ["column_mean"],
+        "expect_column_stdev_to_be_between": ["column_stdev"],
+        "expect_column_sum_to_be_between": ["column_sum"],
+        "expect_column_median_to_be_between": [],
+        "expect_column_quantile_values_to_be_between": [],
+        "expect_column_unique_value_count_to_be_between": [],
+        "expect_column_proportion_of_unique_values_to_be_between": [],
+        "expect_column_most_common_value_to_be_in_set": [],
+        "expect_column_distinct_values_to_be_in_set": [],
+        "expect_column_distinct_values_to_equal_set": [],
+        "expect_column_distinct_values_to_contain_set": [],
+    }
+
     @classmethod
     def from_dataset(cls, dataset=None):
         if isinstance(dataset, SparkDFDataset):
@@ -601,10 +724,116 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         # Creation of the Spark DataFrame is done outside this class
         self.spark_df = spark_df
         self._persist = kwargs.pop("persist", True)
-        if self._persist:
-            self.spark_df.persist()
+        self._storage_level = self._get_storage_level(kwargs.pop("storage_level", None))
+        self._suite_columns_only = kwargs.pop("suite_columns_only", False)
+        # Upper bound on the expectations evaluated concurrently by validate; see _get_max_concurrent_expectations
+        self.max_concurrent_expectations = kwargs.pop("max_concurrent_expectations", 1)
+        # references to the persisted spark_df; see persist and unpersist
+        self._persist_count = 0
+        self._owns_persistence = False
+        self._persist_lock = threading.Lock()
+        # the dataset holds a reference from its creation until unpersist is called, e.g. on leaving a with block
+        self.persist()
         super().__init__(*args, **kwargs)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.unpersist()
+
+    @staticmethod
+    def _get_storage_level(storage_level):
+        """Resolve a storage level given as a StorageLevel or by name (e.g. "MEMORY_AND_DISK" or "DISK_ONLY").
+
+        DataFrames are always cached in serialized form from Python, so the names of the serialized levels of the
+        Scala API ("MEMORY_ONLY_SER", "MEMORY_AND_DISK_SER"...) are accepted for the levels without the suffix.
+        """
+        if storage_level is None or isinstance(storage_level, StorageLevel):
+            return storage_level
+        if not isinstance(storage_level, str):
+            raise ValueError(
+                "storage_level must be a StorageLevel or the name of one, not {!r}".format(
+                    storage_level
+                )
+            )
+        name = storage_level.upper()
+        if name.endswith("_SER") and not hasattr(StorageLevel, name):
+            name = name[: -len("_SER")]
+        elif "_SER_" in name and not hasattr(StorageLevel, name):
+            name = name.replace("_SER_", "_")
+        if name.startswith("_") or not isinstance(
+            getattr(StorageLevel, name, None), StorageLevel
+        ):
+            raise ValueError("Unknown storage level: {}".format(storage_level))
+        return getattr(StorageLevel, name)
+
+    @property
+    def storage_level(self):
+        """The StorageLevel spark_df is persisted with, or None for the default level of DataFrame.persist."""
+        return self._storage_level
+
+    @property
+    def is_persisted(self):
+        """Whether the dataset holds a reference to the persisted spark_df."""
+        return self._persist_count > 0
+
+    def persist(self):
+        """Take a reference to the persisted spark_df, persisting it if it is the first one.
+
+        spark_df is only persisted if the dataset was created with persist=True (the default), and if it is not
+        persisted already. Each call must be matched by a call to unpersist.
+
+        Returns:
+            the dataset
+        """
+        if not self._persist:
+            return self
+        with self._persist_lock:
+            # the reference is taken even if persisting fails, so that the matching unpersist never releases another
+            self._persist_count += 1
+            if self._persist_count == 1:
+                # a DataFrame that was already persisted (by the caller) is left persisted by unpersist
+                self._owns_persistence = not self.spark_df.is_cached
+                if self._owns_persistence:
+                    self._persist_dataframe(self.spark_df)
+        return self
+
+    def _persist_dataframe(self, df):
+        if self._storage_level is None:
+            df.persist()
+        else:
+            df.persist(self._storage_level)
+
+    def unpersist(self, blocking=False):
+        """Release a reference to the persisted spark_df, unpersisting it once no reference is left.
+
+        The dataset holds a reference from its creation, and validate holds one while it runs, so that a dataset
+        that is released while it is being validated is only unpersisted once validation finishes. A released
+        dataset can still be used; spark_df is then computed again by each job (and persisted again by validate).
+        """
+        with self._persist_lock:
+            if self._persist_count == 0:
+                return
+            self._persist_count -= 1
+            if self._persist_count == 0 and self._owns_persistence:
+                self.spark_df.unpersist(blocking)
+
+    def release(self):
+        """Release the reference to the persisted spark_df that the dataset holds from its creation (see unpersist)."""
+        self.unpersist()
+
+    def _get_max_concurrent_expectations(self):
+        """Bound max_concurrent_expectations by the default parallelism of the Spark context.
+
+        Each expectation submits its own Spark jobs, which the scheduler runs side by side; more concurrent
+        expectations than the cluster has task slots would only queue up on the driver.
+        """
+        if self.max_concurrent_expectations <= 1:
+            return 1
+        spark_context = self.spark_df.sql_ctx.sparkSession.sparkContext
+        return min(self.max_concurrent_expectations, spark_context.defaultParallelism)
+
     def head(self, n=5):
         """Returns a *PandasDataset* with the first *n* rows of the given Dataset"""
         return PandasDataset(
@@ -617,7 +846,133 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             ),
         )
 
+    def _prepare_validation(self, expectations, evaluation_parameters):
+        """Compute the aggregate metrics needed by the suite with a single aggregation over the whole DataFrame.
+
+        The row count, and the nonnull count and the aggregate metrics (see _planned_column_aggregates) read by every
+        column aggregate expectation, are selected together and stored in the metric cache from which the getters are
+        served, so that a suite costs one job for them rather than one or more per expectation. Metrics that cannot be
+        planned, such as the mean of a non-numeric column, are left to their getters.
+
+        spark_df is persisted until _finish_validation, even if the dataset was released meanwhile (see unpersist).
+        """
+        self.persist()
+        # the hits and misses of the metric cache are reported per validation run (see _get_validation_meta)
+        self._get_active_validation_run().metrics[
+            ("metric_cache_statistics",)
+        ] = self.get_metric_cache_statistics()
+        if self._suite_columns_only:
+            self._check_suite_columns(expectations)
+        if not self.caching or len(expectations) == 0:
+            return
+
+        aggregate_metrics = OrderedDict()
+        for expectation in expectations:
+            column = expectation.kwargs.get("column")
+            if (
+                expectation.expectation_type not in self._planned_column_aggregates
+                or not isinstance(column, str)
+            ):
+                continue
+            try:
+                column_selects = dict(self._get_column_summary_selects(column))
+            except Exception as e:
+                logger.debug(
+                    "Unable to plan the column summary of column {}: {}".format(
+                        column, e
+                    )
+                )
+                continue
+            column_selects["column_sum"] = sum_(col(column))
+            metric_names = ["column_nonnull_count"] + self._planned_column_aggregates[
+                expectation.expectation_type
+            ]
+            # a metric may already be cached, e.g. by a profiler (see Dataset.cache_column_profile_metrics)
+            for metric_name in metric_names:
+                if (
+                    metric_name in column_selects
+                    and (metric_name, column) not in self._metric_cache
+                ):
+                    aggregate_metrics[(metric_name, column)] = column_selects[
+                        metric_name
+                    ]
+
+        if ("row_count",) not in self._metric_cache and any(
+            kwarg.startswith("column")
+            for expectation in expectations
+            for kwarg in expectation.kwargs
+        ):
+            # the row count is the element count of every column expectation
+            aggregate_metrics[("row_count",)] = count(lit(1))
+        if not aggregate_metrics:
+            return
+
+        try:
+            result = self.spark_df.select(list(aggregate_metrics.values())).collect()[0]
+        except Exception as e:
+            logger.debug(
+                "Unable to compute the aggregate metrics of the suite; they will be computed by their getters: {}".format(
+                    e
+                )
+            )
+            return
+        for key, value in zip(aggregate_metrics.keys(), result):
+            self._metric_cache.set(key, value)
+
+    def _check_suite_columns(self, expectations):
+        """Raise a ValueError if expectations need columns that spark_df does not have because it only keeps the
+        columns of the expectation suite the dataset was created with (see suite_columns_only)."""
+        columns = get_expectation_columns(expectations)
+        if columns is None:
+            raise ValueError(
+                "This dataset only has the columns of the expectation suite it was created with "
+                "(project_suite_columns), and the expectations being validated may depend on other columns. "
+                "Validate it with the suite it was created for, or get the batch without project_suite_columns."
+            )
+        # nested fields (e.g. "address.street") are kept with their top-level column
+        missing_columns = [
+            column
+            for column in columns
+            if not any(
+                column == spark_column or column.startswith(spark_column + ".")
+                for spark_column in self.spark_df.columns
+            )
+        ]
+        if missing_columns:
+            raise ValueError(
+                "This dataset only has the columns of the expectation suite it was created with "
+                "(project_suite_columns), which do not include {}. Validate it with the suite it was created for, "
+                "or get the batch without project_suite_columns.".format(
+                    ", ".join(missing_columns)
+                )
+            )
+
+    def _finish_validation(self):
+        self.unpersist()
+
+    def _get_validation_meta(self):
+        """Report how spark_df was cached and how many metrics were served from the metric cache by validate."""
+        start_statistics = self._get_active_validation_run().metrics.get(
+            ("metric_cache_statistics",), {}
+        )
+        statistics = self.get_metric_cache_statistics()
+        return {
+            "spark_cache": {
+                # None stands for the default level of DataFrame.persist
+                "storage_level": str(self._storage_level)
+                if self._storage_level is not None
+                else None,
+                "persisted": self._persist,
+                "metric_cache_hits": statistics["hits"]
+                - start_statistics.get("hits", 0),
+                "metric_cache_misses": statistics["misses"]
+                - start_statistics.get("misses", 0),
+            }
+        }
+
     def get_row_count(self):
+        if ("row_count",) in self._metric_cache:
+            return self._metric_cache.get(("row_count",))
         return self.spark_df.count()
 
     def get_column_count(self):
@@ -638,21 +993,45 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         return result[0] if len(result) > 0 else None
 
     def get_column_sum(self, column):
+        if ("column_sum", column) in self._metric_cache:
+            return self._metric_cache.get(("column_sum", column))
         return self.spark_df.select(column).groupBy().sum().collect()[0][0]
 
-    # TODO: consider getting all basic statistics in one go:
-    def _describe_column(self, column):
-        # temp_column = self.spark_df.select(column).where(col(column).isNotNull())
-        # return self.spark_df.select(
-        #     [
-        #         count(temp_column),
-        #         mean(temp_column),
-        #         stddev(temp_column),
-        #         min(temp_column),
-        #         max(temp_column)
-        #     ]
-        # )
-        pass
+    def _get_column_summary_selects(self, column):
+        """Return the (metric_name, select) pairs that compute the column summary of column in a single job."""
+        selects = [
+            ("column_nonnull_count", count(col(column))),
+            ("column_min", min_(col(column))),
+            ("column_max", max_(col(column))),
+        ]
+        if dict(self.spark_df.dtypes)[column] in ("int", "float", "double", "bigint"):
+            selects.append(("column_mean", mean_(col(column))))
+            selects.append(("column_stdev", stddev_samp(col(column))))
+        return selects
+
+    def get_column_summary(self, column):
+        selects = self._get_column_summary_selects(column)
+        result = self.spark_df.select([select for _, select in selects]).collect()[0]
+        return {metric_name: value for (metric_name, _), value in zip(selects, result)}
+
+    def get_column_profile_metrics(self, columns):
+        """Compute the column summary and the number of distinct values of every column in a single job."""
+        column_selects = [
+            (
+                column,
+                self._get_column_summary_selects(column)
+                + [("column_unique_count", countDistinct(col(column)))],
+            )
+            for column in columns
+        ]
+        result = self.spark_df.select(
+            [select for _, selects in column_selects for _, select in selects]
+        ).collect()[0]
+        values = iter(result)
+        return {
+            column: {metric_name: next(values) for metric_name, _ in selects}
+            for column, selects in column_selects
+        }
 
     def get_column_max(self, column, parse_strings_as_datetimes=False):
         temp_column = self.spark_df.select(column).where(col(column).isNotNull())
@@ -695,15 +1074,51 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         )
         return series
 
-    def get_column_unique_count(self, column):
+    def get_column_unique_count(self, column, allow_relative_error=False):
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is not None:
+            # Spark's own HyperLogLog++, computed on the executors
+            return self.spark_df.agg(
+                approx_count_distinct(column, rsd=relative_error)
+            ).collect()[0][0]
         return self.spark_df.agg(countDistinct(column)).collect()[0][0]
 
+    def get_column_unique_count_relative_error(
+        self, column, allow_relative_error=False
+    ):
+        # approx_count_distinct keeps its relative standard deviation within rsd
+        return get_relative_error(allow_relative_error)
+
+    def get_column_cardinality_sketch(
+        self, column, relative_error=DEFAULT_RELATIVE_ERROR
+    ):
+        def build_partition_sketch(rows):
+            yield HyperLogLog.from_relative_error(relative_error).update(
+                np.array([row[0] for row in rows])
+            )
+
+        partition_sketches = (
+            self.spark_df.select(column)
+            .where(col(column).isNotNull())
+            .rdd.mapPartitions(build_partition_sketch)
+            .collect()
+        )
+        return reduce(
+            lambda sketch, partition_sketch: sketch.merge(partition_sketch),
+            partition_sketches,
+            HyperLogLog.from_relative_error(relative_error),
+        )
+
     def get_column_modes(self, column):
         """leverages computation done in _get_column_value_counts"""
         s = self.get_column_value_counts(column)
         return list(s[s == s.max()].index)
 
-    def get_column_median(self, column):
+    def get_column_median(self, column, allow_relative_error=False):
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is not None:
+            return self.get_column_quantile_sketch(column, relative_error).get_median()
+
         # We will get the two middle values by choosing an epsilon to add
         # to the 50th percentile such that we always get exactly the middle two values
         # (i.e. 0 < epsilon < 1 / (2 * values))
@@ -718,18 +1133,34 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         return np.mean(result)
 
     def get_column_quantiles(self, column, quantiles, allow_relative_error=False):
-        if allow_relative_error is False:
-            allow_relative_error = 0.0
-        if (
-            not isinstance(allow_relative_error, float)
-            or allow_relative_error < 0
-            or allow_relative_error > 1
-        ):
+        # Spark's approxQuantile is itself a mergeable sketch (Greenwald-Khanna), computed on the executors
+        try:
+            relative_error = get_relative_error(allow_relative_error)
+        except ValueError:
             raise ValueError(
                 "SparkDFDataset requires relative error to be False or to be a float between 0 and 1."
             )
         return self.spark_df.approxQuantile(
-            column, list(quantiles), allow_relative_error
+            column, list(quantiles), relative_error or 0.0
+        )
+
+    def get_column_quantile_sketch(self, column, relative_error=DEFAULT_RELATIVE_ERROR):
+        def build_partition_sketch(rows):
+            yield KLLSketch.from_relative_error(relative_error).update(
+                np.array([row[0] for row in rows])
+            )
+
+        # each partition is sketched on its executor, and only the sketches are merged on the driver
+        partition_sketches = (
+            self.spark_df.select(column)
+            .where(col(column).isNotNull())
+            .rdd.mapPartitions(build_partition_sketch)
+            .collect()
+        )
+        return reduce(
+            lambda sketch, partition_sketch: sketch.merge(partition_sketch),
+            partition_sketches,
+            KLLSketch.from_relative_error(relative_error),
         )
 
     def get_column_stdev(self, column):
@@ -1013,9 +1444,7 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         catch_exceptions=None,
         meta=None,
     ):
-        return column.withColumn(
-            "__success", count(lit(1)).over(Window.partitionBy(column[0])) <= 1
-        )
+        return _ValueCounts.from_columns(column)
 
     @DocInherit
     @MetaSparkDFDataset.column_map_expectation
@@ -1161,14 +1590,14 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
     ):
         # Rename column so we only have to handle dot notation here
         eval_col = "__eval_col_" + column.replace(".", "__").replace("`", "_")
-        self.spark_df = self.spark_df.withColumn(eval_col, col(column))
+        spark_df = self.spark_df.withColumn(eval_col, col(column))
         if mostly is not None:
             raise ValueError(
                 "SparkDFDataset does not support column map semantics for column types"
             )
 
         try:
-            col_df = self.spark_df.select(eval_col)
+            col_df = spark_df.select(eval_col)
             col_data = [f for f in col_df.schema.fields if f.name == eval_col][0]
             col_type = type(col_data.dataType)
         except IndexError:
@@ -1202,7 +1631,7 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
     ):
         # Rename column so we only have to handle dot notation here
         eval_col = "__eval_col_" + column.replace(".", "__").replace("`", "_")
-        self.spark_df = self.spark_df.withColumn(eval_col, col(column))
+        spark_df = self.spark_df.withColumn(eval_col, col(column))
 
         if mostly is not None:
             raise ValueError(
@@ -1210,7 +1639,7 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             )
 
         try:
-            col_df = self.spark_df.select(eval_col)
+            col_df = spark_df.select(eval_col)
             col_data = [f for f in col_df.schema.fields if f.name == eval_col][0]
             col_type = type(col_data.dataType)
         except IndexError:
@@ -1276,15 +1705,44 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         meta=None,
     ):
         if match_on == "any":
-            return column.withColumn("__success", column[0].rlike("|".join(regex_list)))
+            return column.withColumn(
+                "__success", column[0].rlike(self._get_regex_alternation(regex_list))
+            )
         elif match_on == "all":
-            formatted_regex_list = ["(?={})".format(regex) for regex in regex_list]
+            # each lookahead searches the whole value for its regex, from the start of the value
+            formatted_regex_list = [
+                "(?=[\\s\\S]*?(?:{}))".format(regex) for regex in regex_list
+            ]
             return column.withColumn(
-                "__success", column[0].rlike("".join(formatted_regex_list))
+                "__success", column[0].rlike("^" + "".join(formatted_regex_list))
             )
         else:
             raise ValueError("match_on must be either 'any' or 'all'")
 
+    @DocInherit
+    @MetaSparkDFDataset.column_map_expectation
+    def expect_column_values_to_not_match_regex_list(
+        self,
+        column,
+        regex_list,
+        mostly=None,
+        result_format=None,
+        include_config=True,
+        catch_exceptions=None,
+        meta=None,
+    ):
+        return column.withColumn(
+            "__success", ~column[0].rlike(self._get_regex_alternation(regex_list))
+        )
+
+    @staticmethod
+    def _get_regex_alternation(regex_list):
+        """Combine regexes into a single regex matching values that match any of them, so that a column is searched
+        for all of them with one rlike."""
+        if len(regex_list) == 0:
+            raise ValueError("regex_list must contain at least one regex")
+        return "|".join("(?:{})".format(regex) for regex in regex_list)
+
     @DocInherit
     @MetaSparkDFDataset.column_pair_map_expectation
     def expect_column_pair_values_to_be_equal(
@@ -1463,11 +1921,7 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
     ):
 
         # Might want to throw an exception if only 1 column is passed
-        column_names = column_list.schema.names[:]
-        return column_list.withColumn(
-            "__success",
-            count(lit(1)).over(Window.partitionBy(struct(*column_names))) <= 1,
-        )
+        return _ValueCounts.from_columns(column_list)
 
     @DocInherit
     @MetaSparkDFDataset.column_map_expectation
@@ -1,4 +1,5 @@
 import inspect
+import json
 import logging
 import traceback
 import uuid
@@ -11,8 +12,19 @@ import numpy as np
 import pandas as pd
 from dateutil.parser import parse
 
+from great_expectations.core.evaluation_parameters import build_evaluation_parameters
 from great_expectations.data_asset import DataAsset
-from great_expectations.data_asset.util import DocInherit, parse_result_format
+from great_expectations.data_asset.util import (
+    DocInherit,
+    parse_result_format,
+    recursively_convert_to_json_serializable,
+)
+from great_expectations.dataset.cardinality_sketch import HyperLogLog
+from great_expectations.dataset.quantile_sketch import (
+    DEFAULT_RELATIVE_ERROR,
+    KLLSketch,
+    get_relative_error,
+)
 from great_expectations.dataset.util import (
     check_sql_engine_dialect,
     get_approximate_percentile_disc_sql,
@@ -182,15 +194,10 @@ class MetaSqlAlchemyDataset(Dataset):
             else:
                 unexpected_count_limit = result_format["partial_unexpected_count"]
 
-            expected_condition: BinaryExpression = func(self, column, *args, **kwargs)
-
-            # Added to prepare for when an ignore_values argument is added to the expectation
-            ignore_values: list = [None]
             if func.__name__ in [
                 "expect_column_values_to_not_be_null",
                 "expect_column_values_to_be_null",
             ]:
-                ignore_values = []
                 # Counting the number of unexpected values can be expensive when there is a large
                 # number of np.nan values.
                 # This only happens on expect_column_values_to_not_be_null expectations.
@@ -198,44 +205,35 @@ class MetaSqlAlchemyDataset(Dataset):
                 # we will instruct the result formatting method to skip this step.
                 result_format["partial_unexpected_count"] = 0
 
-            ignore_values_conditions: List[BinaryExpression] = []
-            if (
-                len(ignore_values) > 0
-                and None not in ignore_values
-                or len(ignore_values) > 1
-                and None in ignore_values
-            ):
-                ignore_values_conditions += [
-                    sa.column(column).in_(
-                        [val for val in ignore_values if val is not None]
-                    )
-                ]
-            if None in ignore_values:
-                ignore_values_conditions += [sa.column(column).is_(None)]
-
-            ignore_values_condition: BinaryExpression
-            if len(ignore_values_conditions) > 1:
-                ignore_values_condition = sa.or_(*ignore_values_conditions)
-            elif len(ignore_values_conditions) == 1:
-                ignore_values_condition = ignore_values_conditions[0]
-            else:
-                ignore_values_condition = BinaryExpression(
-                    sa.literal(False), sa.literal(True), custom_op("=")
+            (
+                expected_condition,
+                ignore_values_condition,
+            ) = self._get_column_map_conditions(func, column, *args, **kwargs)
+
+            # Counts may already have been computed by a fused query for the whole suite (see
+            # SqlAlchemyDataset._prepare_validation); otherwise, compute them for this expectation only.
+            count_results: dict = self._get_fused_metric(
+                (
+                    "column_map_counts",
+                    self._get_column_map_fused_key(func.__name__, column, args, kwargs),
                 )
+            )
+            if count_results is None:
+                count_query: Select
+                if self.sql_engine_dialect.name.lower() == "mssql":
+                    count_query = self._get_count_query_mssql(
+                        expected_condition=expected_condition,
+                        ignore_values_condition=ignore_values_condition,
+                    )
+                else:
+                    count_query = self._get_count_query_generic_sqlalchemy(
+                        expected_condition=expected_condition,
+                        ignore_values_condition=ignore_values_condition,
+                    )
 
-            count_query: Select
-            if self.sql_engine_dialect.name.lower() == "mssql":
-                count_query = self._get_count_query_mssql(
-                    expected_condition=expected_condition,
-                    ignore_values_condition=ignore_values_condition,
-                )
+                count_results = dict(self.engine.execute(count_query).fetchone())
             else:
-                count_query = self._get_count_query_generic_sqlalchemy(
-                    expected_condition=expected_condition,
-                    ignore_values_condition=ignore_values_condition,
-                )
-
-            count_results: dict = dict(self.engine.execute(count_query).fetchone())
+                count_results = dict(count_results)
 
             # Handle case of empty table gracefully:
             if (
@@ -257,17 +255,24 @@ class MetaSqlAlchemyDataset(Dataset):
             count_results["null_count"] = int(count_results["null_count"])
             count_results["unexpected_count"] = int(count_results["unexpected_count"])
 
-            # Retrieve unexpected values
-            unexpected_query_results = self.engine.execute(
-                sa.select([sa.column(column)])
-                .select_from(self._table)
-                .where(
-                    sa.and_(
-                        sa.not_(expected_condition), sa.not_(ignore_values_condition)
+            # Retrieve unexpected values, unless there are none or the result_format will not report them
+            if (
+                count_results["unexpected_count"] == 0
+                or result_format["result_format"] == "BOOLEAN_ONLY"
+            ):
+                unexpected_rows = []
+            else:
+                unexpected_rows = self.engine.execute(
+                    sa.select([sa.column(column)])
+                    .select_from(self._table)
+                    .where(
+                        sa.and_(
+                            sa.not_(expected_condition),
+                            sa.not_(ignore_values_condition),
+                        )
                     )
-                )
-                .limit(unexpected_count_limit)
-            )
+                    .limit(unexpected_count_limit)
+                ).fetchall()
 
             nonnull_count: int = count_results["element_count"] - count_results[
                 "null_count"
@@ -276,7 +281,7 @@ class MetaSqlAlchemyDataset(Dataset):
             if "output_strftime_format" in kwargs:
                 output_strftime_format = kwargs["output_strftime_format"]
                 maybe_limited_unexpected_list = []
-                for x in unexpected_query_results.fetchall():
+                for x in unexpected_rows:
                     if isinstance(x[column], str):
                         col = parse(x[column])
                     else:
@@ -285,9 +290,7 @@ class MetaSqlAlchemyDataset(Dataset):
                         datetime.strftime(col, output_strftime_format)
                     )
             else:
-                maybe_limited_unexpected_list = [
-                    x[column] for x in unexpected_query_results.fetchall()
-                ]
+                maybe_limited_unexpected_list = [x[column] for x in unexpected_rows]
 
             success_count = nonnull_count - count_results["unexpected_count"]
             success, percent_success = self._calc_map_expectation_success(
@@ -322,9 +325,65 @@ class MetaSqlAlchemyDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        # Expose the condition-building function so that validation can fuse the counts of many expectations
+        inner_wrapper._column_map_condition_func = func
 
         return inner_wrapper
 
+    def _get_column_map_conditions(self, func, column, *args, **kwargs):
+        """Build the (expected_condition, ignore_values_condition) pair for a column_map_expectation.
+
+        expected_condition is the filter returned by the expectation implementation; ignore_values_condition selects
+        the rows that are excluded from evaluation (nulls, unless the expectation is itself about nulls).
+        """
+        expected_condition: BinaryExpression = func(self, column, *args, **kwargs)
+
+        # Added to prepare for when an ignore_values argument is added to the expectation
+        ignore_values: list = [None]
+        if func.__name__ in [
+            "expect_column_values_to_not_be_null",
+            "expect_column_values_to_be_null",
+        ]:
+            ignore_values = []
+
+        ignore_values_conditions: List[BinaryExpression] = []
+        if (
+            len(ignore_values) > 0
+            and None not in ignore_values
+            or len(ignore_values) > 1
+            and None in ignore_values
+        ):
+            ignore_values_conditions += [
+                sa.column(column).in_([val for val in ignore_values if val is not None])
+            ]
+        if None in ignore_values:
+            ignore_values_conditions += [sa.column(column).is_(None)]
+
+        ignore_values_condition: BinaryExpression
+        if len(ignore_values_conditions) > 1:
+            ignore_values_condition = sa.or_(*ignore_values_conditions)
+        elif len(ignore_values_conditions) == 1:
+            ignore_values_condition = ignore_values_conditions[0]
+        else:
+            ignore_values_condition = BinaryExpression(
+                sa.literal(False), sa.literal(True), custom_op("=")
+            )
+
+        return expected_condition, ignore_values_condition
+
+    @staticmethod
+    def _get_column_map_fused_key(expectation_type, column, args, kwargs):
+        """Key identifying the counts of one column_map_expectation evaluation in the fused metric cache."""
+        return (
+            expectation_type,
+            str(column),
+            json.dumps(
+                convert_to_json_serializable([list(args), kwargs]),
+                sort_keys=True,
+                default=str,
+            ),
+        )
+
     def _get_count_query_mssql(
         self,
         expected_condition: BinaryExpression,
@@ -437,6 +496,56 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
 --ge-feature-maturity-info--
 """
 
+    # Column aggregate expectations whose metrics (the column summary, and the sum where needed) can be computed as
+    # part of a fused validation query
+    _fusable_column_aggregates = [
+        "expect_column_min_to_be_between",
+        "expect_column_max_to_be_between",
+        "expect_column_mean_to_be_between",
+        "expect_column_stdev_to_be_between",
+        "expect_column_sum_to_be_between",
+    ]
+    # Column map expectations whose conditions can only be built on dialects with regex or like pattern support. On
+    # other dialects, they are not planned into a fused query: building their conditions would log that the dialect
+    # is not supported, and the expectation logs it again when it is evaluated.
+    _regex_column_map_expectations = [
+        "expect_column_values_to_match_regex",
+        "expect_column_values_to_not_match_regex",
+        "expect_column_values_to_match_regex_list",
+        "expect_column_values_to_not_match_regex_list",
+    ]
+    _like_pattern_column_map_expectations = [
+        "expect_column_values_to_match_like_pattern",
+        "expect_column_values_to_not_match_like_pattern",
+        "expect_column_values_to_match_like_pattern_list",
+        "expect_column_values_to_not_match_like_pattern_list",
+    ]
+    # Upper bound on the number of column_map_expectations compiled into a single fused query
+    max_fused_expectations_per_query = 50
+    # Upper bound on the number of columns profiled by a single query; see get_column_profile_metrics
+    max_profiled_columns_per_query = 50
+    # Number of rows fetched at a time when a column is streamed into a quantile or cardinality sketch
+    quantile_sketch_fetch_size = 10000
+    # Whether approximate quantiles and medians come from a sketch of the column streamed to the client, rather than
+    # from the database. Streaming is only used by default by dialects that cannot compute percentiles at all.
+    client_side_quantile_sketches = False
+    _dialects_without_percentiles = ["sqlite"]
+    # Number of quantiles computed by BigQuery's APPROX_QUANTILES, from which the requested quantiles are picked
+    bigquery_approx_quantiles_resolution = 1000
+    # The relative error each dialect documents for its approximate count of distinct values
+    _approximate_count_distinct_relative_errors = {
+        # "up to a 2% error rate within a 97% probability"
+        "mssql": 0.02,
+        # HyperLogLog++ with the default precision of 15
+        "bigquery": 1.04 / 2 ** 7.5,
+        # "an average relative error of approximately 1.62338%"
+        "snowflake": 0.0162338,
+        # "a standard error of 2.3%"
+        "awsathena": 0.023,
+        # "a relative error of around 2%"
+        "redshift": 0.02,
+    }
+
     @classmethod
     def from_dataset(cls, dataset=None):
         if isinstance(dataset, SqlAlchemyDataset):
@@ -454,6 +563,10 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         *args,
         **kwargs,
     ):
+        # Metrics precomputed by fused queries during validate; see _prepare_validation
+        self.fuse_validation_queries = kwargs.pop("fuse_validation_queries", True)
+        # Upper bound on the expectations evaluated concurrently by validate; see _get_max_concurrent_expectations
+        self.max_concurrent_expectations = kwargs.pop("max_concurrent_expectations", 1)
 
         if custom_sql and not table_name:
             # NOTE: Eugene 2020-01-31: @James, this is a not a proper fix, but without it the "public" schema
@@ -644,8 +757,204 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             ),
         )
 
+    @property
+    def _fused_metric_cache(self):
+        """Metrics precomputed by fused queries for the validate call running on this thread."""
+        validation_run = self._get_active_validation_run()
+        if validation_run is None:
+            return {}
+        return validation_run.metrics
+
+    def _get_fused_metric(self, key):
+        """Return a metric precomputed by a fused validation query, or None if it was not precomputed."""
+        return self._fused_metric_cache.get(key)
+
+    def _get_max_concurrent_expectations(self):
+        """Bound max_concurrent_expectations by the number of connections the engine can hand out at once.
+
+        A dataset bound to a single connection (as sqlite, mssql and snowflake datasets are, so that their temporary
+        tables stay visible) or to a pool that shares one connection between threads is validated sequentially.
+        """
+        if self.max_concurrent_expectations <= 1 or not isinstance(
+            self.engine, sa.engine.Engine
+        ):
+            return 1
+        pool = self.engine.pool
+        if isinstance(pool, sa.pool.NullPool):
+            return self.max_concurrent_expectations
+        if isinstance(pool, sa.pool.QueuePool):
+            if pool._max_overflow < 0:
+                return self.max_concurrent_expectations
+            return min(
+                self.max_concurrent_expectations, pool.size() + pool._max_overflow
+            )
+        return 1
+
+    def _prepare_validation(self, expectations, evaluation_parameters):
+        """Fuse the counts and aggregates needed by the suite into as few table scans as possible.
+
+        Every column_map_expectation is compiled into a pair of ``SUM(CASE ...)`` columns (null and unexpected
+        counts), and the row count, column summaries (see get_column_summary) and sums needed by column aggregate
+        expectations are selected together, so that a suite costs a handful of queries rather than one or two per expectation.
+        Each expectation then picks its result from the fused metric cache. Expectations that cannot be planned (for
+        example, because an evaluation parameter is missing) and statements that fail to execute are simply left to
+        the regular per-expectation code path, which reports errors as before.
+        """
+        if (
+            not self.fuse_validation_queries
+            or not self._config.get("interactive_evaluation", True)
+            or self.sql_engine_dialect.name.lower() == "mssql"
+        ):
+            return
+
+        map_selects = []
+        aggregate_metrics = {}
+        for expectation in expectations:
+            expectation_method = getattr(self, expectation.expectation_type, None)
+            if expectation_method is None:
+                continue
+            try:
+                evaluation_args, _ = build_evaluation_parameters(
+                    expectation.kwargs,
+                    evaluation_parameters,
+                    True,
+                    self._get_validation_data_context(),
+                )
+            except Exception:
+                continue
+            column = evaluation_args.pop("column", None)
+            if column is None or not isinstance(column, str):
+                continue
+            if self.batch_kwargs.get("use_quoted_name"):
+                column = quoted_name(column, quote=True)
+            for arg in ["include_config", "catch_exceptions", "meta"]:
+                evaluation_args.pop(arg, None)
+
+            condition_func = getattr(
+                expectation_method, "_column_map_condition_func", None
+            )
+            if condition_func is not None:
+                if not self._is_column_map_condition_supported(
+                    expectation.expectation_type, column
+                ):
+                    continue
+                evaluation_args.pop("mostly", None)
+                evaluation_args.pop("result_format", None)
+                evaluation_args = recursively_convert_to_json_serializable(
+                    evaluation_args
+                )
+                try:
+                    (
+                        expected_condition,
+                        ignore_values_condition,
+                    ) = self._get_column_map_conditions(
+                        condition_func, column, **evaluation_args
+                    )
+                except Exception:
+                    continue
+                key = self._get_column_map_fused_key(
+                    condition_func.__name__, column, (), evaluation_args
+                )
+                map_selects.append((key, expected_condition, ignore_values_condition))
+            elif expectation.expectation_type in self._fusable_column_aggregates:
+                summary_selects = self._get_column_summary_selects(column)
+                # the summary may already be cached, e.g. by a profiler (see Dataset.cache_column_profile_metrics)
+                if not all(
+                    (metric_name, str(column)) in self._metric_cache
+                    for metric_name, _ in summary_selects
+                ):
+                    for metric_name, select in summary_selects:
+                        aggregate_metrics[(metric_name, str(column))] = select
+                if expectation.expectation_type == "expect_column_sum_to_be_between":
+                    aggregate_metrics[("column_sum", str(column))] = sa.func.sum(
+                        sa.column(column)
+                    )
+
+        if aggregate_metrics:
+            aggregate_metrics[("row_count",)] = sa.func.count()
+            self._execute_fused_query(
+                [
+                    (key, select.label(f"metric_{idx}"))
+                    for idx, (key, select) in enumerate(aggregate_metrics.items())
+                ]
+            )
+
+        batch_size = self.max_fused_expectations_per_query
+        for batch_start in range(0, len(map_selects), batch_size):
+            self._execute_fused_column_map_query(
+                map_selects[batch_start : batch_start + batch_size]
+            )
+
+    def _is_column_map_condition_supported(self, expectation_type, column):
+        """Return whether the dialect supports the condition of a column_map_expectation, without logging."""
+        if expectation_type in self._regex_column_map_expectations:
+            return self._get_dialect_regex_expression(column, "") is not None
+        if expectation_type in self._like_pattern_column_map_expectations:
+            return self._get_dialect_like_pattern_expression(column, "") is not None
+        return True
+
+    def _execute_fused_column_map_query(self, map_selects):
+        selects = [sa.func.count().label("element_count")]
+        for idx, (_, expected_condition, ignore_values_condition) in enumerate(
+            map_selects
+        ):
+            selects.append(
+                sa.func.sum(sa.case([(ignore_values_condition, 1)], else_=0)).label(
+                    f"null_count_{idx}"
+                )
+            )
+            selects.append(
+                sa.func.sum(
+                    sa.case(
+                        [
+                            (
+                                sa.and_(
+                                    sa.not_(expected_condition),
+                                    sa.not_(ignore_values_condition),
+                                ),
+                                1,
+                            )
+                        ],
+                        else_=0,
+                    )
+                ).label(f"unexpected_count_{idx}")
+            )
+        try:
+            row = self.engine.execute(
+                sa.select(selects).select_from(self._table)
+            ).fetchone()
+        except Exception as e:
+            logger.debug(
+                f"Unable to execute fused column map query; falling back to per-expectation queries: {e}"
+            )
+            return
+        for idx, (key, _, _) in enumerate(map_selects):
+            self._fused_metric_cache[("column_map_counts", key)] = {
+                "element_count": row["element_count"],
+                "null_count": row[f"null_count_{idx}"],
+                "unexpected_count": row[f"unexpected_count_{idx}"],
+            }
+
+    def _execute_fused_query(self, keyed_selects):
+        try:
+            row = self.engine.execute(
+                sa.select([select for _, select in keyed_selects]).select_from(
+                    self._table
+                )
+            ).fetchone()
+        except Exception as e:
+            logger.debug(
+                f"Unable to execute fused aggregate query; falling back to per-metric queries: {e}"
+            )
+            return
+        for idx, (key, _) in enumerate(keyed_selects):
+            self._fused_metric_cache[key] = row[idx]
+
     def get_row_count(self, table_name=None):
         if table_name is None:
+            fused_row_count = self._get_fused_metric(("row_count",))
+            if fused_row_count is not None:
+                return int(fused_row_count)
             table_name = self._table
         else:
             table_name = sa.table(table_name)
@@ -659,6 +968,11 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return [col["name"] for col in self.columns]
 
     def get_column_nonnull_count(self, column):
+        fused_nonnull_count = self._get_fused_metric(
+            ("column_nonnull_count", str(column))
+        )
+        if fused_nonnull_count is not None:
+            return int(fused_nonnull_count)
         ignore_values = [None]
         count_query = sa.select(
             [
@@ -689,6 +1003,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return element_count - null_count
 
     def get_column_sum(self, column):
+        if ("column_sum", str(column)) in self._fused_metric_cache:
+            return self._fused_metric_cache[("column_sum", str(column))]
         return self.engine.execute(
             sa.select([sa.func.sum(sa.column(column))]).select_from(self._table)
         ).scalar()
@@ -696,6 +1012,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     def get_column_max(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
+        if ("column_max", str(column)) in self._fused_metric_cache:
+            return self._fused_metric_cache[("column_max", str(column))]
         return self.engine.execute(
             sa.select([sa.func.max(sa.column(column))]).select_from(self._table)
         ).scalar()
@@ -703,6 +1021,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     def get_column_min(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
+        if ("column_min", str(column)) in self._fused_metric_cache:
+            return self._fused_metric_cache[("column_min", str(column))]
         return self.engine.execute(
             sa.select([sa.func.min(sa.column(column))]).select_from(self._table)
         ).scalar()
@@ -741,18 +1061,93 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return series
 
     def get_column_mean(self, column):
+        if ("column_mean", str(column)) in self._fused_metric_cache:
+            return self._fused_metric_cache[("column_mean", str(column))]
         return self.engine.execute(
             sa.select([sa.func.avg(sa.column(column))]).select_from(self._table)
         ).scalar()
 
-    def get_column_unique_count(self, column):
+    def get_column_unique_count(self, column, allow_relative_error=False):
+        if get_relative_error(allow_relative_error) is not None:
+            approximate_count_distinct = self._get_approximate_count_distinct(column)
+            if approximate_count_distinct is not None:
+                return self.engine.execute(
+                    sa.select([approximate_count_distinct]).select_from(self._table)
+                ).scalar()
+            # Without a native approximation, the exact count on the server is cheaper than streaming the column
         return self.engine.execute(
             sa.select([sa.func.count(sa.func.distinct(sa.column(column)))]).select_from(
                 self._table
             )
         ).scalar()
 
-    def get_column_median(self, column):
+    def get_column_unique_count_relative_error(
+        self, column, allow_relative_error=False
+    ):
+        if (
+            get_relative_error(allow_relative_error) is None
+            or self._get_approximate_count_distinct(column) is None
+        ):
+            # counted exactly with COUNT(DISTINCT)
+            return None
+        return self._approximate_count_distinct_relative_errors[
+            self.sql_engine_dialect.name.lower()
+        ]
+
+    def _get_approximate_count_distinct(self, column):
+        """Return the dialect's approximate count of distinct values of a column, or None if it has none.
+
+        The precision of these approximations is fixed by the database (typically a HyperLogLog sketch with a
+        relative error of 1 to 2%).
+        """
+        dialect_name = self.sql_engine_dialect.name.lower()
+        if dialect_name in ["mssql", "bigquery", "snowflake"]:
+            return sa.func.approx_count_distinct(sa.column(column))
+        if dialect_name == "awsathena":
+            return sa.func.approx_distinct(sa.column(column))
+        if dialect_name == "redshift":
+            return sa.literal_column(
+                "APPROXIMATE COUNT(DISTINCT {})".format(
+                    self.sql_engine_dialect.identifier_preparer.quote(column)
+                )
+            )
+        return None
+
+    def get_column_cardinality_sketch(
+        self, column: str, relative_error: float = DEFAULT_RELATIVE_ERROR
+    ) -> HyperLogLog:
+        sketch: HyperLogLog = HyperLogLog.from_relative_error(relative_error)
+        for values in self._iter_column_value_batches(column):
+            sketch.update(values)
+        return sketch
+
+    def _iter_column_value_batches(self, column: str):
+        """Stream the non-null values of a column in arrays of quantile_sketch_fetch_size values."""
+        result = self.engine.execution_options(stream_results=True).execute(
+            sa.select([sa.column(column)])
+            .where(sa.column(column) != None)
+            .select_from(self._table)
+        )
+        try:
+            while True:
+                rows = result.fetchmany(self.quantile_sketch_fetch_size)
+                if not rows:
+                    break
+                yield np.array([row[0] for row in rows])
+        finally:
+            result.close()
+
+    def get_column_median(self, column, allow_relative_error=False):
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is not None:
+            if self.client_side_quantile_sketches:
+                return self.get_column_quantile_sketch(
+                    column, relative_error
+                ).get_median()
+            approximate_quantiles = self._get_approximate_quantiles(column, [0.5])
+            if approximate_quantiles is not None:
+                return approximate_quantiles[0]
+            # Without a native approximation, the exact median is computed on the server
         # AWS Athena does not support offset
         if self.sql_engine_dialect.name.lower() == "awsathena":
             raise NotImplementedError("AWS Athena does not support OFFSET.")
@@ -787,6 +1182,21 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     def get_column_quantiles(
         self, column: str, quantiles: Iterable, allow_relative_error: bool = False
     ) -> list:
+        relative_error = get_relative_error(allow_relative_error)
+        if relative_error is not None:
+            if (
+                self.client_side_quantile_sketches
+                or self.sql_engine_dialect.name.lower()
+                in self._dialects_without_percentiles
+            ):
+                return self.get_column_quantile_sketch(
+                    column, relative_error
+                ).get_quantiles(quantiles)
+            approximate_quantiles = self._get_approximate_quantiles(column, quantiles)
+            if approximate_quantiles is not None:
+                return approximate_quantiles
+            # Otherwise, percentile_disc is computed on the server below (approximately, on Redshift)
+
         if self.sql_engine_dialect.name.lower() == "mssql":
             return self._get_column_quantiles_mssql(column=column, quantiles=quantiles)
         elif self.sql_engine_dialect.name.lower() == "bigquery":
@@ -802,6 +1212,41 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 allow_relative_error=allow_relative_error,
             )
 
+    def _get_approximate_quantiles(self, column: str, quantiles: Iterable):
+        """Compute quantiles with the dialect's native approximate percentile function, or return None if it has
+        none. The precision of these approximations is fixed by the database."""
+        dialect_name = self.sql_engine_dialect.name.lower()
+        if dialect_name in ("snowflake", "awsathena"):
+            selects = [
+                sa.func.approx_percentile(sa.column(column), quantile)
+                for quantile in quantiles
+            ]
+        elif dialect_name == "bigquery":
+            # APPROX_QUANTILES returns the boundaries of n buckets; pick the boundary closest to each quantile
+            resolution = self.bigquery_approx_quantiles_resolution
+            quoted_column = self.sql_engine_dialect.identifier_preparer.quote(column)
+            selects = [
+                sa.literal_column(
+                    "APPROX_QUANTILES({}, {})[OFFSET({})]".format(
+                        quoted_column, resolution, int(round(quantile * resolution))
+                    )
+                )
+                for quantile in quantiles
+            ]
+        else:
+            return None
+        return list(
+            self.engine.execute(sa.select(selects).select_from(self._table)).fetchone()
+        )
+
+    def get_column_quantile_sketch(
+        self, column: str, relative_error: float = DEFAULT_RELATIVE_ERROR
+    ) -> KLLSketch:
+        sketch: KLLSketch = KLLSketch.from_relative_error(relative_error)
+        for values in self._iter_column_value_batches(column):
+            sketch.update(values)
+        return sketch
+
     def _get_column_quantiles_mssql(self, column: str, quantiles: Iterable) -> list:
         # mssql requires over(), so we add an empty over() clause
         selects: List[WithinGroup] = [
@@ -945,6 +1390,9 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                 )
 
     def get_column_stdev(self, column):
+        fused_stdev = self._get_fused_metric(("column_stdev", str(column)))
+        if fused_stdev is not None:
+            return float(fused_stdev)
         if self.sql_engine_dialect.name.lower() == "mssql":
             # Note: "stdev_samp" is not a recognized built-in function name (but "stdev" does exist for "mssql").
             # This function is used to compute statistical standard deviation from sample data (per the reference in
@@ -962,6 +1410,116 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             ).fetchone()
         return float(res[0])
 
+    def _get_column_summary_selects(self, column):
+        """Return the (metric_name, select) pairs that compute the column summary of column in a single query.
+
+        The mean and standard deviation are only selected for columns reflected with a numeric type, so that the
+        query cannot fail on dialects that reject AVG over strings; the standard deviation is also skipped for
+        dialects without a sample standard deviation function (sqlite).
+        """
+        selects = [
+            ("column_nonnull_count", sa.func.count(sa.column(column))),
+            ("column_min", sa.func.min(sa.column(column))),
+            ("column_max", sa.func.max(sa.column(column))),
+        ]
+        column_type = next(
+            (
+                col.get("type")
+                for col in self.columns
+                if str(col.get("name")) == str(column)
+            ),
+            None,
+        )
+        if isinstance(column_type, (sa.types.Integer, sa.types.Numeric)):
+            selects.append(("column_mean", sa.func.avg(sa.column(column))))
+            dialect_name = self.sql_engine_dialect.name.lower()
+            if dialect_name == "mssql":
+                selects.append(("column_stdev", sa.func.stdev(sa.column(column))))
+            elif dialect_name != "sqlite":
+                selects.append(("column_stdev", sa.func.stddev_samp(sa.column(column))))
+        return selects
+
+    def get_column_summary(self, column):
+        summary_selects = self._get_column_summary_selects(column)
+        if all(
+            (metric_name, str(column)) in self._fused_metric_cache
+            for metric_name, _ in summary_selects
+        ):
+            values = [
+                self._fused_metric_cache[(metric_name, str(column))]
+                for metric_name, _ in summary_selects
+            ]
+        else:
+            values = self.engine.execute(
+                sa.select(
+                    [
+                        select.label(f"metric_{idx}")
+                        for idx, (_, select) in enumerate(summary_selects)
+                    ]
+                ).select_from(self._table)
+            ).fetchone()
+        return self._parse_column_summary(summary_selects, values)
+
+    @staticmethod
+    def _parse_column_summary(summary_selects, values):
+        column_summary = {}
+        for (metric_name, _), value in zip(summary_selects, values):
+            if metric_name == "column_nonnull_count":
+                value = int(value or 0)
+            elif metric_name == "column_stdev":
+                if value is None:
+                    continue
+                value = float(value)
+            column_summary[metric_name] = value
+        return column_summary
+
+    def get_column_profile_metrics(self, columns):
+        """Select the column summary and the number of distinct values of every column in a single query (or one per
+        max_profiled_columns_per_query columns). Columns whose query fails are left to their own getters."""
+        column_selects = [
+            (
+                column,
+                self._get_column_summary_selects(column)
+                + [
+                    (
+                        "column_unique_count",
+                        sa.func.count(sa.func.distinct(sa.column(column))),
+                    )
+                ],
+            )
+            for column in columns
+        ]
+        column_profile_metrics = {}
+        batch_size = self.max_profiled_columns_per_query
+        for batch_start in range(0, len(column_selects), batch_size):
+            batch = column_selects[batch_start : batch_start + batch_size]
+            selects = [
+                select for _, column_select in batch for _, select in column_select
+            ]
+            try:
+                row = self.engine.execute(
+                    sa.select(
+                        [
+                            select.label(f"metric_{idx}")
+                            for idx, select in enumerate(selects)
+                        ]
+                    ).select_from(self._table)
+                ).fetchone()
+            except Exception as e:
+                logger.debug(
+                    f"Unable to execute batched profiling query; metrics will be computed one at a time: {e}"
+                )
+                continue
+            values = iter(row)
+            for column, column_select in batch:
+                column_values = [next(values) for _ in column_select]
+                column_metrics = self._parse_column_summary(
+                    column_select[:-1], column_values[:-1]
+                )
+                column_metrics["column_unique_count"] = column_values[-1]
+                column_profile_metrics[column] = column_metrics
+        return column_profile_metrics
+
     def get_column_hist(self, column, bins):
         """return a list of counts corresponding to bins
 
@@ -622,3 +622,40 @@ def check_sql_engine_dialect(
         return isinstance(actual_sql_engine_dialect, candidate_sql_engine_dialect)
     except (AttributeError, TypeError):
         return False
+
+
+# table expectations that do not depend on the columns of the table
+COLUMN_INDEPENDENT_TABLE_EXPECTATIONS = {
+    "expect_table_row_count_to_equal",
+    "expect_table_row_count_to_be_between",
+}
+
+
+def get_expectation_columns(expectations):
+    """Return the columns referenced by a list of expectation configurations, in order, or None if the expectations
+    may depend on other columns (e.g. an expectation on the list of columns of the table, or with a row_condition).
+    """
+    columns = []
+    for expectation in expectations:
+        kwargs = expectation.kwargs
+        if kwargs.get("row_condition"):
+            return None
+        expectation_columns = [
+            kwargs[kwarg]
+            for kwarg in ("column", "column_A", "column_B")
+            if kwarg in kwargs
+        ]
+        expectation_columns.extend(kwargs.get("column_list") or [])
+        if (
+            not expectation_columns
+            and expectation.expectation_type
+            not in COLUMN_INDEPENDENT_TABLE_EXPECTATIONS
+        ):
+            return None
+        for column in expectation_columns:
+            # columns given by evaluation parameters are only known at validation time
+            if not isinstance(column, str):
+                return None
+            if column not in columns:
+                columns.append(column)
+    return columns
@@ -8,6 +8,9 @@ from io import BytesIO
 import pandas as pd
 
 from great_expectations.core.batch import Batch
+from great_expectations.dataset.chunked_pandas_dataset import (
+    ChunkedPandasBatchReference,
+)
 from great_expectations.datasource.types import BatchMarkers
 from great_expectations.exceptions import BatchKwargsError
 from great_expectations.types import ClassConfig
@@ -197,6 +200,27 @@ class PandasDatasource(Datasource):
             path = batch_kwargs["path"]
             reader_method = batch_kwargs.get("reader_method")
             reader_fn = self._get_reader_fn(reader_method, path)
+            if batch_kwargs.get("chunksize"):
+                # Stream the file rather than loading it; the data cannot be fingerprinted without reading it all
+                try:
+                    batch_reference = ChunkedPandasBatchReference(
+                        reader_fn,
+                        path,
+                        reader_options=reader_options,
+                        chunksize=batch_kwargs["chunksize"],
+                    )
+                except ValueError as e:
+                    raise BatchKwargsError(str(e), batch_kwargs)
+
+                return Batch(
+                    datasource_name=self.name,
+                    batch_kwargs=batch_kwargs,
+                    data=batch_reference,
+                    batch_parameters=batch_parameters,
+                    batch_markers=batch_markers,
+                    data_context=self._data_context,
+                )
+
             df = reader_fn(path, **reader_options)
 
         elif "s3" in batch_kwargs:
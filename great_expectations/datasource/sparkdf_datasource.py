@@ -15,6 +15,7 @@ logger = logging.getLogger(__name__)
 
 try:
     from pyspark.sql import DataFrame, SparkSession
+    from pyspark.sql.functions import col
 except ImportError:
     SparkSession = None
     # TODO: review logging more detail here
@@ -32,6 +33,18 @@ class SparkDFDatasource(Datasource):
         - InMemoryBatchKwargs ("dataset" key)
         - QueryBatchKwargs ("query" key)
 
+    The rows and columns of any batch can be restricted with these additional batch kwargs, which are applied to the
+    DataFrame before it is validated, so that Spark pushes them into the reader (e.g. to skip the partitions and
+    columns of a Parquet dataset that are not needed):
+        - "partition_filters": a dict of column names to the value (or list of values) the rows must have
+        - "predicates": a list of SQL expressions the rows must satisfy
+        - "sample": a dict with the "fraction" of rows to keep and, optionally, a "seed" and "with_replacement"
+        - "columns": the list of columns to keep
+        - "project_suite_columns": if true, only keep the columns referenced by the expectation suite the batch is
+          created with, unless the suite depends on other columns (see Validator.get_suite_columns). The batch can
+          then only validate expectations on those columns: validating it with a suite that needs other columns
+          (e.g. the suites of WarningAndFailureExpectationSuitesValidationOperator) raises a ValueError
+
 --ge-feature-maturity-info--
 
     id: datasource_hdfs_spark
@@ -217,6 +230,8 @@ class SparkDFDatasource(Datasource):
                 "Unrecognized batch_kwargs for spark_source", batch_kwargs
             )
 
+        df = self._apply_batch_filters(df, batch_kwargs)
+
         if "limit" in batch_kwargs:
             df = df.limit(batch_kwargs["limit"])
 
@@ -229,6 +244,46 @@ class SparkDFDatasource(Datasource):
             data_context=self._data_context,
         )
 
+    @staticmethod
+    def _apply_batch_filters(df, batch_kwargs):
+        """Restrict df to the partitions, rows and columns selected by batch_kwargs."""
+        partition_filters = batch_kwargs.get("partition_filters") or {}
+        if not isinstance(partition_filters, dict):
+            raise BatchKwargsError(
+                "partition_filters must be a dict of column names to values",
+                batch_kwargs,
+            )
+        for column, value in partition_filters.items():
+            if isinstance(value, (list, tuple, set)):
+                df = df.filter(col(column).isin(list(value)))
+            else:
+                df = df.filter(col(column) == value)
+
+        predicates = batch_kwargs.get("predicates") or []
+        if isinstance(predicates, str):
+            predicates = [predicates]
+        for predicate in predicates:
+            df = df.filter(predicate)
+
+        sample = batch_kwargs.get("sample")
+        if sample is not None:
+            if not isinstance(sample, dict) or "fraction" not in sample:
+                raise BatchKwargsError(
+                    "sample must be a dict with the fraction of rows to keep",
+                    batch_kwargs,
+                )
+            df = df.sample(
+                withReplacement=sample.get("with_replacement", False),
+                fraction=sample["fraction"],
+                seed=sample.get("seed"),
+            )
+
+        columns = batch_kwargs.get("columns")
+        if columns is not None:
+            df = df.select(*columns)
+
+        return df
+
     @staticmethod
     def guess_reader_method_from_path(path):
         if path.endswith(".csv") or path.endswith(".tsv"):
@@ -136,6 +136,9 @@ class BasicDatasetProfiler(BasicDatasetProfilerBase):
         df.set_config_value("interactive_evaluation", False)
 
         columns = df.get_table_columns()
+        # Compute the statistics every column needs (its cardinality and summary) in one pass or batched query,
+        # rather than one scan per expectation; the expectations below and the validation of the suite reuse them
+        df.cache_column_profile_metrics(columns)
 
         meta_columns = {}
         for column in columns:
@@ -1,14 +1,24 @@
+import hashlib
+import json
 import logging
 import os
 import traceback
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 import great_expectations.exceptions as exceptions
-from great_expectations.core import nested_update
+from great_expectations import __version__ as ge_version
+from great_expectations.core import (
+    ExpectationSuiteValidationResult,
+    convert_to_json_serializable,
+    nested_update,
+)
 from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
     SiteSectionIdentifier,
 )
+from great_expectations.data_context.store.validations_store import ValidationsStore
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
@@ -49,6 +59,9 @@ class SiteBuilder:
         (filesystem or S3)
         * where the HTML files should be written (filesystem or S3)
         * which renderer and view class should be used to render each section
+        * how many worker processes render pages in parallel (max_workers; by
+        default, pages are rendered one at a time in the calling process).
+        With max_workers > 1, renderers and views must be picklable.
 
     Here is an example of a minimal configuration for a site::
 
@@ -69,6 +82,7 @@ class SiteBuilder:
                 class_name: TupleS3StoreBackend
                 bucket: data_docs.my_company.com
                 prefix: /data_docs/
+            max_workers: 4
             site_index_builder:
                 class_name: DefaultSiteIndexBuilder
 
@@ -114,12 +128,15 @@ class SiteBuilder:
         show_how_to_buttons=True,
         site_section_builders=None,
         runtime_environment=None,
+        use_build_manifest=True,
+        max_workers=1,
         **kwargs,
     ):
         self.site_name = site_name
         self.data_context = data_context
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
+        self.max_workers = max_workers
 
         usage_statistics_config = data_context.anonymous_usage_statistics
         data_context_id = None
@@ -161,6 +178,10 @@ class SiteBuilder:
         self.target_store = HtmlSiteStore(
             store_backend=store_backend, runtime_environment=runtime_environment
         )
+        # Records the pages rendered by previous builds, so that only new or changed resources are rendered again
+        self.build_manifest = (
+            SiteBuildManifest(self.target_store) if use_build_manifest else None
+        )
 
         default_site_section_builders_config = {
             "expectations": {
@@ -221,6 +242,8 @@ class SiteBuilder:
                     "custom_views_directory": custom_views_directory,
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
+                    "build_manifest": self.build_manifest,
+                    "max_workers": self.max_workers,
                 },
                 config_defaults={"name": site_section_name, "module_name": module_name},
             )
@@ -252,6 +275,7 @@ class SiteBuilder:
                     if section_config not in FALSEY_YAML_STRINGS
                 },
                 "site_section_builders_config": site_section_builders,
+                "build_manifest": self.build_manifest,
             },
             config_defaults={
                 "name": "site_index_builder",
@@ -279,22 +303,49 @@ class SiteBuilder:
                             site renders) only for the resources in this list.
                             This supports incremental build of data docs sites
                             (e.g., when a new validation result is created)
-                            and avoids full rebuild.
+                            and avoids full rebuild. Without them, only the
+                            resources that are new or changed since the last
+                            build are rendered again (see SiteBuildManifest).
         :return:
         """
 
         # copy static assets
         self.target_store.copy_static_assets()
 
+        if self.build_manifest is not None:
+            self.build_manifest.load()
+
+        self._reconcile_validation_catalogs()
+
         for site_section, site_section_builder in self.site_section_builders.items():
             site_section_builder.build(resource_identifiers=resource_identifiers)
 
         index_page_resource_identifier_tuple = self.site_index_builder.build()
+
+        if self.build_manifest is not None:
+            self.build_manifest.save()
+
         return (
             self.get_resource_url(only_if_exists=False),
             index_page_resource_identifier_tuple[1],
         )
 
+    def _reconcile_validation_catalogs(self):
+        """Reconcile the catalog of every validations store the site is built from with its store backend.
+
+        Results may have been stored or removed by other means than this store (another process, the CLI, a sync of
+        the backend or a manual deletion), so each backend is listed once per build, as the site was always built
+        from the listing of its stores.
+        """
+        reconciled_stores = []
+        for site_section_builder in self.site_section_builders.values():
+            source_store = getattr(site_section_builder, "source_store", None)
+            if isinstance(source_store, ValidationsStore) and not any(
+                source_store is store for store in reconciled_stores
+            ):
+                source_store.refresh_catalog()
+                reconciled_stores.append(source_store)
+
     def get_resource_url(self, resource_identifier=None, only_if_exists=True):
         """
         Return the URL of the HTML document that renders a resource
@@ -313,6 +364,9 @@ class SiteBuilder:
 
 
 class DefaultSiteSectionBuilder:
+    # the number of resources fetched at once from the source store
+    resource_batch_size = 64
+
     def __init__(
         self,
         name,
@@ -327,6 +381,8 @@ class DefaultSiteSectionBuilder:
         renderer=None,
         view=None,
         data_context_id=None,
+        build_manifest=None,
+        max_workers=1,
         **kwargs,
     ):
         self.name = name
@@ -336,6 +392,24 @@ class DefaultSiteSectionBuilder:
         self.validation_results_limit = validation_results_limit
         self.data_context_id = data_context_id
         self.show_how_to_buttons = show_how_to_buttons
+        self.build_manifest = build_manifest
+        if max_workers is None or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        self.max_workers = max_workers
+        # Pages rendered with a different configuration (or version of Great Expectations) are rendered again
+        self.build_signature = json.dumps(
+            {
+                "ge_version": ge_version,
+                "renderer": renderer,
+                "view": view,
+                "custom_styles_directory": custom_styles_directory,
+                "custom_views_directory": custom_views_directory,
+                "data_context_id": data_context_id,
+                "show_how_to_buttons": show_how_to_buttons,
+            },
+            sort_keys=True,
+            default=str,
+        )
 
         if renderer is None:
             raise exceptions.InvalidConfigError(
@@ -380,12 +454,73 @@ class DefaultSiteSectionBuilder:
             )
 
     def build(self, resource_identifiers=None):
-        source_store_keys = self.source_store.list_keys()
-        if self.name == "validations" and self.validation_results_limit:
-            source_store_keys = sorted(
-                source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
-            )[: self.validation_results_limit]
+        # With max_workers > 1, pages are rendered in worker processes, at most 2 * max_workers at a time; they are
+        # written to the site (and errors are reported) here, in the order of the source store keys
+        executor = None
+        if self.max_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        pending_pages = deque()
+        try:
+            for resource_key, resource, content_hash in self._get_resources_to_render(
+                resource_identifiers
+            ):
+                render_args = (
+                    self.renderer_class,
+                    self.view_class,
+                    resource,
+                    self.data_context_id,
+                    self.show_how_to_buttons,
+                )
+                if executor is None:
+                    self._write_page(
+                        resource_key,
+                        resource,
+                        content_hash,
+                        partial(_render_page, *render_args),
+                    )
+                    continue
 
+                pending_pages.append(
+                    (
+                        resource_key,
+                        resource,
+                        content_hash,
+                        executor.submit(_render_page, *render_args),
+                    )
+                )
+                if len(pending_pages) >= 2 * self.max_workers:
+                    self._write_pending_page(pending_pages)
+
+            while pending_pages:
+                self._write_pending_page(pending_pages)
+        finally:
+            if executor is not None:
+                for *_, future in pending_pages:
+                    future.cancel()
+                executor.shutdown()
+
+    def _get_resources_to_render(self, resource_identifiers=None):
+        """Yield the (resource_key, resource, content_hash) of every resource whose page must be rendered."""
+        if isinstance(self.source_store, ValidationsStore):
+            # the catalog of the store lists the latest results without sorting every key of the store backend
+            source_store_keys = self.source_store.list_latest_keys(
+                limit=self.validation_results_limit
+                if self.name == "validations"
+                else None
+            )
+        else:
+            source_store_keys = self.source_store.list_keys()
+            if self.name == "validations" and self.validation_results_limit:
+                source_store_keys = sorted(
+                    source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
+                )[: self.validation_results_limit]
+
+        site_keys = None
+        if self.build_manifest is not None:
+            self.build_manifest.set_section_signature(self.name, self.build_signature)
+            site_keys = set(self._list_site_keys())
+
+        resource_keys = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -400,14 +535,32 @@ class DefaultSiteSectionBuilder:
                     resource_key, self.run_name_filter
                 ):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
-                )
+            resource_keys.append(resource_key)
+
+        for resource_key, serialized_resource in self._get_serialized_resources(
+            resource_keys
+        ):
+            if not serialized_resource:
                 continue
 
+            content_hash = None
+            if self.build_manifest is not None:
+                content_hash = get_content_hash(serialized_resource)
+                page = self.build_manifest.get_page(self.name, resource_key)
+                if (
+                    page is not None
+                    and page.get("content_hash") == content_hash
+                    and resource_key in site_keys
+                ):
+                    logger.debug(
+                        "        Skipping {}: its page is up to date".format(
+                            str(resource_key)
+                        )
+                    )
+                    continue
+
+            resource = self.source_store.deserialize(resource_key, serialized_resource)
+
             if isinstance(resource_key, ExpectationSuiteIdentifier):
                 expectation_suite_name = resource_key.expectation_suite_name
                 logger.debug(
@@ -439,32 +592,93 @@ class DefaultSiteSectionBuilder:
                         )
                     )
 
+            yield resource_key, resource, content_hash
+
+    def _get_serialized_resources(self, resource_keys):
+        """Yield the (resource_key, serialized_resource) of the given keys, fetching up to resource_batch_size
+        resources at once from the store backend (which may fetch them concurrently). serialized_resource is None
+        for a resource that could not be retrieved."""
+        store_backend = self.source_store.store_backend
+        for batch_start in range(0, len(resource_keys), self.resource_batch_size):
+            batch_keys = resource_keys[
+                batch_start : batch_start + self.resource_batch_size
+            ]
             try:
-                rendered_content = self.renderer_class.render(resource)
-                viewable_content = self.view_class.render(
-                    rendered_content,
-                    data_context_id=self.data_context_id,
-                    show_how_to_buttons=self.show_how_to_buttons,
+                serialized_resources = store_backend.get_many(
+                    [self.source_store.key_to_tuple(key) for key in batch_keys]
                 )
+            except exceptions.InvalidKeyError:
+                # fetch the resources of the batch one at a time, to skip only the missing ones
+                serialized_resources = []
+                for resource_key in batch_keys:
+                    try:
+                        serialized_resources.append(
+                            store_backend.get(
+                                self.source_store.key_to_tuple(resource_key)
+                            )
+                        )
+                    except exceptions.InvalidKeyError:
+                        logger.warning(
+                            f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+                        )
+                        serialized_resources.append(None)
+            yield from zip(batch_keys, serialized_resources)
+
+    def _write_pending_page(self, pending_pages):
+        resource_key, resource, content_hash, future = pending_pages.popleft()
+        self._write_page(resource_key, resource, content_hash, future.result)
+
+    def _write_page(self, resource_key, resource, content_hash, render):
+        """Render a page by calling render, and write it to the site. Errors are logged, so that a page that cannot be
+        rendered does not prevent the others from being built."""
+        try:
+            viewable_content = render()
 
-                self.target_store.set(
-                    SiteSectionIdentifier(
-                        site_section_name=self.name, resource_identifier=resource_key,
-                    ),
-                    viewable_content,
+            self.target_store.set(
+                SiteSectionIdentifier(
+                    site_section_name=self.name, resource_identifier=resource_key,
+                ),
+                viewable_content,
+            )
+            if self.build_manifest is not None:
+                self.build_manifest.set_page(
+                    self.name,
+                    resource_key,
+                    content_hash,
+                    index_info=self._get_index_info(resource),
                 )
-            except Exception as e:
-                exception_message = f"""\
+        except Exception as e:
+            exception_message = f"""\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
-                """
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{str(e)}".  '
-                    f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message, e, exc_info=True)
+            """
+            exception_traceback = traceback.format_exc()
+            exception_message += (
+                f'{type(e).__name__}: "{str(e)}".  '
+                f'Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message, e, exc_info=True)
+
+    def _list_site_keys(self):
+        key_class = self.source_store._key_class
+        try:
+            site_key_tuples = self.target_store.store_backends[key_class].list_keys()
+        except (KeyError, NotImplementedError):
+            return []
+        return [key_class.from_tuple(key_tuple) for key_tuple in site_key_tuples]
+
+    @staticmethod
+    def _get_index_info(resource):
+        """Return what the index page shows about a validation result, so that it need not be read again."""
+        if not isinstance(resource, ExpectationSuiteValidationResult):
+            return None
+        return {
+            "validation_success": resource.success,
+            "batch_kwargs": convert_to_json_serializable(
+                resource.meta.get("batch_kwargs", {})
+            ),
+        }
 
 
 class DefaultSiteIndexBuilder:
@@ -483,6 +697,7 @@ class DefaultSiteIndexBuilder:
         view=None,
         data_context_id=None,
         source_stores=None,
+        build_manifest=None,
         **kwargs,
     ):
         # NOTE: This method is almost identical to DefaultSiteSectionBuilder
@@ -495,6 +710,21 @@ class DefaultSiteIndexBuilder:
         self.show_how_to_buttons = show_how_to_buttons
         self.source_stores = source_stores or {}
         self.site_section_builders_config = site_section_builders_config or {}
+        self.build_manifest = build_manifest
+        # Like the pages of site sections, the index page is rendered again when its configuration changes
+        self.build_signature = json.dumps(
+            {
+                "ge_version": ge_version,
+                "renderer": renderer,
+                "view": view,
+                "custom_styles_directory": custom_styles_directory,
+                "custom_views_directory": custom_views_directory,
+                "data_context_id": data_context_id,
+                "show_how_to_buttons": show_how_to_buttons,
+            },
+            sort_keys=True,
+            default=str,
+        )
 
         if renderer is None:
             renderer = {
@@ -596,6 +826,25 @@ class DefaultSiteIndexBuilder:
 
         return index_links_dict
 
+    def _get_validation_index_info(self, validation_result_key, section_name):
+        """Return the success and batch_kwargs of a validation result.
+
+        They are taken from the build manifest when the result's page was rendered by this or a previous build, and
+        read from the source store otherwise.
+        """
+        if self.build_manifest is not None:
+            index_info = self.build_manifest.get_index_info(validation_result_key)
+            if index_info is not None:
+                return index_info["validation_success"], index_info["batch_kwargs"]
+
+        validation = self.data_context.get_validation_result(
+            batch_identifier=validation_result_key.batch_identifier,
+            expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
+            run_id=validation_result_key.run_id,
+            validations_store_name=self.source_stores.get(section_name),
+        )
+        return validation.success, validation.meta.get("batch_kwargs", {})
+
     def get_calls_to_action(self):
         usage_statistics = None
         # db_driver = None
@@ -701,11 +950,13 @@ class DefaultSiteIndexBuilder:
             and self.site_section_builders_config.get("expectations", "None")
             not in FALSEY_YAML_STRINGS
         ):
-            expectation_suite_source_keys = self.data_context.stores[
-                self.site_section_builders_config["expectations"].get(
-                    "source_store_name"
-                )
-            ].list_keys()
+            expectation_suite_source_keys = set(
+                self.data_context.stores[
+                    self.site_section_builders_config["expectations"].get(
+                        "source_store_name"
+                    )
+                ].list_keys()
+            )
             expectation_suite_site_keys = [
                 ExpectationSuiteIdentifier.from_tuple(expectation_suite_tuple)
                 for expectation_suite_tuple in self.target_store.store_backends[
@@ -719,6 +970,8 @@ class DefaultSiteIndexBuilder:
                         self.target_store.store_backends[
                             ExpectationSuiteIdentifier
                         ].remove_key(expectation_suite_site_key)
+                        if self.build_manifest is not None:
+                            self.build_manifest.remove_page(expectation_suite_site_key)
                     else:
                         cleaned_keys.append(expectation_suite_site_key)
                 expectation_suite_site_keys = cleaned_keys
@@ -746,9 +999,20 @@ class DefaultSiteIndexBuilder:
                 not in FALSEY_YAML_STRINGS
                 else "profiling"
             )
-            validation_and_profiling_result_source_keys = self.data_context.stores[
+            validation_and_profiling_result_source_store = self.data_context.stores[
                 self.site_section_builders_config[source_store].get("source_store_name")
-            ].list_keys()
+            ]
+            if isinstance(
+                validation_and_profiling_result_source_store, ValidationsStore
+            ):
+                # the catalog was reconciled with the store backend at the start of the build (see SiteBuilder.build)
+                validation_and_profiling_result_source_keys = set(
+                    validation_and_profiling_result_source_store.list_latest_keys()
+                )
+            else:
+                validation_and_profiling_result_source_keys = set(
+                    validation_and_profiling_result_source_store.list_keys()
+                )
             validation_and_profiling_result_site_keys = [
                 ValidationResultIdentifier.from_tuple(validation_result_tuple)
                 for validation_result_tuple in self.target_store.store_backends[
@@ -767,6 +1031,8 @@ class DefaultSiteIndexBuilder:
                         self.target_store.store_backends[
                             ValidationResultIdentifier
                         ].remove_key(validation_result_site_key)
+                        if self.build_manifest is not None:
+                            self.build_manifest.remove_page(validation_result_site_key)
                     else:
                         cleaned_keys.append(validation_result_site_key)
                 validation_and_profiling_result_site_keys = cleaned_keys
@@ -788,15 +1054,10 @@ class DefaultSiteIndexBuilder:
             ]
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
+                    _, batch_kwargs = self._get_validation_index_info(
+                        profiling_result_key, "profiling"
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
@@ -840,16 +1101,13 @@ class DefaultSiteIndexBuilder:
                 ]
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
+                    (
+                        validation_success,
+                        batch_kwargs,
+                    ) = self._get_validation_index_info(
+                        validation_result_key, "validations"
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
@@ -868,6 +1126,26 @@ class DefaultSiteIndexBuilder:
                     )
                     logger.warning(error_msg)
 
+        index_page_hash = None
+        if self.build_manifest is not None:
+            # the index page only changes with the links it lists, so it is not rendered again if they did not change
+            index_page_hash = get_content_hash(
+                json.dumps(
+                    [self.build_signature, index_links_dict],
+                    sort_keys=True,
+                    # e.g. run identifiers and call to action buttons
+                    default=lambda value: getattr(value, "__dict__", str(value)),
+                )
+            )
+            if self.build_manifest.get_index_page_hash() == index_page_hash and (
+                self.target_store.store_backends["index_page"].has_key(())
+            ):
+                logger.debug("The index page is unchanged since the last build")
+                return (
+                    self.target_store.get_url_for_resource(only_if_exists=False),
+                    index_links_dict,
+                )
+
         try:
             rendered_content = self.renderer_class.render(index_links_dict)
             viewable_content = self.view_class.render(
@@ -887,7 +1165,118 @@ diagnose and repair the underlying issue.  Detailed information follows:
             )
             logger.error(exception_message, e, exc_info=True)
 
-        return (self.target_store.write_index_page(viewable_content), index_links_dict)
+        index_page_url = self.target_store.write_index_page(viewable_content)
+        if self.build_manifest is not None:
+            self.build_manifest.set_index_page_hash(index_page_hash)
+        return (index_page_url, index_links_dict)
+
+
+def _render_page(renderer, view, resource, data_context_id, show_how_to_buttons):
+    """Render the HTML page of a resource. Runs in a worker process when pages are rendered in parallel."""
+    rendered_content = renderer.render(resource)
+    return view.render(
+        rendered_content,
+        data_context_id=data_context_id,
+        show_how_to_buttons=show_how_to_buttons,
+    )
+
+
+def get_content_hash(serialized_resource):
+    """Return a hash of a resource as it is serialized in its store."""
+    if isinstance(serialized_resource, str):
+        serialized_resource = serialized_resource.encode("utf-8")
+    return hashlib.sha1(serialized_resource).hexdigest()
+
+
+class SiteBuildManifest:
+    """SiteBuildManifest records the pages of a data docs site, so that a build only renders the resources that are
+    new or changed since the previous one.
+
+    For each site section, the manifest maps the key of every rendered resource to a hash of its content in the source
+    store and, for validation results, to what the index page shows about it (its success and batch_kwargs). A page is
+    rendered again when the content of its resource changes, when it is missing from the site, or when the renderer or
+    view configuration of its section changes. The manifest also keeps a hash of the links listed by the index page,
+    which is only rendered again when they change. The manifest is saved in the site itself (see HtmlSiteStore), so
+    cleaning the site also forgets it.
+    """
+
+    version = 1
+
+    def __init__(self, target_store):
+        self.target_store = target_store
+        self._sections = {}
+        self._index_page_hash = None
+
+    def load(self):
+        self._sections = {}
+        self._index_page_hash = None
+        try:
+            manifest = self.target_store.get_build_manifest()
+            if manifest:
+                manifest = json.loads(manifest)
+                if manifest.get("version") == self.version:
+                    self._sections = manifest["sections"]
+                    self._index_page_hash = manifest.get("index_page_hash")
+        except Exception as e:
+            logger.warning(
+                "Unable to read the build manifest of the data docs site; all pages will be rendered: {}".format(
+                    e
+                )
+            )
+
+    def save(self):
+        self.target_store.write_build_manifest(
+            json.dumps(
+                {
+                    "version": self.version,
+                    "sections": self._sections,
+                    "index_page_hash": self._index_page_hash,
+                }
+            )
+        )
+
+    def get_index_page_hash(self):
+        return self._index_page_hash
+
+    def set_index_page_hash(self, index_page_hash):
+        self._index_page_hash = index_page_hash
+
+    def set_section_signature(self, section_name, signature):
+        """Forget the pages of a section that were rendered with a different signature (i.e. configuration)."""
+        section = self._sections.get(section_name)
+        if section is None or section["signature"] != signature:
+            self._sections[section_name] = {"signature": signature, "pages": {}}
+
+    def get_page(self, section_name, resource_key):
+        section = self._sections.get(section_name)
+        if section is None:
+            return None
+        return section["pages"].get(self._get_manifest_key(resource_key))
+
+    def set_page(self, section_name, resource_key, content_hash, index_info=None):
+        self._sections[section_name]["pages"][self._get_manifest_key(resource_key)] = {
+            "content_hash": content_hash,
+            "index_info": index_info,
+        }
+
+    def remove_page(self, resource_key):
+        """Forget the page of a resource in every section, e.g. once the resource was deleted."""
+        manifest_key = self._get_manifest_key(resource_key)
+        for section in self._sections.values():
+            section["pages"].pop(manifest_key, None)
+
+    def get_index_info(self, resource_key):
+        """Return what the index page shows about a resource, as recorded when its page was rendered, or None."""
+        manifest_key = self._get_manifest_key(resource_key)
+        for section in self._sections.values():
+            page = section["pages"].get(manifest_key)
+            if page is not None and page.get("index_info") is not None:
+                return page["index_info"]
+        return None
+
+    @staticmethod
+    def _get_manifest_key(resource_key):
+        return json.dumps(list(resource_key.to_tuple()))
 
 
 class CallToActionButton:
@@ -1,6 +1,8 @@
 import logging
 import warnings
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 
 from dateutil.parser import parse
 
@@ -25,6 +27,15 @@ logger = logging.getLogger(__name__)
 logger = logging.getLogger(__name__)
 
 
+def _validate_batch(batch, run_id, result_format, evaluation_parameters):
+    """Validate one batch; module-level so that it can be sent to a worker process."""
+    return batch.validate(
+        run_id=run_id,
+        result_format=result_format,
+        evaluation_parameters=evaluation_parameters,
+    )
+
+
 class ValidationOperator:
     """
     The base class of all validation operators.
@@ -125,6 +136,18 @@ An instance of ActionListValidationOperator is included in the default configura
         action:
           class_name: UpdateDataDocsAction
 
+    # optional: validate up to max_workers batches at the same time, on a "thread" (default) or "process" pool.
+    # Actions still run for one batch at a time, in the order of assets_to_validate.
+    # max_workers: 4
+    # executor_type: thread
+
+Validating several batches at the same time is useful when they are independent and validation mostly waits on I/O
+(e.g. SQL queries). At most max_workers batches are loaded at a time. Batches whose expectation suites use evaluation
+parameters produced by other batches of the same run must be validated sequentially (the default): a batch validated
+concurrently does not see the evaluation parameters stored by the actions of the batches still being validated. With
+the "process" executor, batches must be picklable; evaluation parameters are then resolved from the data context
+once, when the batch is sent to a worker process.
+
 
 **Invocation**
 
@@ -193,11 +216,24 @@ The ``run`` method returns a ValidationOperatorResult object:
         action_list,
         name,
         result_format={"result_format": "SUMMARY"},
+        max_workers=1,
+        executor_type="thread",
     ):
         super().__init__()
         self.data_context = data_context
         self.name = name
 
+        if max_workers is None or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        if executor_type not in ["thread", "process"]:
+            raise ValueError(
+                'executor_type must be either "thread" or "process"; got {}'.format(
+                    executor_type
+                )
+            )
+        self.max_workers = max_workers
+        self.executor_type = executor_type
+
         result_format = parse_result_format(result_format)
         assert result_format["result_format"] in [
             "BOOLEAN_ONLY",
@@ -246,6 +282,13 @@ The ``run`` method returns a ValidationOperatorResult object:
                     "result_format": self.result_format,
                 },
             }
+            if self.max_workers > 1:
+                self._validation_operator_config["kwargs"].update(
+                    {
+                        "max_workers": self.max_workers,
+                        "executor_type": self.executor_type,
+                    }
+                )
         return self._validation_operator_config
 
     def _build_batch_from_item(self, item):
@@ -276,6 +319,25 @@ The ``run`` method returns a ValidationOperatorResult object:
 
         return batch
 
+    def _release_batch(self, item, batch):
+        """Release the resources held by a batch built by _build_batch_from_item, once its actions have run.
+
+        Batches built from batch_kwargs belong to the operator; batches passed as data assets belong to the caller,
+        and are left as they are.
+        """
+        if batch is not item:
+            batch.release()
+
+    @contextmanager
+    def _batch_scope(self, item):
+        """Build the batch of item (see _build_batch_from_item), and release it (see _release_batch) when the with
+        block is left, even by an exception or a break."""
+        batch = self._build_batch_from_item(item)
+        try:
+            yield batch
+        finally:
+            self._release_batch(item, batch)
+
     def run(
         self,
         assets_to_validate,
@@ -309,9 +371,13 @@ The ``run`` method returns a ValidationOperatorResult object:
 
         run_results = {}
 
-        for item in assets_to_validate:
+        for item, batch, batch_validation_result in self._validate_batches(
+            assets_to_validate,
+            run_id=run_id,
+            result_format=result_format if result_format else self.result_format,
+            evaluation_parameters=evaluation_parameters,
+        ):
             run_result_obj = {}
-            batch = self._build_batch_from_item(item)
             expectation_suite_identifier = ExpectationSuiteIdentifier(
                 expectation_suite_name=batch._expectation_suite.expectation_suite_name
             )
@@ -320,19 +386,17 @@ The ``run`` method returns a ValidationOperatorResult object:
                 expectation_suite_identifier=expectation_suite_identifier,
                 run_id=run_id,
             )
-            batch_validation_result = batch.validate(
-                run_id=run_id,
-                result_format=result_format if result_format else self.result_format,
-                evaluation_parameters=evaluation_parameters,
-            )
             run_result_obj["validation_result"] = batch_validation_result
-            batch_actions_results = self._run_actions(
-                batch,
-                expectation_suite_identifier,
-                batch._expectation_suite,
-                batch_validation_result,
-                run_id,
-            )
+            try:
+                batch_actions_results = self._run_actions(
+                    batch,
+                    expectation_suite_identifier,
+                    batch._expectation_suite,
+                    batch_validation_result,
+                    run_id,
+                )
+            finally:
+                self._release_batch(item, batch)
 
             run_result_obj["actions_results"] = batch_actions_results
             run_results[validation_result_id] = run_result_obj
@@ -344,6 +408,101 @@ The ``run`` method returns a ValidationOperatorResult object:
             evaluation_parameters=evaluation_parameters,
         )
 
+    def _validate_batches(
+        self, assets_to_validate, run_id, result_format, evaluation_parameters
+    ):
+        """
+        Builds and validates the batches in assets_to_validate.
+
+        Yields (item, batch, validation_result) triples in the order of assets_to_validate, so that the caller can
+        run actions on each batch as soon as it (and every batch before it) has been validated. With max_workers > 1,
+        up to max_workers batches are built and validated at the same time on the configured executor; batches are
+        always built in the calling thread, once a worker is available for them.
+
+        If the validation of a batch raises, the exception is re-raised when that batch is reached, after the
+        batches before it have been yielded.
+        """
+        if self.max_workers == 1:
+            for item in assets_to_validate:
+                batch = self._build_batch_from_item(item)
+                yield item, batch, batch.validate(
+                    run_id=run_id,
+                    result_format=result_format,
+                    evaluation_parameters=evaluation_parameters,
+                )
+            return
+
+        if self.executor_type == "process":
+            executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        # Batches are built lazily: at most max_workers of them are loaded (and being validated) at a time
+        pending_batches = deque()
+        with executor:
+            try:
+                for item in assets_to_validate:
+                    pending_batches.append(
+                        self._submit_batch(
+                            executor,
+                            item,
+                            run_id,
+                            result_format,
+                            evaluation_parameters,
+                        )
+                    )
+                    if len(pending_batches) >= self.max_workers:
+                        yield self._get_pending_batch_result(pending_batches)
+
+                while pending_batches:
+                    yield self._get_pending_batch_result(pending_batches)
+            finally:
+                for item, batch, future, data_context in pending_batches:
+                    future.cancel()
+                    if self.executor_type == "process":
+                        batch._data_context = data_context
+
+    def _submit_batch(
+        self, executor, item, run_id, result_format, evaluation_parameters
+    ):
+        """Build the batch of item and submit its validation to executor.
+
+        Returns:
+            the (item, batch, future, data_context) of the batch, where data_context is the data context of the batch,
+            which is detached from the batch while it is validated in a worker process
+        """
+        batch = self._build_batch_from_item(item)
+        data_context = batch._data_context
+        if self.executor_type == "process":
+            # The data context is not sent to the worker process: evaluation parameters are resolved here,
+            # with the same priority as DataAsset.validate would give them.
+            batch_evaluation_parameters = {}
+            if data_context is not None:
+                batch_evaluation_parameters.update(
+                    data_context.evaluation_parameter_store.get_bind_params(run_id)
+                )
+            batch_evaluation_parameters.update(
+                batch._expectation_suite.evaluation_parameters or {}
+            )
+            batch_evaluation_parameters.update(evaluation_parameters or {})
+            batch._data_context = None
+            evaluation_parameters = batch_evaluation_parameters
+        future = executor.submit(
+            _validate_batch, batch, run_id, result_format, evaluation_parameters,
+        )
+        return item, batch, future, data_context
+
+    def _get_pending_batch_result(self, pending_batches):
+        """Wait for the validation of the first pending batch, and return its (item, batch, validation_result)."""
+        item, batch, future, data_context = pending_batches[0]
+        try:
+            batch_validation_result = future.result()
+        finally:
+            pending_batches.popleft()
+            if self.executor_type == "process":
+                batch._data_context = data_context
+        return item, batch, batch_validation_result
+
     def _run_actions(
         self,
         batch,
@@ -731,107 +890,117 @@ The value of "success" is True if no critical expectation suites ("failure") fai
         run_results = {}
 
         for item in assets_to_validate:
-            batch = self._build_batch_from_item(item)
+            with self._batch_scope(item) as batch:
+                batch_id = batch.batch_id
+                run_id = run_id
 
-            batch_id = batch.batch_id
-            run_id = run_id
+                assert not batch_id is None
+                assert not run_id is None
 
-            assert not batch_id is None
-            assert not run_id is None
+                failure_expectation_suite_identifier = ExpectationSuiteIdentifier(
+                    expectation_suite_name=base_expectation_suite_name
+                    + self.expectation_suite_name_suffixes[0]
+                )
 
-            failure_expectation_suite_identifier = ExpectationSuiteIdentifier(
-                expectation_suite_name=base_expectation_suite_name
-                + self.expectation_suite_name_suffixes[0]
-            )
+                failure_validation_result_id = ValidationResultIdentifier(
+                    expectation_suite_identifier=failure_expectation_suite_identifier,
+                    run_id=run_id,
+                    batch_identifier=batch_id,
+                )
 
-            failure_validation_result_id = ValidationResultIdentifier(
-                expectation_suite_identifier=failure_expectation_suite_identifier,
-                run_id=run_id,
-                batch_identifier=batch_id,
-            )
+                failure_expectation_suite = None
+                try:
+                    failure_expectation_suite = self.data_context.stores[
+                        self.data_context.expectations_store_name
+                    ].get(failure_expectation_suite_identifier)
+
+                # NOTE : Abe 2019/09/17 : I'm concerned that this may be too permissive, since
+                # it will catch any error in the Store, not just KeyErrors. In the longer term, a better
+                # solution will be to have the Stores catch other known errors and raise KeyErrors,
+                # so that methods like this can catch and handle a single error type.
+                except Exception:
+                    logger.debug(
+                        "Failure expectation suite not found: {}".format(
+                            failure_expectation_suite_identifier
+                        )
+                    )
 
-            failure_expectation_suite = None
-            try:
-                failure_expectation_suite = self.data_context.stores[
-                    self.data_context.expectations_store_name
-                ].get(failure_expectation_suite_identifier)
-
-            # NOTE : Abe 2019/09/17 : I'm concerned that this may be too permissive, since
-            # it will catch any error in the Store, not just KeyErrors. In the longer term, a better
-            # solution will be to have the Stores catch other known errors and raise KeyErrors,
-            # so that methods like this can catch and handle a single error type.
-            except Exception:
-                logger.debug(
-                    "Failure expectation suite not found: {}".format(
-                        failure_expectation_suite_identifier
+                if failure_expectation_suite:
+                    failure_run_result_obj = {
+                        "expectation_suite_severity_level": "failure"
+                    }
+                    failure_validation_result = batch.validate(
+                        failure_expectation_suite,
+                        result_format=result_format
+                        if result_format
+                        else self.result_format,
+                        evaluation_parameters=evaluation_parameters,
                     )
+                    failure_run_result_obj[
+                        "validation_result"
+                    ] = failure_validation_result
+                    failure_actions_results = self._run_actions(
+                        batch,
+                        failure_expectation_suite_identifier,
+                        failure_expectation_suite,
+                        failure_validation_result,
+                        run_id,
+                    )
+                    failure_run_result_obj["actions_results"] = failure_actions_results
+                    run_results[failure_validation_result_id] = failure_run_result_obj
+
+                    if (
+                        not failure_validation_result.success
+                        and self.stop_on_first_error
+                    ):
+                        break
+
+                warning_expectation_suite_identifier = ExpectationSuiteIdentifier(
+                    expectation_suite_name=base_expectation_suite_name
+                    + self.expectation_suite_name_suffixes[1]
                 )
 
-            if failure_expectation_suite:
-                failure_run_result_obj = {"expectation_suite_severity_level": "failure"}
-                failure_validation_result = batch.validate(
-                    failure_expectation_suite,
-                    result_format=result_format
-                    if result_format
-                    else self.result_format,
-                    evaluation_parameters=evaluation_parameters,
+                warning_validation_result_id = ValidationResultIdentifier(
+                    expectation_suite_identifier=warning_expectation_suite_identifier,
+                    run_id=run_id,
+                    batch_identifier=batch.batch_id,
                 )
-                failure_run_result_obj["validation_result"] = failure_validation_result
-                failure_actions_results = self._run_actions(
-                    batch,
-                    failure_expectation_suite_identifier,
-                    failure_expectation_suite,
-                    failure_validation_result,
-                    run_id,
-                )
-                failure_run_result_obj["actions_results"] = failure_actions_results
-                run_results[failure_validation_result_id] = failure_run_result_obj
-
-                if not failure_validation_result.success and self.stop_on_first_error:
-                    break
 
-            warning_expectation_suite_identifier = ExpectationSuiteIdentifier(
-                expectation_suite_name=base_expectation_suite_name
-                + self.expectation_suite_name_suffixes[1]
-            )
-
-            warning_validation_result_id = ValidationResultIdentifier(
-                expectation_suite_identifier=warning_expectation_suite_identifier,
-                run_id=run_id,
-                batch_identifier=batch.batch_id,
-            )
-
-            warning_expectation_suite = None
-            try:
-                warning_expectation_suite = self.data_context.stores[
-                    self.data_context.expectations_store_name
-                ].get(warning_expectation_suite_identifier)
-            except Exception:
-                logger.debug(
-                    "Warning expectation suite not found: {}".format(
-                        warning_expectation_suite_identifier
+                warning_expectation_suite = None
+                try:
+                    warning_expectation_suite = self.data_context.stores[
+                        self.data_context.expectations_store_name
+                    ].get(warning_expectation_suite_identifier)
+                except Exception:
+                    logger.debug(
+                        "Warning expectation suite not found: {}".format(
+                            warning_expectation_suite_identifier
+                        )
                     )
-                )
 
-            if warning_expectation_suite:
-                warning_run_result_obj = {"expectation_suite_severity_level": "warning"}
-                warning_validation_result = batch.validate(
-                    warning_expectation_suite,
-                    result_format=result_format
-                    if result_format
-                    else self.result_format,
-                    evaluation_parameters=evaluation_parameters,
-                )
-                warning_run_result_obj["validation_result"] = warning_validation_result
-                warning_actions_results = self._run_actions(
-                    batch,
-                    warning_expectation_suite_identifier,
-                    warning_expectation_suite,
-                    warning_validation_result,
-                    run_id,
-                )
-                warning_run_result_obj["actions_results"] = warning_actions_results
-                run_results[warning_validation_result_id] = warning_run_result_obj
+                if warning_expectation_suite:
+                    warning_run_result_obj = {
+                        "expectation_suite_severity_level": "warning"
+                    }
+                    warning_validation_result = batch.validate(
+                        warning_expectation_suite,
+                        result_format=result_format
+                        if result_format
+                        else self.result_format,
+                        evaluation_parameters=evaluation_parameters,
+                    )
+                    warning_run_result_obj[
+                        "validation_result"
+                    ] = warning_validation_result
+                    warning_actions_results = self._run_actions(
+                        batch,
+                        warning_expectation_suite_identifier,
+                        warning_expectation_suite,
+                        warning_validation_result,
+                        run_id,
+                    )
+                    warning_run_result_obj["actions_results"] = warning_actions_results
+                    run_results[warning_validation_result_id] = warning_run_result_obj
 
         validation_operator_result = ValidationOperatorResult(
             run_id=run_id,
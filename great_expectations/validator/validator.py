@@ -1,6 +1,15 @@
 """This is currently helping bridge APIs"""
-from great_expectations.dataset import PandasDataset, SparkDFDataset, SqlAlchemyDataset
+from great_expectations.dataset import (
+    ChunkedPandasDataset,
+    PandasDataset,
+    SparkDFDataset,
+    SqlAlchemyDataset,
+)
+from great_expectations.dataset.chunked_pandas_dataset import (
+    ChunkedPandasBatchReference,
+)
 from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyBatchReference
+from great_expectations.dataset.util import get_expectation_columns
 from great_expectations.types import ClassConfig
 from great_expectations.util import load_class, verify_dynamic_loading_support
 
@@ -31,7 +40,9 @@ class Validator:
             except ImportError:
                 pass
         if self.expectation_engine is None:
-            if isinstance(batch.data, SqlAlchemyBatchReference):
+            if isinstance(batch.data, ChunkedPandasBatchReference):
+                self.expectation_engine = ChunkedPandasDataset
+            elif isinstance(batch.data, SqlAlchemyBatchReference):
                 self.expectation_engine = SqlAlchemyDataset
 
         if self.expectation_engine is None:
@@ -50,8 +61,40 @@ class Validator:
 
         self.init_kwargs = kwargs
 
+    @classmethod
+    def get_suite_columns(cls, expectation_suite):
+        """Return the columns referenced by the expectations of a suite, in order, or None if the suite may depend on
+        other columns (see great_expectations.dataset.util.get_expectation_columns).
+        """
+        if expectation_suite is None or not expectation_suite.expectations:
+            return None
+        return get_expectation_columns(expectation_suite.expectations)
+
     def get_dataset(self):
-        if issubclass(self.expectation_engine, PandasDataset):
+        if isinstance(self.batch.data, ChunkedPandasBatchReference):
+            # A file read in chunks is validated by ChunkedPandasDataset, which reuses the expectations of
+            # PandasDataset; subclasses of PandasDataset with their own expectations need the whole DataFrame
+            if self.expectation_engine is PandasDataset:
+                expectation_engine = ChunkedPandasDataset
+            elif issubclass(self.expectation_engine, ChunkedPandasDataset):
+                expectation_engine = self.expectation_engine
+            else:
+                raise ValueError(
+                    "A batch read in chunks requires a PandasDataset or ChunkedPandasDataset expectation_engine"
+                )
+
+            return expectation_engine(
+                self.batch.data,
+                expectation_suite=self.expectation_suite,
+                batch_kwargs=self.batch.batch_kwargs,
+                batch_parameters=self.batch.batch_parameters,
+                batch_markers=self.batch.batch_markers,
+                data_context=self.batch.data_context,
+                **self.init_kwargs,
+                **self.batch.batch_kwargs.get("dataset_options", {}),
+            )
+
+        elif issubclass(self.expectation_engine, PandasDataset):
             import pandas as pd
 
             if not isinstance(self.batch["data"], pd.DataFrame):
@@ -96,13 +139,33 @@ class Validator:
                     "SparkDFDataset expectation_engine requires a spark DataFrame for its batch"
                 )
 
+            spark_df = self.batch.data
+            init_kwargs = dict(self.init_kwargs)
+            if self.batch.batch_kwargs.get("project_suite_columns"):
+                suite_columns = self.get_suite_columns(self.expectation_suite)
+                if suite_columns is not None:
+                    # nested fields (e.g. "address.street") are read with their top-level column
+                    spark_df = spark_df.select(
+                        *[
+                            "`{}`".format(column.replace("`", "``"))
+                            for column in spark_df.columns
+                            if any(
+                                suite_column == column
+                                or suite_column.startswith(column + ".")
+                                for suite_column in suite_columns
+                            )
+                        ]
+                    )
+                    # the dataset rejects validating other columns, e.g. with another suite
+                    init_kwargs["suite_columns_only"] = True
+
             return self.expectation_engine(
-                spark_df=self.batch.data,
+                spark_df=spark_df,
                 expectation_suite=self.expectation_suite,
                 batch_kwargs=self.batch.batch_kwargs,
                 batch_parameters=self.batch.batch_parameters,
                 batch_markers=self.batch.batch_markers,
                 data_context=self.batch.data_context,
-                **self.init_kwargs,
+                **init_kwargs,
                 **self.batch.batch_kwargs.get("dataset_options", {}),
             )
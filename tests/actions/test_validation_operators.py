@@ -1,11 +1,13 @@
 # TODO: ADD TESTS ONCE GET_BATCH IS INTEGRATED!
 
 import pandas as pd
+import pytest
 from freezegun import freeze_time
 
 import great_expectations as ge
 from great_expectations.data_context import BaseDataContext
 from great_expectations.validation_operators.validation_operators import (
+    ActionListValidationOperator,
     WarningAndFailureExpectationSuitesValidationOperator,
 )
 
@@ -180,3 +182,114 @@ def test_errors_warnings_validation_operator_run_slack_query(
     print(json.dumps(slack_query, indent=2))
     print(json.dumps(expected_slack_query, indent=2))
     assert slack_query == expected_slack_query
+
+
+@pytest.mark.parametrize("executor_type", ["thread", "process"])
+def test_action_list_validation_operator_validates_batches_concurrently(executor_type,):
+    batches = []
+    for idx, values in enumerate([[1, 2, 3], [1, 2, 99], [4, 5, 6], [7, 8, 100]]):
+        batch = ge.dataset.PandasDataset(
+            {"x": values}, batch_kwargs={"ge_batch_id": "batch_{}".format(idx)}
+        )
+        batch.expect_column_values_to_be_between(column="x", min_value=1, max_value=9)
+        batches.append(batch)
+
+    sequential_result = ActionListValidationOperator(
+        data_context=None, action_list=[], name="test"
+    ).run(assets_to_validate=batches, run_id="test_100")
+
+    operator = ActionListValidationOperator(
+        data_context=None,
+        action_list=[],
+        name="test",
+        max_workers=3,
+        executor_type=executor_type,
+    )
+    concurrent_result = operator.run(assets_to_validate=batches, run_id="test_100")
+
+    assert [key.batch_identifier for key in concurrent_result.run_results] == [
+        key.batch_identifier for key in sequential_result.run_results
+    ]
+    assert [
+        run_result["validation_result"].success
+        for run_result in concurrent_result.run_results.values()
+    ] == [True, False, True, False]
+    assert operator.validation_operator_config["kwargs"]["max_workers"] == 3
+    assert (
+        operator.validation_operator_config["kwargs"]["executor_type"] == executor_type
+    )
+
+
+def test_action_list_validation_operator_builds_batches_lazily():
+    batches = []
+    for idx in range(5):
+        batch = ge.dataset.PandasDataset(
+            {"x": [idx]}, batch_kwargs={"ge_batch_id": "batch_{}".format(idx)}
+        )
+        batch.expect_column_values_to_be_between(column="x", min_value=0, max_value=9)
+        batches.append(batch)
+
+    operator = ActionListValidationOperator(
+        data_context=None, action_list=[], name="test", max_workers=2
+    )
+    built = []
+    build_batch_from_item = operator._build_batch_from_item
+
+    def recording_build_batch_from_item(item):
+        built.append(item)
+        return build_batch_from_item(item)
+
+    operator._build_batch_from_item = recording_build_batch_from_item
+    validated = []
+    for _, batch, _ in operator._validate_batches(
+        batches, run_id=None, result_format=None, evaluation_parameters=None
+    ):
+        validated.append(batch)
+        # no more than max_workers batches are loaded ahead of the actions
+        assert len(built) <= len(validated) + 1
+
+    assert validated == batches
+
+
+def test_action_list_validation_operator_only_releases_the_batches_it_builds():
+    operator = ActionListValidationOperator(
+        data_context=None, action_list=[], name="test"
+    )
+    released = []
+    batch = ge.dataset.PandasDataset({"x": [1]})
+    batch.release = lambda: released.append(batch)
+
+    # a batch passed as a data asset belongs to the caller
+    operator._release_batch(batch, batch)
+    assert released == []
+
+    operator._release_batch(({"ge_batch_id": "batch"}, "suite"), batch)
+    assert released == [batch]
+
+
+def test_batch_scope_releases_the_batch_it_builds_when_the_block_raises():
+    operator = ActionListValidationOperator(
+        data_context=None, action_list=[], name="test"
+    )
+    released = []
+    batch = ge.dataset.PandasDataset({"x": [1]})
+    batch.release = lambda: released.append(batch)
+    item = ({"ge_batch_id": "batch"}, "suite")
+    operator._build_batch_from_item = lambda item: batch
+
+    with pytest.raises(ValueError):
+        with operator._batch_scope(item) as scoped_batch:
+            assert scoped_batch is batch
+            raise ValueError()
+    assert released == [batch]
+
+
+def test_action_list_validation_operator_rejects_invalid_executor_configuration():
+    with pytest.raises(ValueError):
+        ActionListValidationOperator(
+            data_context=None, action_list=[], name="test", max_workers=0
+        )
+    with pytest.raises(ValueError):
+        ActionListValidationOperator(
+            data_context=None, action_list=[], name="test", executor_type="fiber"
+        )
@@ -126,6 +126,7 @@ great_expectations/
         config_variables.yml
         data_docs/
             local_site/
+                .ge_build_manifest.json
                 index.html
                 expectations/
                     warning.html
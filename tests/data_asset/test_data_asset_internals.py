@@ -788,3 +788,22 @@ def test_test_expectation_function():
     assert asset_2.test_expectation_function(
         expect_dataframe_to_contain_7, include_config=False
     ) == ExpectationValidationResult(success=False)
+
+
+def test_validate_finishes_validation_when_preparing_it_raises():
+    class FailingPreparationDataset(ge.dataset.PandasDataset):
+        _internal_names = ge.dataset.PandasDataset._internal_names + ["finished"]
+
+        def _prepare_validation(self, expectations, evaluation_parameters):
+            raise ValueError("preparation failed")
+
+        def _finish_validation(self):
+            self.finished = True
+
+    asset = FailingPreparationDataset({"x": [1, 2, 3]})
+    asset.finished = False
+    asset.expect_column_values_to_be_in_set("x", [1, 2, 3])
+
+    with pytest.raises(ValueError, match="preparation failed"):
+        asset.validate()
+    assert asset.finished
@@ -8,6 +8,7 @@ import json
 import numpy as np
 import pytest
 
+from great_expectations.core import ExpectationConfiguration
 from great_expectations.data_asset import DataAsset
 from great_expectations.exceptions import EvaluationParameterError
 from tests.test_utils import expectationSuiteValidationResultSchema
@@ -172,3 +173,47 @@ def test_validation_parameters_returned(single_expectation_custom_data_asset):
     assert validation_result["evaluation_parameters"] == {
         "upstream_dag_key": "upstream_dag_value"
     }
+
+
+def test_validation_does_not_copy_or_modify_suite_kwargs(
+    single_expectation_custom_data_asset,
+):
+    single_expectation_custom_data_asset.expect_nothing(
+        expectation_argument=list(range(1000))
+    )
+    suite = single_expectation_custom_data_asset.get_expectation_suite()
+    suite.append_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_nothing",
+            kwargs={
+                "expectation_argument": {
+                    "$PARAMETER": "upstream_dag_key",
+                    "$PARAMETER.upstream_dag_key": "temporary_value",
+                }
+            },
+        )
+    )
+
+    validation_result = single_expectation_custom_data_asset.validate(
+        expectation_suite=suite, result_format="BASIC"
+    )
+
+    # kwargs values are shared with the suite rather than copied for each expectation
+    assert (
+        validation_result.results[0].expectation_config.kwargs["expectation_argument"]
+        is suite.expectations[0].kwargs["expectation_argument"]
+    )
+    assert validation_result.results[0].expectation_config.kwargs["result_format"] == (
+        "BASIC"
+    )
+    assert "result_format" not in suite.expectations[0].kwargs
+
+    # runtime parameter values are used, but not removed from the suite
+    assert (
+        validation_result.results[1].result["details"]["expectation_argument"]
+        == "temporary_value"
+    )
+    assert suite.expectations[1].kwargs["expectation_argument"] == {
+        "$PARAMETER": "upstream_dag_key",
+        "$PARAMETER.upstream_dag_key": "temporary_value",
+    }
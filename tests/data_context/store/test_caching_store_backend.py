@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+import pytest
+
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+from great_expectations.data_context.store import (
+    CachingStoreBackend,
+    ExpectationsStore,
+    InMemoryStoreBackend,
+)
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+)
+
+
+def test_CachingStoreBackend():
+    backend = InMemoryStoreBackend()
+    my_store = CachingStoreBackend(backend, max_size=2)
+
+    my_store.set(("AAA",), "aaa")
+    my_store.set(("BBB",), "bbb")
+    my_store.set(("CCC",), "ccc")
+
+    with patch.object(backend, "_get", wraps=backend._get) as backend_get:
+        assert my_store.get(("AAA",)) == "aaa"
+        assert my_store.get(("AAA",)) == "aaa"
+        assert my_store.get_many([("BBB",), ("AAA",)]) == ["bbb", "aaa"]
+        assert backend_get.call_count == 2
+
+        # the least recently used entry is evicted
+        assert my_store.get(("CCC",)) == "ccc"
+        assert my_store.get(("BBB",)) == "bbb"
+        assert backend_get.call_count == 3
+        assert my_store.get(("AAA",)) == "aaa"
+        assert backend_get.call_count == 4
+
+        # entries are invalidated when their key is set or removed
+        my_store.set(("BBB",), "new_bbb")
+        assert my_store.get(("BBB",)) == "new_bbb"
+        my_store.remove_key(("BBB",))
+        assert not my_store.has_key(("BBB",))
+        with pytest.raises(KeyError):
+            my_store.get(("BBB",))
+        assert backend_get.call_count == 6
+
+    assert my_store.get_cache_statistics() == {
+        "hits": 3,
+        "misses": 6,
+        "hit_rate": pytest.approx(1 / 3),
+        "evictions": 2,
+        "size": 1,
+        "max_size": 2,
+    }
+    assert set(my_store.list_keys()) == {("AAA",), ("CCC",)}
+
+    with pytest.raises(ValueError):
+        CachingStoreBackend(backend, max_size=0)
+
+
+def test_CachingStoreBackend_ttl():
+    backend = InMemoryStoreBackend()
+    my_store = CachingStoreBackend(backend, ttl=10)
+    my_store.set(("AAA",), "aaa")
+
+    with patch(
+        "great_expectations.data_context.store.caching_store_backend.time.monotonic",
+        return_value=100,
+    ) as monotonic:
+        assert my_store.get(("AAA",)) == "aaa"
+        backend.set(("AAA",), "changed_aaa")
+        monotonic.return_value = 109
+        assert my_store.get(("AAA",)) == "aaa"
+        monotonic.return_value = 110
+        assert my_store.get(("AAA",)) == "changed_aaa"
+
+
+def test_ExpectationsStore_with_cache(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("test_ExpectationsStore_with_cache__dir"))
+    my_store = ExpectationsStore(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "expectations/",
+            "cache": {"max_size": 10, "cache_deserialized_objects": True},
+        },
+        runtime_environment={"root_directory": path},
+    )
+    assert isinstance(my_store.store_backend, CachingStoreBackend)
+    # the defaults of the store apply to the wrapped backend
+    assert my_store.store_backend.filepath_suffix == ".json"
+
+    key = ExpectationSuiteIdentifier("asset.warning")
+    suite = ExpectationSuite(
+        expectation_suite_name="asset.warning",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_to_exist", kwargs={"column": "a"}
+            )
+        ],
+    )
+    my_store.set(key, suite)
+
+    with patch.object(
+        my_store, "deserialize", wraps=my_store.deserialize
+    ) as deserialize:
+        first_suite = my_store.get(key)
+        assert first_suite == suite
+        # callers get copies of the cached object
+        first_suite.expectations = []
+        assert my_store.get(key) == suite
+        assert deserialize.call_count == 1
+
+        suite.meta["notes"] = "changed"
+        my_store.set(key, suite)
+        assert my_store.get(key) == suite
+        assert deserialize.call_count == 2
+
+    assert my_store.store_backend.get_cache_statistics()["hits"] == 1
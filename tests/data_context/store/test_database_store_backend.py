@@ -1,4 +1,5 @@
 import logging
+import os
 
 import pytest
 
@@ -70,3 +71,57 @@ def test_database_store_backend_duplicate_key_violation(caplog, sa, test_backend
         store_backend.set(key, "world", allow_update=False)
 
     assert "Integrity error" in str(exc.value)
+
+
+def test_database_store_backend_set_many(caplog, sa, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("test_database_store_backend_set_many__dir"))
+    store_backend = DatabaseStoreBackend(
+        credentials={
+            "drivername": "sqlite",
+            "database": os.path.join(path, "store.db"),
+        },
+        table_name="test_database_store_backend_set_many",
+        key_columns=["k1", "k2"],
+    )
+    store_backend.upsert_batch_size = 2
+    store_backend.set(("a", "1"), "old_a1")
+    store_backend.set(("a", "2"), "a2")
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa.event.listen(store_backend.engine, "before_cursor_execute", count_statement)
+    store_backend.set_many(
+        [
+            (("a", "1"), "a1"),
+            (("b", "1"), "b1"),
+            (("b", "2"), "old_b2"),
+            (("b", "2"), "b2"),
+        ]
+    )
+    sa.event.remove(store_backend.engine, "before_cursor_execute", count_statement)
+
+    # existing keys are updated in place, by one statement per batch of rows
+    assert len(statements) == 2
+    assert all(statement.startswith("INSERT OR REPLACE") for statement in statements)
+    assert sorted(store_backend.list_items()) == [
+        (("a", "1"), "a1"),
+        (("a", "2"), "a2"),
+        (("b", "1"), "b1"),
+        (("b", "2"), "b2"),
+    ]
+
+    # updating a key does not change the other keys sharing its first column
+    store_backend.set(("a", "2"), "new_a2")
+    assert store_backend.get(("a", "1")) == "a1"
+    assert store_backend.get(("a", "2")) == "new_a2"
+
+    caplog.set_level(logging.INFO, "great_expectations")
+    store_backend.set_many([(("a", "1"), "a1"), (("c", "1"), "c1")], allow_update=False)
+    assert store_backend.get(("c", "1")) == "c1"
+    assert "already exists with the same value" in caplog.messages[0]
+    with pytest.raises(StoreBackendError):
+        store_backend.set_many([(("a", "1"), "changed_a1")], allow_update=False)
+    assert store_backend.get(("a", "1")) == "a1"
@@ -1,4 +1,5 @@
 import datetime
+import os
 
 import pytest
 from freezegun import freeze_time
@@ -202,3 +203,61 @@ def test_database_evaluation_parameter_store_get_bind_params(param_store):
         "urn:great_expectations:validations:asset2.warning:"
         "expect_column_values_to_match_regex.result.unexpected_percent:column=mycol": 12.3456789,
     }
+
+
+def test_evaluation_parameter_store_get_bind_params_reads_a_run_in_one_query(
+    sa, tmp_path_factory
+):
+    path = str(tmp_path_factory.mktemp("test_get_bind_params_one_query__dir"))
+    param_store = instantiate_class_from_config(
+        config={
+            "class_name": "EvaluationParameterStore",
+            "store_backend": {
+                "class_name": "DatabaseStoreBackend",
+                "credentials": {
+                    "drivername": "sqlite",
+                    "database": os.path.join(path, "evaluation_parameters.db"),
+                },
+            },
+        },
+        config_defaults={"module_name": "great_expectations.data_context.store"},
+        runtime_environment={},
+    )
+    run_id = RunIdentifier(run_name="my_run", run_time="20191125T000000.000000Z")
+    other_run_id = RunIdentifier(run_name="my_other_run")
+    for metric_run_id, metric_kwargs_id, metric_value in [
+        (run_id, "column=a", 1),
+        (run_id, "column=b", 2.5),
+        (run_id, None, "three"),
+        (other_run_id, "column=a", 4),
+    ]:
+        param_store.set(
+            ValidationMetricIdentifier(
+                run_id=metric_run_id,
+                data_asset_name=None,
+                expectation_suite_identifier="asset.warning",
+                metric_name="expect_column_values_to_be_unique.result.unexpected_count",
+                metric_kwargs_id=metric_kwargs_id,
+            ),
+            metric_value,
+        )
+
+    queries = []
+
+    def count_query(conn, cursor, statement, *args):
+        queries.append(statement)
+
+    engine = param_store.store_backend.engine
+    sa.event.listen(engine, "before_cursor_execute", count_query)
+    params = param_store.get_bind_params(run_id)
+    sa.event.remove(engine, "before_cursor_execute", count_query)
+
+    assert len(queries) == 1
+    assert params == {
+        "urn:great_expectations:validations:asset.warning:"
+        "expect_column_values_to_be_unique.result.unexpected_count:column=a": 1,
+        "urn:great_expectations:validations:asset.warning:"
+        "expect_column_values_to_be_unique.result.unexpected_count:column=b": 2.5,
+        "urn:great_expectations:validations:asset.warning:"
+        "expect_column_values_to_be_unique.result.unexpected_count": "three",
+    }
@@ -503,6 +503,81 @@ def test_TupleS3StoreBackend_with_empty_prefixes():
     )
 
 
+@mock_s3
+def test_TupleS3StoreBackend_get_many_set_many_and_paginated_list_keys():
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}", bucket=bucket, prefix=prefix, max_workers=4
+    )
+
+    # list_objects_v2 returns at most 1000 objects per call
+    key_value_pairs = [((f"{i:04d}",), f"value_{i}") for i in range(1010)]
+    with patch("boto3.client", wraps=boto3.client) as mock_client:
+        set_results = my_store.set_many(key_value_pairs)
+        assert my_store.get_many([key for key, _ in key_value_pairs]) == [
+            value for _, value in key_value_pairs
+        ]
+        assert set(my_store.list_keys()) == {key for key, _ in key_value_pairs}
+        # a single client is shared by all calls
+        assert mock_client.call_count == 1
+
+    assert set_results[:2] == [
+        "this_is_a_test_prefix/my_file_0000",
+        "this_is_a_test_prefix/my_file_0001",
+    ]
+    assert my_store.get(("0042",)) == "value_42"
+
+    with pytest.raises(InvalidKeyError):
+        my_store.get_many([("0001",), ("missing",)])
+
+
+@mock_s3
+def test_TupleS3StoreBackend_list_keys_with_a_key_prefix():
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        bucket=bucket, prefix=prefix, filepath_suffix=".json"
+    )
+    keys = [
+        ("run", "1", "a"),
+        ("run", "1", "b"),
+        ("run", "10", "a"),
+        ("other", "1", "a"),
+    ]
+    my_store.set_many([(key, "value") for key in keys])
+
+    paginator = my_store._get_s3_client().get_paginator("list_objects_v2")
+    with patch.object(
+        my_store._get_s3_client(), "get_paginator", return_value=paginator
+    ), patch.object(paginator, "paginate", wraps=paginator.paginate) as paginate:
+        assert set(my_store.list_keys(("run", "1"))) == set(keys[:2])
+        # only the objects under the path of the key prefix are listed
+        paginate.assert_called_once_with(
+            Bucket=bucket, Prefix="this_is_a_test_prefix/run/1"
+        )
+
+    assert set(my_store.list_keys(("run",))) == set(keys[:3])
+    assert set(my_store.list_keys()) == set(keys)
+
+    # the filepaths of a filepath_template do not start with the key prefix, so every object is listed
+    my_store_with_filepath_template = TupleS3StoreBackend(
+        filepath_template="my_file_{0}_{1}_{2}", bucket=bucket, prefix="other_prefix"
+    )
+    my_store_with_filepath_template.set_many([(key, "value") for key in keys])
+    assert set(my_store_with_filepath_template.list_keys(("run", "1"))) == set(keys[:2])
+
+
 def test_TupleGCSStoreBackend_base_public_path():
     """
     What does this test and why?
@@ -566,9 +641,16 @@ def test_TupleGCSStoreBackend():
     project = "dummy-project"
     base_public_path = "http://www.test.com/"
 
-    my_store = TupleGCSStoreBackend(
-        filepath_template="my_file_{0}", bucket=bucket, prefix=prefix, project=project
-    )
+    def build_my_store():
+        # the backend keeps the client it creates, so that each mocked client needs a new backend
+        return TupleGCSStoreBackend(
+            filepath_template="my_file_{0}",
+            bucket=bucket,
+            prefix=prefix,
+            project=project,
+        )
+
+    my_store = build_my_store()
 
     my_store_with_no_filepath_template = TupleGCSStoreBackend(
         filepath_template=None, bucket=bucket, prefix=prefix, project=project
@@ -613,6 +695,7 @@ def test_TupleGCSStoreBackend():
             b"aaa", content_type="image/png"
         )
 
+    my_store = build_my_store()
     with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
 
         mock_client = mock_gcs_client.return_value
@@ -630,6 +713,7 @@ def test_TupleGCSStoreBackend():
         mock_blob.download_as_string.assert_called_once()
         mock_str.decode.assert_called_once_with("utf-8")
 
+    my_store = build_my_store()
     with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
 
         mock_client = mock_gcs_client.return_value
@@ -649,6 +733,19 @@ def test_TupleGCSStoreBackend():
         except NotFound:
             pass
 
+    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
+        mock_client = mock_gcs_client.return_value
+
+        TupleGCSStoreBackend(
+            filepath_template=None, bucket=bucket, prefix=prefix, project=project
+        ).list_keys(("my_suite_name", "my_run_id"))
+
+        # only the blobs under the path of the key prefix are listed
+        mock_client.list_blobs.assert_called_once_with(
+            "leakybucket", prefix="this_is_a_test_prefix/my_suite_name/my_run_id"
+        )
+
+    my_store = build_my_store()
     with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
         mock_gcs_client.side_effect = InvalidKeyError("Hi I am an InvalidKeyError")
         with pytest.raises(InvalidKeyError):
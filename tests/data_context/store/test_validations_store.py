@@ -5,12 +5,18 @@ import pytest
 from freezegun import freeze_time
 from moto import mock_s3
 
-from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.core import (
+    ExpectationConfiguration,
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+    RunIdentifier,
+)
 from great_expectations.data_context.store import ValidationsStore
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
+from great_expectations.exceptions import InvalidConfigError
 from great_expectations.util import gen_directory_tree_str
 
 
@@ -196,6 +202,153 @@ test_ValidationResultStore_with_TupleFileSystemStoreBackend__dir0/
     )
 
 
+def test_ValidationsStore_catalog(tmp_path_factory, monkeypatch):
+    path = str(tmp_path_factory.mktemp("test_ValidationsStore_catalog__dir"))
+    store_config = {
+        "store_backend": {
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "my_store/",
+        },
+        "runtime_environment": {"root_directory": path},
+        "catalog_filepath": "catalog/validations.sqlite",
+    }
+    my_store = ValidationsStore(**store_config)
+
+    keys = [
+        ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(suite_name),
+            run_id=RunIdentifier(run_name=run_name, run_time=run_time),
+            batch_identifier="batch_id",
+        )
+        for suite_name, run_name, run_time in [
+            ("asset.default", "prod", "20200101T000000.000000Z"),
+            ("asset.default", "prod", "20200103T000000.000000Z"),
+            ("asset.warning", "dev", "20200102T000000.000000Z"),
+            ("asset.warning", "prod", "20200104T000000.000000Z"),
+        ]
+    ]
+    for key in keys:
+        my_store.set(key, ExpectationSuiteValidationResult(success=True))
+
+    assert my_store.list_latest_keys() == [keys[3], keys[1], keys[2], keys[0]]
+    assert my_store.list_latest_keys(limit=2) == [keys[3], keys[1]]
+    assert my_store.list_latest_keys(expectation_suite_name="asset.default") == [
+        keys[1],
+        keys[0],
+    ]
+    assert my_store.list_latest_keys(run_name="dev") == [keys[2]]
+    assert my_store.list_latest_keys(run_id=keys[0].run_id) == [keys[0]]
+    assert my_store.list_latest_keys(batch_identifier="other_batch_id") == []
+
+    # the catalog is persisted: another store does not need to list the keys of the store backend
+    other_store = ValidationsStore(**store_config)
+    monkeypatch.setattr(
+        other_store.store_backend, "list_keys", lambda *args, **kwargs: 1 / 0
+    )
+    assert other_store.list_latest_keys(limit=1) == [keys[3]]
+    other_store.remove_key(keys[3])
+    monkeypatch.undo()
+    assert my_store.list_latest_keys(limit=1) == [keys[1]]
+    assert set(my_store.list_keys()) == set(keys[:3])
+
+    # results removed by other means are dropped from the catalog when it is refreshed
+    my_store.store_backend.remove_key(keys[1].to_tuple())
+    my_store.refresh_catalog()
+    assert my_store.list_latest_keys() == [keys[2], keys[0]]
+
+    # reconciling an up-to-date catalog writes nothing
+    connection = my_store.catalog._connection
+    total_changes = connection.total_changes
+    my_store.refresh_catalog()
+    assert connection.total_changes == total_changes
+
+
+@mock_s3
+@pytest.mark.parametrize(
+    "backend", ["TupleFilesystemStoreBackend", "TupleS3StoreBackend"]
+)
+def test_ValidationsStore_with_compression(backend, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("test_ValidationsStore_with_compression__dir"))
+    if backend == "TupleS3StoreBackend":
+        conn = boto3.resource("s3", region_name="us-east-1")
+        conn.create_bucket(Bucket="test_validation_store_bucket")
+        store_backend = {
+            "class_name": backend,
+            "bucket": "test_validation_store_bucket",
+            "prefix": "test/prefix",
+        }
+    else:
+        store_backend = {"class_name": backend, "base_directory": "my_store/"}
+
+    def build_my_store(compression=None):
+        return ValidationsStore(
+            store_backend=dict(store_backend),
+            runtime_environment={"root_directory": path},
+            compression=compression,
+        )
+
+    result = ExpectationSuiteValidationResult(
+        success=False,
+        results=[
+            ExpectationValidationResult(
+                success=False,
+                expectation_config=ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_be_in_set",
+                    kwargs={"column": "a", "value_set": ["value_0"]},
+                ),
+                exception_info={
+                    "raised_exception": False,
+                    "exception_message": None,
+                    "exception_traceback": None,
+                },
+                result={
+                    "partial_unexpected_counts": [
+                        {"value": "value_{}".format(i), "count": 1} for i in range(1000)
+                    ]
+                },
+            )
+        ],
+    )
+    keys = [
+        ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier("asset.default"),
+            run_id=RunIdentifier(run_name=run_name),
+            batch_identifier="batch_id",
+        )
+        for run_name in ["uncompressed", "compressed"]
+    ]
+
+    uncompressed_store = build_my_store()
+    uncompressed_store.set(keys[0], result)
+
+    my_store = build_my_store(compression="gzip")
+    my_store.set(keys[1], result)
+    uncompressed_value = my_store.store_backend.get(keys[0].to_tuple())
+    compressed_value = my_store.store_backend.get(keys[1].to_tuple())
+    assert isinstance(uncompressed_value, str)
+    assert isinstance(compressed_value, bytes)
+    assert len(compressed_value) < len(uncompressed_value) / 10
+
+    # both formats are read by either store
+    assert set(my_store.list_keys()) == set(keys)
+    for store in [my_store, uncompressed_store]:
+        assert store.get(keys[0]) == result
+        assert store.get(keys[1]) == result
+
+
+def test_ValidationsStore_with_compression_errors():
+    with pytest.raises(InvalidConfigError):
+        ValidationsStore(compression="lzma")
+    with pytest.raises(InvalidConfigError):
+        ValidationsStore(
+            store_backend={
+                "class_name": "DatabaseStoreBackend",
+                "credentials": {"drivername": "sqlite"},
+            },
+            compression="gzip",
+        )
+
+
 def test_ValidationsStore_with_DatabaseStoreBackend(sa):
     # Use sqlite so we don't require postgres for this test.
     connection_kwargs = {"drivername": "sqlite"}
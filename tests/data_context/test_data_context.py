@@ -497,6 +497,7 @@ project_path/
         == """\
 data_docs/
     local_site/
+        .ge_build_manifest.json
         index.html
         expectations/
             random/
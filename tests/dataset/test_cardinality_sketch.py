@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from great_expectations.dataset import PandasDataset
+from great_expectations.dataset.cardinality_sketch import HyperLogLog
+
+
+@pytest.mark.parametrize("cardinality", [1, 10, 1000, 100000])
+def test_hyperloglog_estimates_are_within_a_few_standard_errors(cardinality):
+    values = np.random.RandomState(0).permutation(np.arange(cardinality).repeat(3))
+    sketch = HyperLogLog.from_relative_error(0.01).update(values)
+
+    assert sketch.precision == 14
+    assert sketch.relative_error <= 0.01
+    assert sketch.get_cardinality() == pytest.approx(cardinality, rel=0.03)
+
+
+def test_merged_hyperloglogs_summarize_all_partitions():
+    values = np.array(["value_{}".format(i % 20000) for i in range(60000)])
+    sketch = HyperLogLog(precision=12)
+    for partition in np.array_split(values, 7):
+        sketch.merge(HyperLogLog(precision=12).update(partition))
+
+    assert sketch.get_cardinality() == pytest.approx(
+        HyperLogLog(precision=12).update(values).get_cardinality()
+    )
+    assert sketch.get_cardinality() == pytest.approx(20000, rel=0.05)
+
+    with pytest.raises(ValueError):
+        sketch.merge(HyperLogLog(precision=10))
+
+
+def test_hyperloglog_edge_cases():
+    assert HyperLogLog().get_cardinality() == 0
+    assert HyperLogLog().update([]).get_cardinality() == 0
+    # integers are counted as the floats they would become in a column with nulls
+    sketch = HyperLogLog().update(np.array([1, 2, 3]))
+    assert sketch.merge(
+        HyperLogLog().update(np.array([1.0, 2.0, 4.0]))
+    ).get_cardinality() == pytest.approx(4, abs=0.01)
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=2)
+
+
+def test_unique_value_expectations_with_allow_relative_error():
+    dataset = PandasDataset({"a": [i % 5000 for i in range(20000)] + [None] * 100})
+
+    exact = dataset.expect_column_unique_value_count_to_be_between(
+        "a", 4900, 5100, result_format="SUMMARY"
+    )
+    assert exact.result["observed_value"] == 5000
+    assert "details" not in exact.result
+
+    approximate = dataset.expect_column_unique_value_count_to_be_between(
+        "a", 4900, 5100, allow_relative_error=True, result_format="SUMMARY"
+    )
+    assert approximate.success
+    assert approximate.result["observed_value"] == pytest.approx(5000, rel=0.03)
+    # the achieved error of the sketch, at most the requested 1%
+    assert approximate.result["details"] == {
+        "relative_error": HyperLogLog.from_relative_error(0.01).relative_error
+    }
+    assert approximate.result["details"]["relative_error"] < 0.01
+
+    proportion = dataset.expect_column_proportion_of_unique_values_to_be_between(
+        "a", 0.2, 0.3, allow_relative_error=0.05
+    )
+    assert proportion.success
+    assert proportion.result["observed_value"] == pytest.approx(0.25, rel=0.15)
+    assert proportion.expectation_config.kwargs["allow_relative_error"] == 0.05
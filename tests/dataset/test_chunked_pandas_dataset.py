@@ -0,0 +1,208 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.dataset import ChunkedPandasDataset, PandasDataset
+from great_expectations.dataset.chunked_pandas_dataset import (
+    ChunkedPandasBatchReference,
+)
+
+
+@pytest.fixture(scope="module")
+def chunked_file_df():
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame(
+        {
+            "num": rng.randint(0, 50, 500).astype(float),
+            "str": rng.choice(["a", "b", "cc", None], 500),
+            "normal": rng.normal(size=500),
+        }
+    )
+    df.loc[::17, "num"] = np.nan
+    return df
+
+
+@pytest.fixture(scope="module")
+def chunked_file_paths(chunked_file_df, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("chunked_file_paths"))
+    csv_path = os.path.join(path, "data.csv")
+    parquet_path = os.path.join(path, "data.parquet")
+    chunked_file_df.to_csv(csv_path, index=False)
+    chunked_file_df.to_parquet(parquet_path, index=False)
+    return {"read_csv": csv_path, "read_parquet": parquet_path}
+
+
+def build_suite(dataset):
+    dataset.expect_column_values_to_be_between("num", 0, 40)
+    dataset.expect_column_values_to_be_in_set(
+        "str", ["a", "b"], result_format="COMPLETE"
+    )
+    dataset.expect_column_values_to_not_be_null("num")
+    dataset.expect_column_value_lengths_to_equal("str", 1, mostly=0.5)
+    dataset.expect_column_values_to_be_between(
+        "num", 5, 10, row_condition='str=="a"', condition_parser="pandas"
+    )
+    dataset.expect_table_row_count_to_equal(500)
+    dataset.expect_column_max_to_be_between("num", 0, 100)
+    dataset.expect_column_sum_to_be_between("num", 0, 1e6)
+    dataset.expect_column_median_to_be_between("num", 0, 100)
+    dataset.expect_column_quantile_values_to_be_between(
+        "num", {"quantiles": [0, 0.3, 0.5, 1], "value_ranges": [[None, None]] * 4},
+    )
+    dataset.expect_column_distinct_values_to_be_in_set("str", ["a", "b", "cc"])
+    dataset.expect_column_unique_value_count_to_be_between("num", 1, 100)
+    dataset.expect_column_most_common_value_to_be_in_set("str", ["a"])
+    dataset.expect_column_mean_to_be_between("normal", -1, 1)
+    dataset.expect_column_stdev_to_be_between("normal", 0, 2)
+    return dataset.get_expectation_suite(discard_failed_expectations=False)
+
+
+@pytest.mark.parametrize("reader_method", ["read_csv", "read_parquet"])
+def test_chunked_validation_matches_in_memory_validation(
+    chunked_file_df, chunked_file_paths, reader_method
+):
+    suite = build_suite(PandasDataset(chunked_file_df.copy()))
+    expected = PandasDataset(chunked_file_df, expectation_suite=suite).validate(
+        result_format="SUMMARY"
+    )
+
+    batch_reference = ChunkedPandasBatchReference(
+        getattr(pd, reader_method), chunked_file_paths[reader_method], chunksize=37
+    )
+    dataset = ChunkedPandasDataset(batch_reference, expectation_suite=suite)
+    result = dataset.validate(result_format="SUMMARY")
+
+    assert result.success == expected.success
+    for expected_result, chunked_result in zip(expected.results, result.results):
+        assert chunked_result.expectation_config == expected_result.expectation_config
+        assert chunked_result.success == expected_result.success
+        assert chunked_result.exception_info == expected_result.exception_info
+        if expected_result.expectation_config.expectation_type in [
+            "expect_column_mean_to_be_between",
+            "expect_column_stdev_to_be_between",
+        ]:
+            # chunks are summed in a different order
+            assert chunked_result.result["observed_value"] == pytest.approx(
+                expected_result.result["observed_value"]
+            )
+        else:
+            assert (
+                chunked_result.to_json_dict()["result"]
+                == expected_result.to_json_dict()["result"]
+            )
+
+
+def test_chunked_validation_reads_the_file_once(
+    chunked_file_df, chunked_file_paths, monkeypatch
+):
+    suite = build_suite(PandasDataset(chunked_file_df.copy()))
+    batch_reference = ChunkedPandasBatchReference(
+        pd.read_csv, chunked_file_paths["read_csv"], chunksize=100
+    )
+    passes = []
+    iter_chunks = batch_reference.iter_chunks
+
+    def counting_iter_chunks(columns=None):
+        passes.append(columns)
+        return iter_chunks(columns=columns)
+
+    monkeypatch.setattr(batch_reference, "iter_chunks", counting_iter_chunks)
+    dataset = ChunkedPandasDataset(batch_reference, expectation_suite=suite)
+    dataset.validate()
+
+    # the only pass that is not planned is the one filtering rows with a row_condition
+    assert passes == [["num", "str", "normal"], None]
+
+
+def test_chunked_dataset_interactive_expectations(chunked_file_df, chunked_file_paths):
+    batch_reference = ChunkedPandasBatchReference(
+        pd.read_csv, chunked_file_paths["read_csv"], chunksize=64
+    )
+    dataset = ChunkedPandasDataset(batch_reference)
+
+    assert dataset.get_table_columns() == ["num", "str", "normal"]
+    assert dataset.get_row_count() == 500
+    assert dataset.head(3).shape == (3, 3)
+    assert build_suite(dataset) == build_suite(PandasDataset(chunked_file_df.copy()))
+
+    # approximate quantiles merge a sketch of each chunk rather than counting every value
+    assert dataset.get_column_quantiles(
+        "num", (0.0, 0.5, 1.0), allow_relative_error=0.05
+    ) == pytest.approx(
+        chunked_file_df["num"].quantile([0.0, 0.5, 1.0], interpolation="nearest"),
+        abs=5,
+    )
+
+    # the outcome for a row depends on the other rows, which are in other chunks
+    with pytest.raises(NotImplementedError):
+        dataset.expect_column_values_to_be_unique("num")
+
+
+def test_chunked_batch_reference_rejects_unsupported_readers(chunked_file_paths):
+    with pytest.raises(ValueError):
+        ChunkedPandasBatchReference(
+            pd.read_json, chunked_file_paths["read_csv"], chunksize=10
+        )
+    with pytest.raises(ValueError):
+        ChunkedPandasBatchReference(
+            pd.read_csv, chunked_file_paths["read_csv"], chunksize=0
+        )
+
+
+def test_chunked_profile_metrics_are_computed_in_one_pass(
+    chunked_file_df, chunked_file_paths, monkeypatch
+):
+    batch_reference = ChunkedPandasBatchReference(
+        pd.read_csv, chunked_file_paths["read_csv"], chunksize=100
+    )
+    passes = []
+    iter_chunks = batch_reference.iter_chunks
+
+    def counting_iter_chunks(columns=None):
+        passes.append(columns)
+        return iter_chunks(columns=columns)
+
+    monkeypatch.setattr(batch_reference, "iter_chunks", counting_iter_chunks)
+    dataset = ChunkedPandasDataset(batch_reference)
+    dataset.cache_column_profile_metrics(["num", "str"])
+    assert passes == [["num", "str"]]
+
+    expected = PandasDataset(chunked_file_df.copy())
+    for column in ["num", "str"]:
+        assert dataset.get_column_unique_count(
+            column
+        ) == expected.get_column_unique_count(column)
+        assert dataset.get_column_nonnull_count(
+            column
+        ) == expected.get_column_nonnull_count(column)
+    assert dataset.get_column_mean("num") == pytest.approx(
+        expected.get_column_mean("num")
+    )
+    assert passes == [["num", "str"]]
+
+
+def test_chunked_column_summary_only_sums_planned_numeric_columns():
+    from unittest import mock
+
+    from great_expectations.dataset.chunked_pandas_dataset import (
+        _ColumnSummaryAccumulator,
+    )
+
+    chunk = pd.DataFrame({"num": [1.0, 2.0, None], "str": ["a", "b", None]})
+    with mock.patch.object(pd.Series, "sum", autospec=True) as series_sum:
+        accumulator = _ColumnSummaryAccumulator("str", compute_sum=True)
+        accumulator.update(chunk)
+        assert accumulator.get_column_sum() is None
+        accumulator = _ColumnSummaryAccumulator("num", summarize=False)
+        accumulator.update(chunk)
+        assert accumulator.nonnull_count == 2
+        assert accumulator.get_column_sum() is None
+        assert series_sum.call_count == 0
+
+    accumulator = _ColumnSummaryAccumulator("num", compute_sum=True)
+    accumulator.update(chunk)
+    accumulator.update(chunk)
+    assert accumulator.get_column_sum() == 6.0
+    assert accumulator.get_column_summary()["column_mean"] == 1.5
@@ -3,6 +3,7 @@ from collections import OrderedDict
 import pytest
 
 from great_expectations.dataset import PandasDataset
+from great_expectations.dataset.metrics import MetricCache
 from tests.test_utils import get_dataset
 
 data = OrderedDict([["a", [2.0, 5.0]], ["b", [5, 5]], ["c", [0, 10]], ["d", [0, None]]])
@@ -18,15 +19,36 @@ def test_caching(test_backend):
     dataset.get_column_max("a")
     dataset.get_column_max("a")
     dataset.get_column_max("b")
-    assert dataset.get_column_max.cache_info().hits == 1
-    assert dataset.get_column_max.cache_info().misses == 2
-    assert dataset.get_column_max.cache_info().misses == 2
+    assert dataset.get_metric_cache_statistics()["hits"] == 1
+    assert dataset.get_metric_cache_statistics()["misses"] == 2
+    dataset.get_column_count()
+    dataset.get_column_count()
+    assert dataset.get_column_count.cache_info().hits == 1
+    assert dataset.get_column_count.cache_info().misses == 1
 
     dataset = get_dataset(
         test_backend, data, schemas=schemas.get(test_backend), caching=False
     )
     with pytest.raises(AttributeError):
-        dataset.get_column_max.cache_info()
+        dataset.get_column_count.cache_info()
+
+
+def test_column_summary_bundle_is_computed_once(test_backend):
+    dataset = get_dataset(
+        test_backend, data, schemas=schemas.get(test_backend), caching=True
+    )
+    column_summary = dataset.get_column_summary("d")
+    assert column_summary["column_nonnull_count"] == 1
+    assert column_summary["column_min"] == 0
+    assert column_summary["column_max"] == 0
+
+    assert dataset.get_column_max("c") == 10
+    assert dataset.get_column_min("c") == 0
+    assert dataset.get_column_nonnull_count("c") == 2
+    assert dataset.get_column_mean("c") == 5
+    statistics = dataset.get_metric_cache_statistics()
+    assert statistics["misses"] == 1
+    assert statistics["hits"] == 3
 
 
 def test_head(test_backend):
@@ -61,3 +83,23 @@ def test_head(test_backend):
     assert isinstance(head, PandasDataset)
     assert len(head) == 0
     assert list(head.columns) == ["a"]
+
+
+def test_metric_cache_evicts_least_recently_used():
+    cache = MetricCache(max_size=2)
+    cache.set(("column_min", "a"), 0)
+    cache.set(("column_max", "a"), None)
+    assert cache.get(("column_min", "a")) == 0
+    cache.set(("column_mean", "a"), 1.5)
+
+    assert ("column_max", "a") not in cache
+    assert cache.get(("column_min", "a")) == 0
+    with pytest.raises(KeyError):
+        cache.get(("column_max", "a"))
+    assert cache.statistics == {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 1,
+        "size": 2,
+        "max_size": 2,
+    }
@@ -1,5 +1,7 @@
 import datetime
 import json
+import re
+from unittest import mock
 
 import pandas as pd
 import pytest
@@ -901,3 +903,189 @@ def test_expect_values_quantiles_to_be_between():
             "A", {"quantiles": quantiles, "value_ranges": value_ranges,}
         )
         assert validation.success is success
+
+
+def test_column_map_expectation_partial_unexpected_results_match_complete():
+    df = ge.dataset.PandasDataset(
+        {"a": ["b", "c", "b", "d", "a", "e", "c", "x", "f", None, "g", "a"]}
+    )
+
+    complete = df.expect_column_values_to_be_in_set(
+        "a", ["a"], result_format="COMPLETE"
+    ).result
+    summary = df.expect_column_values_to_be_in_set(
+        "a",
+        ["a"],
+        result_format={"result_format": "SUMMARY", "partial_unexpected_count": 3},
+    ).result
+    basic = df.expect_column_values_to_be_in_set(
+        "a",
+        ["a"],
+        result_format={"result_format": "BASIC", "partial_unexpected_count": 3},
+    ).result
+
+    assert complete["unexpected_count"] == summary["unexpected_count"] == 9
+    assert summary["partial_unexpected_list"] == ["b", "c", "b"]
+    assert summary["partial_unexpected_index_list"] == [0, 1, 2]
+    # Ties are resolved like collections.Counter: "d" appears before "e", "x", "f" and "g"
+    assert summary["partial_unexpected_counts"] == [
+        {"value": "b", "count": 2},
+        {"value": "c", "count": 2},
+        {"value": "d", "count": 1},
+    ]
+    assert basic["partial_unexpected_list"] == ["b", "c", "b"]
+    assert basic["unexpected_percent"] == complete["unexpected_percent"]
+    assert complete["unexpected_list"] == ["b", "c", "b", "d", "e", "c", "x", "f", "g"]
+
+
+@pytest.mark.parametrize(
+    "values,min_value,max_value,kwargs",
+    [
+        ([1, 2, 3, 4, 5, None], 2, 4, {}),
+        ([1.5, 2.0, 3.0, 4.0, 4.5, None], 2, 4, {"strict_min": True}),
+        ([1, 2, 3, 4, 5], None, 4, {"strict_max": True}),
+        ([True, False, True], 0.5, None, {}),
+        (["a", "b", "bb", "c", None], "b", "c", {"strict_max": True}),
+        (["a", "b", "c"], 1, 2, {"allow_cross_type_comparisons": True}),
+        (["a", 1, 2.5, "c"], 1, 3, {"allow_cross_type_comparisons": True}),
+        (
+            ["2020-01-01", "2020-02-01", "2020-03-01"],
+            "2020-01-15",
+            "2020-03-01",
+            {"parse_strings_as_datetimes": True},
+        ),
+    ],
+)
+def test_expect_column_values_to_be_between_matches_elementwise_comparisons(
+    values, min_value, max_value, kwargs, monkeypatch
+):
+    df = ge.dataset.PandasDataset({"a": values})
+    result = df.expect_column_values_to_be_between(
+        "a", min_value, max_value, result_format="COMPLETE", **kwargs
+    )
+
+    # force the comparison of each value in turn
+    monkeypatch.setattr(
+        ge.dataset.PandasDataset,
+        "_compare_column_to_bounds",
+        staticmethod(lambda *args: None),
+    )
+    expected = df.expect_column_values_to_be_between(
+        "a", min_value, max_value, result_format="COMPLETE", **kwargs
+    )
+    assert result.to_json_dict() == expected.to_json_dict()
+
+
+def test_expect_column_values_to_be_between_compares_typed_columns_at_once(
+    monkeypatch,
+):
+    df = ge.dataset.PandasDataset(
+        {
+            "num": [1, 2, 3],
+            "str": ["a", "b", "c"],
+            "date": pd.to_datetime(["2020-01-01", "2020-02-01", "2020-03-01"]),
+            "mixed": ["a", 1, "c"],
+        }
+    )
+    column_map = pd.Series.map
+    maps = []
+
+    def counting_map(self, arg, *args, **kwargs):
+        maps.append(self.name)
+        return column_map(self, arg, *args, **kwargs)
+
+    monkeypatch.setattr(pd.Series, "map", counting_map)
+    assert df.expect_column_values_to_be_between("num", 2, 3).success is False
+    assert df.expect_column_values_to_be_between("str", "a", "c").success
+    assert maps == []
+    # bounds parsed with parse_strings_as_datetimes are compared to datetime columns at once
+    assert ge.dataset.PandasDataset._compare_column_to_bounds(
+        df["date"],
+        datetime.datetime(2020, 1, 15),
+        datetime.datetime(2020, 3, 1),
+        False,
+        True,
+    ).tolist() == [False, True, False]
+
+    # columns of mixed types are compared one value at a time
+    assert not df.expect_column_values_to_be_between(
+        "mixed", "a", "b", allow_cross_type_comparisons=True
+    ).success
+    assert maps == ["mixed"]
+    monkeypatch.undo()
+
+    with pytest.raises(TypeError):
+        df.expect_column_values_to_be_between("num", "a", "c", catch_exceptions=False)
+
+
+@pytest.mark.parametrize(
+    "regex_list",
+    [
+        ["^a", "c$", r"\d+"],
+        [r"(a)\1", "b"],
+        ["(?i)A", "x"],
+        ["(?P<letter>a)b", "(?P<letter>c)d"],
+    ],
+)
+@pytest.mark.parametrize("match_on", ["any", "all"])
+def test_expect_column_values_to_match_regex_list_searches_all_regexes_at_once(
+    regex_list, match_on, monkeypatch
+):
+    df = ge.dataset.PandasDataset(
+        {"a": ["aab", "abc", "cd", "X1", "aA", 12, "bc", None, "Ab"]}
+    )
+    expected = [
+        [re.search(regex, str(value)) is not None for regex in regex_list]
+        for value in df["a"].dropna()
+    ]
+    expected_match = [
+        any(matches) if match_on == "any" else all(matches) for matches in expected
+    ]
+
+    astype = pd.Series.astype
+    conversions = []
+
+    def counting_astype(self, *args, **kwargs):
+        conversions.append(args)
+        return astype(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.Series, "astype", counting_astype)
+    match = df.expect_column_values_to_match_regex_list(
+        "a", regex_list, match_on=match_on, result_format="COMPLETE"
+    )
+    assert conversions.count((str,)) == 1
+    monkeypatch.undo()
+
+    assert match.result["unexpected_list"] == [
+        value
+        for value, value_matches in zip(df["a"].dropna(), expected_match)
+        if not value_matches
+    ]
+    if match_on == "any":
+        not_match = df.expect_column_values_to_not_match_regex_list(
+            "a", regex_list, result_format="COMPLETE"
+        )
+        assert not_match.result["unexpected_list"] == [
+            value
+            for value, value_matches in zip(df["a"].dropna(), expected_match)
+            if value_matches
+        ]
+
+
+@pytest.mark.parametrize(
+    "regex_list,match_on,passes",
+    [
+        (["^a", "c$", r"\d+"], "any", 1),
+        ([r"(a)\1", "b", "c"], "any", 2),
+        (["^a", "c$", r"\d+"], "all", 3),
+    ],
+)
+def test_expect_column_values_to_match_regex_list_searches_each_pattern_in_one_pass(
+    regex_list, match_on, passes
+):
+    df = ge.dataset.PandasDataset({"a": ["aab", "abc", "cd", "X1", 12, None]})
+    with mock.patch.object(
+        pd.Series.str, "contains", autospec=True, side_effect=pd.Series.str.contains,
+    ) as contains:
+        df.expect_column_values_to_match_regex_list("a", regex_list, match_on=match_on)
+    assert contains.call_count == passes
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.dataset import PandasDataset
+from great_expectations.dataset.quantile_sketch import (
+    DEFAULT_RELATIVE_ERROR,
+    KLLSketch,
+    get_relative_error,
+)
+
+QUANTILES = [0.0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0]
+
+
+def get_rank_errors(values, sketch_quantiles):
+    """Return the distance between the ranks of the sketch quantiles and the exact ranks, as a fraction of n."""
+    sorted_values = np.sort(values)
+    ranks = np.searchsorted(sorted_values, sketch_quantiles)
+    exact_ranks = np.round(np.asarray(QUANTILES) * (len(values) - 1))
+    return np.abs(ranks - exact_ranks) / len(values)
+
+
+@pytest.mark.parametrize("relative_error", [0.01, 0.05])
+def test_sketch_quantiles_are_within_relative_error(relative_error):
+    values = np.random.RandomState(0).lognormal(size=100000)
+    sketch = KLLSketch.from_relative_error(relative_error, seed=0).update(values)
+
+    assert sketch.count == 100000
+    assert len(sketch) < 10 / relative_error
+    quantiles = sketch.get_quantiles(QUANTILES)
+    assert quantiles[0] == values.min()
+    assert quantiles[-1] == values.max()
+    assert get_rank_errors(values, quantiles).max() <= relative_error
+
+
+def test_merged_sketches_summarize_all_partitions():
+    values = np.random.RandomState(1).normal(size=50000)
+    sketch = KLLSketch.from_relative_error(0.01, seed=0)
+    for seed, partition in enumerate(np.array_split(values, 9)):
+        sketch.merge(KLLSketch.from_relative_error(0.01, seed=seed).update(partition))
+
+    assert sketch.count == 50000
+    assert get_rank_errors(values, sketch.get_quantiles(QUANTILES)).max() <= 0.01
+    assert sketch.get_median() == pytest.approx(np.median(values), abs=0.05)
+
+
+def test_small_and_empty_sketches():
+    assert KLLSketch().get_quantiles([0.5]) == [None]
+    assert KLLSketch().get_median() is None
+
+    # below the capacity of the sketch, quantiles are exact
+    values = [5, 1, 4, 2, 3, 6]
+    sketch = KLLSketch().update(values)
+    assert (
+        sketch.get_quantiles([0, 0.5, 1])
+        == pd.Series(values).quantile([0, 0.5, 1], interpolation="nearest").tolist()
+    )
+    assert sketch.get_median() == 3.5
+    assert sketch.merge(KLLSketch().update([7])).get_median() == 4
+
+
+def test_get_relative_error():
+    assert get_relative_error(False) is None
+    assert get_relative_error(0.0) is None
+    assert get_relative_error(True) == DEFAULT_RELATIVE_ERROR
+    assert get_relative_error(0.1) == 0.1
+    with pytest.raises(ValueError):
+        get_relative_error(1.5)
+    with pytest.raises(ValueError):
+        get_relative_error("0.1")
+
+
+def test_pandas_dataset_approximate_quantiles():
+    values = np.random.RandomState(2).uniform(size=20000)
+    dataset = PandasDataset({"a": values})
+
+    quantiles = dataset.get_column_quantiles(
+        "a", tuple(QUANTILES), allow_relative_error=0.01
+    )
+    assert get_rank_errors(values, quantiles).max() <= 0.01
+    assert dataset.get_column_median("a", allow_relative_error=True) == pytest.approx(
+        dataset.get_column_median("a"), abs=0.02
+    )
+    assert dataset.expect_column_quantile_values_to_be_between(
+        "a",
+        {"quantiles": [0.5], "value_ranges": [[0.45, 0.55]]},
+        allow_relative_error=0.01,
+    ).success
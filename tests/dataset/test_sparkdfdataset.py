@@ -26,6 +26,53 @@ def test_sparkdfdataset_persist(spark_session):
     sdf.persist.assert_called_once()
 
 
+@pytest.mark.skipif(
+    importlib.util.find_spec("pyspark") is None, reason="requires the Spark library"
+)
+def test_sparkdfdataset_persistence_lifecycle(spark_session):
+    from pyspark import StorageLevel
+
+    sdf = spark_session.createDataFrame(pd.DataFrame({"a": [1, 2, 3]}))
+    with SparkDFDataset(sdf, storage_level="MEMORY_AND_DISK_SER") as dataset:
+        assert dataset.storage_level == StorageLevel.MEMORY_AND_DISK
+        assert sdf.is_cached
+        dataset.expect_column_values_to_be_in_set("a", [1, 2])
+        dataset.persist()
+        dataset.unpersist()
+        assert sdf.is_cached
+        result = dataset.validate()
+        assert sdf.is_cached
+    assert not sdf.is_cached
+    assert not dataset.is_persisted
+    assert result.meta["spark_cache"]["storage_level"] == str(
+        StorageLevel.MEMORY_AND_DISK
+    )
+
+    # validate persists a released dataset while it runs
+    with mock.patch.object(
+        type(sdf), "unpersist", autospec=True, side_effect=type(sdf).unpersist
+    ) as unpersist:
+        dataset.validate()
+        assert unpersist.call_count == 1
+    assert not sdf.is_cached
+
+    # a DataFrame persisted by the caller is left persisted
+    sdf.persist(StorageLevel.DISK_ONLY)
+    with SparkDFDataset(sdf, storage_level="DISK_ONLY"):
+        pass
+    assert sdf.is_cached
+    sdf.unpersist()
+
+    # release gives up the reference the dataset holds from its creation
+    dataset = SparkDFDataset(sdf)
+    assert sdf.is_cached
+    dataset.release()
+    assert not sdf.is_cached
+
+    with pytest.raises(ValueError):
+        SparkDFDataset(sdf, storage_level="NOWHERE")
+
+
 @pytest.mark.skipif(
     importlib.util.find_spec("pyspark") is None, reason="requires the Spark library"
 )
@@ -328,6 +375,92 @@ def test_expect_column_values_to_be_unique(spark_session, test_dataframe):
         test_dataframe.expect_column_values_to_be_unique("non.nested")
 
 
+@pytest.mark.skipif(
+    importlib.util.find_spec("pyspark") is None, reason="requires the Spark library"
+)
+def test_column_map_expectation_counts_in_a_single_job(spark_session):
+    from pyspark.sql import DataFrame
+
+    sdf = spark_session.createDataFrame([(1,), (2,), (None,), (5,)], ["a"])
+    dataset = SparkDFDataset(sdf)
+    columns = dataset.spark_df.columns
+    assert dataset.get_row_count() == 4
+
+    with mock.patch.object(
+        DataFrame, "collect", autospec=True, side_effect=DataFrame.collect
+    ) as collect, mock.patch.object(
+        DataFrame, "count", autospec=True, side_effect=DataFrame.count
+    ) as count:
+        result = dataset.expect_column_values_to_be_in_set(
+            "a", [1, 2], result_format="BOOLEAN_ONLY"
+        )
+        assert not result.success
+        # the unexpected values are not collected when the result does not include them
+        assert collect.call_count == 1
+
+        result = dataset.expect_column_values_to_be_in_set(
+            "a", [1, 2], result_format="SUMMARY"
+        )
+        assert collect.call_count == 3
+        assert count.call_count == 0
+
+    assert result.result["element_count"] == 4
+    assert result.result["missing_count"] == 1
+    assert result.result["unexpected_count"] == 1
+    assert result.result["partial_unexpected_list"] == [5]
+    assert dataset.get_column_nonnull_count("a") == 3
+    assert dataset.spark_df.columns == columns
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("pyspark") is None, reason="requires the Spark library"
+)
+def test_validate_computes_aggregate_metrics_in_a_single_job(spark_session):
+    from pyspark.sql import DataFrame
+
+    sdf = spark_session.createDataFrame(
+        [(1, 2.0, "a"), (2, None, "b"), (None, 4.5, "c")], ["a", "b", "c"]
+    )
+    dataset = SparkDFDataset(sdf)
+    dataset.expect_column_min_to_be_between("a", 0, 1)
+    dataset.expect_column_max_to_be_between("b", 0, 5)
+    dataset.expect_column_mean_to_be_between("b", 3, 4)
+    dataset.expect_column_stdev_to_be_between("b", 0, 10)
+    dataset.expect_column_sum_to_be_between("a", 3, 3)
+    suite = dataset.get_expectation_suite()
+
+    dataset = SparkDFDataset(sdf, expectation_suite=suite)
+    with mock.patch.object(
+        DataFrame, "collect", autospec=True, side_effect=DataFrame.collect
+    ) as collect, mock.patch.object(
+        DataFrame, "count", autospec=True, side_effect=DataFrame.count
+    ) as count:
+        result = dataset.validate()
+        assert collect.call_count == 1
+        assert count.call_count == 0
+
+    assert result.success
+    # results are grouped by column
+    assert {
+        expectation_result.expectation_config.expectation_type: expectation_result.result[
+            "observed_value"
+        ]
+        for expectation_result in result.results
+    } == {
+        "expect_column_min_to_be_between": 1,
+        "expect_column_max_to_be_between": 4.5,
+        "expect_column_mean_to_be_between": pytest.approx(3.25),
+        "expect_column_stdev_to_be_between": pytest.approx(1.7677669),
+        "expect_column_sum_to_be_between": 3,
+    }
+    assert result.results[0].result["element_count"] == 3
+    assert result.results[0].result["missing_count"] == 1
+    # only the metrics the expectations read were computed
+    assert ("column_max", "a") not in dataset._metric_cache
+    assert ("column_mean", "a") not in dataset._metric_cache
+    assert ("column_min", "b") not in dataset._metric_cache
+
+
 @pytest.mark.skipif(
     importlib.util.find_spec("pyspark") is None, reason="requires the Spark library"
 )
@@ -424,3 +557,46 @@ def test_expect_column_values_to_be_json_parseable(spark_session):
         out = D.expect_column_values_to_be_json_parseable(**t["in"])
         assert t["out"]["success"] == out.success
         assert t["out"]["unexpected_list"] == out.result["unexpected_list"]
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("pyspark") is None, reason="requires the Spark library"
+)
+def test_uniqueness_expectations_count_duplicate_values(spark_session):
+    from pyspark.sql import DataFrame
+
+    sdf = spark_session.createDataFrame(
+        [(1, "x"), (1, "x"), (2, "x"), (None, "y"), (3, "y"), (3, "z"), (3, "y")],
+        ["a", "b"],
+    )
+    dataset = SparkDFDataset(sdf)
+
+    with mock.patch.object(
+        DataFrame, "collect", autospec=True, side_effect=DataFrame.collect
+    ) as collect:
+        result = dataset.expect_column_values_to_be_unique(
+            "a", result_format="BOOLEAN_ONLY"
+        )
+        assert not result.success
+        # the duplicate values are not collected when the result does not include them
+        assert collect.call_count == 1
+
+    result = dataset.expect_column_values_to_be_unique("a", result_format="COMPLETE")
+    assert result.result["unexpected_count"] == 5
+    assert result.result["missing_count"] == 1
+    assert sorted(result.result["unexpected_list"]) == [1, 1, 3, 3, 3]
+
+    result = dataset.expect_column_values_to_be_unique(
+        "a", result_format={"result_format": "BASIC", "partial_unexpected_count": 3}
+    )
+    assert len(result.result["partial_unexpected_list"]) == 3
+
+    result = dataset.expect_compound_columns_to_be_unique(
+        ["a", "b"], result_format="COMPLETE"
+    )
+    assert result.result["unexpected_count"] == 4
+    assert sorted(
+        tuple(value.values()) for value in result.result["unexpected_list"]
+    ) == [(1, "x"), (1, "x"), (3, "y"), (3, "y")]
+
+    assert dataset.expect_column_values_to_be_unique("b", mostly=0.1).success
@@ -2,9 +2,13 @@ try:
     from unittest import mock
 except ImportError:
     from unittest import mock
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import pytest
 
+from great_expectations.core import ExpectationConfiguration
 from great_expectations.dataset import MetaSqlAlchemyDataset, SqlAlchemyDataset
 from great_expectations.util import is_library_loadable
 from tests.test_utils import get_dataset
@@ -341,3 +345,209 @@ def test_expect_compound_columns_to_be_unique(sa):
     assert dataset.expect_compound_columns_to_be_unique(
         ["col1", "col2", "col4"]
     ).success
+
+
+def test_validate_fuses_column_map_and_aggregate_queries(sa):
+    engine = sa.create_engine("sqlite://")
+    data = pd.DataFrame(
+        {"a": [1, 2, 3, 4, None], "b": ["cat", "dog", "fish", None, None],}
+    )
+    data.to_sql(name="test_fused", con=engine, index=False)
+
+    def build_dataset(fuse_validation_queries):
+        dataset = SqlAlchemyDataset(
+            "test_fused",
+            engine=engine,
+            fuse_validation_queries=fuse_validation_queries,
+        )
+        dataset.expect_column_values_to_be_in_set("a", [1, 2])
+        dataset.expect_column_values_to_be_between("a", 0, 10)
+        dataset.expect_column_values_to_not_be_null("b", mostly=0.5)
+        dataset.expect_column_value_lengths_to_be_between("b", 3, 3)
+        dataset.expect_column_min_to_be_between("a", 0, 1)
+        dataset.expect_column_mean_to_be_between("a", 3, 4)
+        return dataset
+
+    unfused_results = build_dataset(False).validate(result_format="SUMMARY").results
+
+    fused_dataset = build_dataset(True)
+    with mock.patch.object(
+        SqlAlchemyDataset, "_get_count_query_generic_sqlalchemy"
+    ) as count_query:
+        fused_results = fused_dataset.validate(result_format="SUMMARY").results
+    assert count_query.call_count == 0
+    assert fused_dataset._fused_metric_cache == {}
+
+    assert [result.to_json_dict() for result in fused_results] == [
+        result.to_json_dict() for result in unfused_results
+    ]
+    assert [result.success for result in fused_results] == [
+        False,
+        True,
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert fused_results[5].result["partial_unexpected_list"] == ["fish"]
+
+
+def test_validate_does_not_plan_conditions_unsupported_by_the_dialect(sa, caplog):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"b": ["cat", "dog"]}).to_sql(
+        name="test_unsupported", con=engine, index=False
+    )
+    dataset = SqlAlchemyDataset("test_unsupported", engine=engine)
+    dataset.append_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_match_regex",
+            kwargs={"column": "b", "regex": "^[a-z]+$"},
+        )
+    )
+
+    with caplog.at_level(logging.WARNING):
+        results = dataset.validate().results
+
+    # sqlite has no regex operator: the expectation raises, and the planner does not log it a second time
+    assert results[0].exception_info["raised_exception"]
+    assert [
+        record.message
+        for record in caplog.records
+        if record.message.startswith("Regex is not supported")
+    ] == ["Regex is not supported for dialect %s" % str(dataset.sql_engine_dialect)]
+
+
+def test_validate_evaluates_expectations_concurrently(sa, tmp_path):
+    connection_string = "sqlite:///" + str(tmp_path / "concurrent.db")
+    data = pd.DataFrame(
+        {"a": [1, 2, 3, 4, None], "b": ["cat", "dog", "fish", None, None]}
+    )
+    data.to_sql(
+        name="test_concurrent", con=sa.create_engine(connection_string), index=False
+    )
+
+    def build_dataset(max_concurrent_expectations):
+        # connection_string (rather than a sqlite engine) keeps a pooled engine, whose NullPool allows concurrency
+        dataset = SqlAlchemyDataset(
+            "test_concurrent",
+            connection_string=connection_string,
+            fuse_validation_queries=False,
+            max_concurrent_expectations=max_concurrent_expectations,
+        )
+        dataset.expect_column_values_to_be_in_set("a", [1, 2])
+        dataset.expect_column_values_to_be_between("a", 0, 10)
+        dataset.expect_column_values_to_not_be_null("b", mostly=0.5)
+        dataset.expect_column_value_lengths_to_be_between("b", 3, 3)
+        dataset.expect_column_min_to_be_between("a", 0, 1)
+        dataset.expect_column_to_exist("c")
+        return dataset
+
+    sequential_dataset = build_dataset(1)
+    assert sequential_dataset._get_max_concurrent_expectations() == 1
+    sequential_results = sequential_dataset.validate(result_format="SUMMARY").results
+
+    concurrent_dataset = build_dataset(4)
+    assert concurrent_dataset._get_max_concurrent_expectations() == 4
+    with mock.patch(
+        "great_expectations.data_asset.data_asset.ThreadPoolExecutor",
+        wraps=ThreadPoolExecutor,
+    ) as executor:
+        concurrent_results = concurrent_dataset.validate(
+            result_format="SUMMARY"
+        ).results
+    executor.assert_called_once_with(max_workers=4)
+    assert not concurrent_dataset._active_validation
+
+    assert [result.to_json_dict() for result in concurrent_results] == [
+        result.to_json_dict() for result in sequential_results
+    ]
+    assert [result.success for result in concurrent_results] == [
+        False,
+        True,
+        True,
+        True,
+        False,
+        False,
+    ]
+
+    # datasets bound to a single connection are always validated sequentially
+    assert (
+        SqlAlchemyDataset(
+            "test_concurrent",
+            engine=sa.create_engine(connection_string),
+            max_concurrent_expectations=4,
+        )._get_max_concurrent_expectations()
+        == 1
+    )
+
+
+def test_approximate_quantiles_are_computed_from_a_streamed_sketch(sa):
+    engine = sa.create_engine("sqlite://")
+    df = pd.DataFrame({"a": [float(i % 100) for i in range(1000)] + [None] * 10})
+    df.to_sql("quantile_table", engine, index=False)
+    dataset = SqlAlchemyDataset("quantile_table", engine=engine)
+    dataset.quantile_sketch_fetch_size = 64
+
+    sketch = dataset.get_column_quantile_sketch("a", relative_error=0.05)
+    assert sketch.count == 1000
+    assert (sketch.min, sketch.max) == (0, 99)
+
+    # sqlite has no percentile functions, so quantiles are only available approximately
+    quantiles = dataset.get_column_quantiles(
+        "a", (0.0, 0.25, 0.5, 1.0), allow_relative_error=0.05
+    )
+    assert quantiles[0] == 0 and quantiles[-1] == 99
+    assert quantiles[1:3] == pytest.approx([24.5, 49.5], abs=5)
+    assert dataset.get_column_median("a", allow_relative_error=True) == pytest.approx(
+        dataset.get_column_median("a"), abs=5
+    )
+
+
+def test_approximate_median_is_only_streamed_when_opted_in(sa):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [float(i) for i in range(100)]}).to_sql(
+        "median_table", engine, index=False
+    )
+    dataset = SqlAlchemyDataset("median_table", engine=engine, caching=False)
+    streamed_columns = []
+    get_column_quantile_sketch = dataset.get_column_quantile_sketch
+
+    def _get_column_quantile_sketch(column, relative_error):
+        streamed_columns.append(column)
+        return get_column_quantile_sketch(column, relative_error)
+
+    dataset.get_column_quantile_sketch = _get_column_quantile_sketch
+
+    # sqlite can compute the median on the server, so the column is not streamed by default
+    assert dataset.get_column_median("a", allow_relative_error=True) == 49.5
+    assert streamed_columns == []
+
+    dataset.client_side_quantile_sketches = True
+    assert dataset.get_column_median("a", allow_relative_error=True) == pytest.approx(
+        49.5, abs=5
+    )
+    assert streamed_columns == ["a"]
+
+
+def test_approximate_unique_count_falls_back_to_exact_count(sa):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [i % 50 for i in range(500)]}).to_sql(
+        "cardinality_table", engine, index=False
+    )
+    dataset = SqlAlchemyDataset("cardinality_table", engine=engine)
+
+    # sqlite has no approximate count of distinct values
+    assert dataset._get_approximate_count_distinct("a") is None
+    assert dataset.get_column_unique_count("a", allow_relative_error=True) == 50
+    assert (
+        dataset.get_column_unique_count_relative_error("a", allow_relative_error=True)
+        is None
+    )
+    result = dataset.expect_column_unique_value_count_to_be_between(
+        "a", 50, 50, allow_relative_error=True, result_format="SUMMARY"
+    )
+    assert result.success
+    assert result.result["details"] == {"relative_error": None}
+    assert dataset.get_column_cardinality_sketch("a").get_cardinality() == (
+        pytest.approx(50, rel=0.05)
+    )
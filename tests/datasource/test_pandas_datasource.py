@@ -13,6 +13,10 @@ from great_expectations.core.batch import Batch
 from great_expectations.core.util import nested_update
 from great_expectations.data_context.types.base import DataContextConfigSchema
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.dataset import ChunkedPandasDataset
+from great_expectations.dataset.chunked_pandas_dataset import (
+    ChunkedPandasBatchReference,
+)
 from great_expectations.datasource import PandasDatasource
 from great_expectations.datasource.types.batch_kwargs import (
     BatchMarkers,
@@ -424,3 +428,38 @@ def test_pandas_datasource_processes_dataset_options(test_folder_connection_path
     validator = Validator(batch, ExpectationSuite(expectation_suite_name="foo"))
     dataset = validator.get_dataset()
     assert dataset.caching is False
+
+
+def test_read_in_chunks(test_folder_connection_path):
+    datasource = PandasDatasource("PandasCSV")
+    batch_kwargs = PathBatchKwargs(
+        {
+            "path": os.path.join(str(test_folder_connection_path), "test.csv"),
+            "reader_options": {"sep": ",", "header": 0, "index_col": 0},
+            "chunksize": 2,
+        }
+    )
+
+    batch = datasource.get_batch(batch_kwargs=batch_kwargs)
+    assert isinstance(batch.data, ChunkedPandasBatchReference)
+    assert "pandas_data_fingerprint" not in batch.batch_markers
+    assert [list(chunk["col_1"]) for chunk in batch.data.iter_chunks()] == [
+        [1, 2],
+        [3, 4],
+        [5],
+    ]
+
+    validator = Validator(batch, ExpectationSuite(expectation_suite_name="foo"))
+    dataset = validator.get_dataset()
+    assert isinstance(dataset, ChunkedPandasDataset)
+    assert dataset.get_row_count() == 5
+    assert (
+        dataset.expect_column_values_to_be_in_set("col_2", ["a", "b"]).result[
+            "unexpected_count"
+        ]
+        == 3
+    )
+
+    batch_kwargs["reader_method"] = "read_json"
+    with pytest.raises(BatchKwargsError):
+        datasource.get_batch(batch_kwargs=batch_kwargs)
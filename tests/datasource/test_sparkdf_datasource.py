@@ -5,7 +5,7 @@ import pandas as pd
 import pytest
 from ruamel.yaml import YAML
 
-from great_expectations.core import ExpectationSuite
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
 from great_expectations.core.batch import Batch
 from great_expectations.dataset import SparkDFDataset
 from great_expectations.datasource import SparkDFDatasource
@@ -211,6 +211,66 @@ def test_standalone_spark_parquet_datasource(
     assert batch.data.count() == 2
 
 
+def test_spark_datasource_applies_batch_filters(
+    test_parquet_folder_connection_path, spark_session
+):
+    datasource = SparkDFDatasource("SparkParquet")
+    path = os.path.join(test_parquet_folder_connection_path, "test.parquet")
+
+    batch = datasource.get_batch(
+        batch_kwargs={
+            "path": path,
+            "partition_filters": {"col_2": ["a", "b", "c", "d"]},
+            "predicates": ["col_1 > 1"],
+            "columns": ["col_1"],
+        }
+    )
+    assert batch.data.columns == ["col_1"]
+    assert sorted(row["col_1"] for row in batch.data.collect()) == [2, 3, 4]
+    # the filters are pushed into the Parquet scan
+    plan = batch.data._jdf.queryExecution().executedPlan().toString()
+    assert "PushedFilters" in plan
+
+    batch = datasource.get_batch(
+        batch_kwargs={"path": path, "sample": {"fraction": 1.0, "seed": 0}}
+    )
+    assert batch.data.count() == 5
+
+    with pytest.raises(BatchKwargsError):
+        datasource.get_batch(batch_kwargs={"path": path, "sample": 0.5})
+
+    suite = ExpectationSuite(expectation_suite_name="foo")
+    suite.append_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "col_2"},
+        )
+    )
+    batch = datasource.get_batch(
+        batch_kwargs={"path": path, "project_suite_columns": True}
+    )
+    dataset = Validator(batch, suite).get_dataset()
+    assert dataset.spark_df.columns == ["col_2"]
+    assert dataset.validate().success
+
+    # the projection only holds for the suite the dataset was created with
+    other_suite = ExpectationSuite(expectation_suite_name="bar")
+    other_suite.append_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "col_1"},
+        )
+    )
+    with pytest.raises(ValueError):
+        dataset.validate(expectation_suite=other_suite)
+    other_suite.expectations[0].kwargs["column"] = "col_2"
+    other_suite.expectations[0].kwargs["row_condition"] = "col_1 > 2"
+    with pytest.raises(ValueError):
+        dataset.validate(expectation_suite=other_suite)
+    del other_suite.expectations[0].kwargs["row_condition"]
+    assert dataset.validate(expectation_suite=other_suite).success
+
+
 def test_standalone_spark_csv_datasource(test_folder_connection_path, test_backends):
     if "SparkDFDataset" not in test_backends:
         pytest.skip("Spark has not been enabled, so this test must be skipped.")
@@ -390,3 +450,32 @@ def test_spark_datasource_processes_dataset_options(
     dataset = validator.get_dataset()
     assert dataset.caching is False
     assert dataset._persist is False
+
+
+def test_validator_get_suite_columns():
+    suite = ExpectationSuite(expectation_suite_name="foo")
+    assert Validator.get_suite_columns(suite) is None
+
+    for expectation_type, kwargs in [
+        ("expect_column_values_to_not_be_null", {"column": "b"}),
+        ("expect_column_pair_values_to_be_equal", {"column_A": "a", "column_B": "b"}),
+        ("expect_compound_columns_to_be_unique", {"column_list": ["c", "a"]}),
+        ("expect_table_row_count_to_equal", {"value": 3}),
+    ]:
+        suite.append_expectation(
+            ExpectationConfiguration(expectation_type=expectation_type, kwargs=kwargs)
+        )
+    assert Validator.get_suite_columns(suite) == ["b", "a", "c"]
+
+    # the columns a row_condition depends on are unknown
+    suite.expectations[0].kwargs["row_condition"] = "d > 0"
+    assert Validator.get_suite_columns(suite) is None
+    del suite.expectations[0].kwargs["row_condition"]
+
+    suite.append_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_columns_to_match_set",
+            kwargs={"column_set": ["a", "b", "c"]},
+        )
+    )
+    assert Validator.get_suite_columns(suite) is None
@@ -232,6 +232,55 @@ def test_BasicDatasetProfiler_numeric_high_cardinality(numeric_high_card_dataset
     }
 
 
+def test_BasicDatasetProfiler_computes_column_metrics_in_a_batched_query(
+    sa, monkeypatch
+):
+    import numpy as np
+    import pandas as pd
+
+    from great_expectations.dataset import SqlAlchemyDataset
+
+    engine = sa.create_engine("sqlite://")
+    rng = np.random.RandomState(0)
+    pd.DataFrame(
+        {
+            "ints": rng.randint(0, 1000, 500),
+            "floats": rng.normal(size=500),
+            "strings": rng.choice(["a", "b", "c"], 500),
+            "ids": np.arange(500),
+        }
+    ).to_sql("profiled", engine, index=False)
+
+    def profile():
+        statements = []
+
+        def count_statement(*args, **kwargs):
+            statements.append(args)
+
+        sa.event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            expectation_suite, validation_results = BasicDatasetProfiler.profile(
+                SqlAlchemyDataset("profiled", engine=engine)
+            )
+        finally:
+            sa.event.remove(engine, "before_cursor_execute", count_statement)
+        expectation_suite.meta.pop("BasicDatasetProfiler")
+        expectation_suite.meta.pop("citations")
+        return len(statements), expectation_suite, validation_results
+
+    batched_statement_count, batched_suite, batched_results = profile()
+    monkeypatch.setattr(
+        SqlAlchemyDataset, "cache_column_profile_metrics", lambda self, columns: None
+    )
+    statement_count, suite, results = profile()
+
+    assert batched_statement_count < statement_count
+    assert batched_suite == suite
+    assert [result.to_json_dict()["result"] for result in batched_results.results] == [
+        result.to_json_dict()["result"] for result in results.results
+    ]
+
+
 def test_BasicDatasetProfiler_with_context(filesystem_csv_data_context):
     context = filesystem_csv_data_context
 
@@ -1,4 +1,5 @@
 import os
+import re
 import shutil
 
 import pytest
@@ -491,6 +492,131 @@ def test_configuration_driven_site_builder_skip_and_clean_missing(
     assert validations_set == validation_html_pages
 
 
+def test_site_builder_only_renders_new_or_changed_resources(
+    site_builder_data_context_with_html_store_titanic_random, monkeypatch
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+
+    def build_site():
+        site_builder = SiteBuilder(
+            data_context=context,
+            runtime_environment={"root_directory": context.root_directory},
+            **local_site_config
+        )
+        rendered_resources = []
+        for site_section_builder in site_builder.site_section_builders.values():
+            renderer = site_section_builder.renderer_class
+
+            def counting_render(resource, render=renderer.render):
+                rendered_resources.append(resource)
+                return render(resource)
+
+            renderer.render = counting_render
+        index_renderer = site_builder.site_index_builder.renderer_class
+
+        def counting_index_render(index_links_dict, render=index_renderer.render):
+            rendered_resources.append("index_page")
+            return render(index_links_dict)
+
+        index_renderer.render = counting_index_render
+        _, index_links_dict = site_builder.build()
+        return rendered_resources, index_links_dict
+
+    rendered_resources, index_links_dict = build_site()
+    page_count = len(rendered_resources)
+    assert page_count > 1
+    assert rendered_resources[-1] == "index_page"
+
+    # nothing changed: no page is rendered, and the index page does not read the validation results again; the
+    # store backend is only listed once, to reconcile the catalog of the store
+    def get_validation_result(*args, **kwargs):
+        raise AssertionError("validation results should not be read again")
+
+    store_backend = context.stores[context.validations_store_name].store_backend
+    listings = []
+
+    def list_keys(*args, list_keys=store_backend.list_keys, **kwargs):
+        listings.append(args)
+        return list_keys(*args, **kwargs)
+
+    monkeypatch.setattr(context, "get_validation_result", get_validation_result)
+    monkeypatch.setattr(store_backend, "list_keys", list_keys)
+    rendered_resources, rebuilt_index_links_dict = build_site()
+    assert rendered_resources == []
+    assert len(listings) == 1
+    for links in ["expectations_links", "profiling_links"]:
+        assert rebuilt_index_links_dict[links] == index_links_dict[links]
+
+    # the index page is not rendered again either, unless it was removed
+    index_page_path = os.path.join(
+        context.root_directory, "uncommitted", "data_docs", "local_site", "index.html"
+    )
+    os.remove(index_page_path)
+    rendered_resources, _ = build_site()
+    assert rendered_resources == ["index_page"]
+    assert os.path.isfile(index_page_path)
+    monkeypatch.undo()
+
+    # only the page of the modified suite is rendered again: its link on the index page did not change
+    expectation_suite_name = index_links_dict["expectations_links"][0][
+        "expectation_suite_name"
+    ]
+    expectation_suite = context.get_expectation_suite(expectation_suite_name)
+    expectation_suite.meta["notes"] = "changed"
+    context.save_expectation_suite(expectation_suite)
+    rendered_resources, _ = build_site()
+    assert rendered_resources == [expectation_suite]
+
+    # pages removed from the site are rendered again
+    context.clean_data_docs()
+    rendered_resources, _ = build_site()
+    assert len(rendered_resources) == page_count
+
+
+def test_site_builder_renders_pages_in_parallel(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    site_directory = os.path.join(
+        context.root_directory, "uncommitted", "data_docs", "local_site"
+    )
+
+    def build_site(**kwargs):
+        context.clean_data_docs()
+        site_builder = SiteBuilder(
+            data_context=context,
+            runtime_environment={"root_directory": context.root_directory},
+            **local_site_config,
+            **kwargs
+        )
+        _, index_links_dict = site_builder.build()
+        pages = {}
+        for root, _, filenames in os.walk(site_directory):
+            for filename in filenames:
+                if filename.endswith(".html"):
+                    with open(os.path.join(root, filename)) as f:
+                        # pages embed the build time and random ids for collapsible blocks
+                        pages[os.path.join(root, filename)] = re.sub(
+                            r"\?d=\d{8}T\d{6}\.\d{6}Z|-[0-9a-f]{8}(-[0-9a-f]{4}){3}-[0-9a-f]{12}",
+                            "",
+                            f.read(),
+                        )
+        return pages, index_links_dict
+
+    pages, index_links_dict = build_site()
+    parallel_pages, parallel_index_links_dict = build_site(max_workers=2)
+    assert len(pages) > 1
+    assert parallel_pages == pages
+    assert parallel_index_links_dict == index_links_dict
+
+    with pytest.raises(ValueError):
+        build_site(max_workers=0)
+
+
 @pytest.mark.rendered_output
 def test_configuration_driven_site_builder_without_how_to_buttons(
     site_builder_data_context_with_html_store_titanic_random,
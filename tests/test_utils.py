@@ -675,7 +675,7 @@ def candidate_test_is_on_temporary_notimplemented_list(context, expectation_type
             # "expect_column_values_to_match_regex",
             # "expect_column_values_to_not_match_regex",
             # "expect_column_values_to_match_regex_list",
-            "expect_column_values_to_not_match_regex_list",
+            # "expect_column_values_to_not_match_regex_list",
             # "expect_column_values_to_match_strftime_format",
             "expect_column_values_to_be_dateutil_parseable",
             # "expect_column_values_to_be_json_parseable",